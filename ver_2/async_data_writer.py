@@ -0,0 +1,240 @@
+# async_data_writer.py
+
+import os
+import json
+import time
+import logging
+import threading
+from collections import deque
+from queue import Queue, Empty, Full
+
+import metrics
+from sample import Sample
+
+
+class AsyncDataWriter(threading.Thread):
+    """
+    DataStorage.save_data를 전용 스레드에서 수행하는 write-behind 단계.
+    수신 스레드는 save_data()로 큐에 넣기만 하고, 디스크 기록은 이 스레드가 담당합니다.
+
+    큐가 가득 찼을 때의 처리(policy):
+      - 'drop_oldest': 가장 오래된 항목을 버리고 새 항목을 넣음 (기본값, 수신 스레드는 절대 대기하지 않음)
+      - 'block'      : 큐에 자리가 날 때까지 대기
+      - 'spill'      : 넘치는 항목을 spill 파일에 임시 기록했다가 큐가 비면 순서대로 저장
+                       (수신 스레드는 넘친 항목을 메모리 deque에 넘기기만 하고,
+                        파일 기록과 읽기는 모두 기록 스레드가 SPILL_CHUNK건씩 나누어 수행)
+    """
+
+    POLICIES = ('drop_oldest', 'block', 'spill')
+    SPILL_CHUNK = 1000  # 기록 스레드가 한 번에 spill 파일에서 읽어 저장하는 최대 건수
+
+    def __init__(self, data_storage, maxsize=10000, policy='drop_oldest', spill_path=None, station=None):
+        super().__init__(name='AsyncDataWriter', daemon=True)
+        if policy not in self.POLICIES:
+            raise ValueError(f"알 수 없는 정책: {policy}")
+
+        self.data_storage = data_storage
+        self.policy = policy
+        self.queue = Queue(maxsize)
+        self.spill_path = spill_path or os.path.join(data_storage.base_dir, 'spill.jsonl')
+        self._stop_event = threading.Event()
+        self._spill_lock = threading.Lock()  # _spilling 전환과 _overflow 추가 (파일 I/O는 잡지 않음)
+        self._spilling = False  # spill 중에는 순서 보장을 위해 새 항목도 모두 spill 파일로 보냄
+        self._overflow = deque()  # 수신 스레드 -> 기록 스레드로 넘기는, 아직 파일에 쓰지 않은 항목
+        self._spill_writer = None  # spill 파일 핸들 (기록 스레드에서만 사용)
+        self._spill_reader = None
+        if policy == 'spill' and os.path.exists(self.spill_path):
+            # 이전 실행에서 남은 spill 파일부터 저장 (새 항목은 그 뒤로)
+            self._spilling = True
+
+        # 카운터
+        self._stats_lock = threading.Lock()
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.max_depth = 0
+        self.last_write_ms = 0.0
+        self.max_write_ms = 0.0
+        self.total_write_ms = 0.0
+        metrics.gauge('queue_depth', metrics.station_label(station, 'storage'), self.queue.qsize)
+        metrics.gauge('storage_dropped', station, lambda: self.dropped)
+        metrics.gauge('storage_spilled', station, lambda: self.spilled)
+
+    # ------------------------------------------------------------------
+    # 수신 스레드 쪽 (생산자)
+    # ------------------------------------------------------------------
+    def save_data(self, data):
+        """저장할 데이터를 큐에 넣습니다. DataStorage.save_data와 같은 인터페이스."""
+        if self.policy == 'block':
+            self.queue.put(data)
+        elif self.policy == 'spill':
+            self._put_or_spill(data)
+        else:
+            self._put_drop_oldest(data)
+
+        with self._stats_lock:
+            self.enqueued += 1
+            depth = self.queue.qsize()
+            if depth > self.max_depth:
+                self.max_depth = depth
+
+    def _put_drop_oldest(self, data):
+        while True:
+            try:
+                self.queue.put_nowait(data)
+                return
+            except Full:
+                try:
+                    self.queue.get_nowait()
+                except Empty:
+                    continue
+                with self._stats_lock:
+                    self.dropped += 1
+                    dropped = self.dropped
+                if dropped == 1 or dropped % 1000 == 0:
+                    logging.warning(f"저장 큐가 가득 차 오래된 데이터를 버렸습니다. (누적 {dropped}건)")
+
+    def _put_or_spill(self, data):
+        """큐가 가득 차면 이후 항목은 _overflow로 넘김 (디스크 기록은 기록 스레드가 담당)"""
+        with self._spill_lock:
+            if not self._spilling:
+                try:
+                    self.queue.put_nowait(data)
+                    return
+                except Full:
+                    self._spilling = True
+                    logging.warning(f"저장 큐가 가득 차 spill 파일에 기록합니다: {self.spill_path}")
+            self._overflow.append(data)
+
+    # ------------------------------------------------------------------
+    # 기록 스레드 쪽 (소비자)
+    # ------------------------------------------------------------------
+    def run(self):
+        logging.info("AsyncDataWriter 스레드가 시작되었습니다.")
+        idle_timeout = getattr(self.data_storage, 'flush_interval', 1.0)
+        while True:
+            if self._spilling:
+                self._spill_overflow()
+                # 큐에 남은 항목이 spill된 항목보다 오래되었으므로 큐를 먼저 비움
+                try:
+                    data = self.queue.get_nowait()
+                except Empty:
+                    self._drain_spill()
+                    continue
+                self._write(data)
+                continue
+
+            try:
+                data = self.queue.get(timeout=idle_timeout)
+            except Empty:
+                if self._stop_event.is_set():
+                    break
+                # 데이터가 뜸할 때도 버퍼가 오래 남지 않도록 주기적으로 기록
+                self.data_storage.flush()
+                continue
+
+            self._write(data)
+
+        self.data_storage.flush()
+        logging.info("AsyncDataWriter 스레드가 종료되었습니다.")
+
+    def _write(self, data):
+        start = time.perf_counter()
+        try:
+            self.data_storage.save_data(data)
+        except Exception as e:
+            logging.error(f"데이터 저장 중 오류 발생: {e}")
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        with self._stats_lock:
+            self.written += 1
+            self.last_write_ms = elapsed_ms
+            self.total_write_ms += elapsed_ms
+            if elapsed_ms > self.max_write_ms:
+                self.max_write_ms = elapsed_ms
+
+    def _spill_overflow(self):
+        """수신 스레드가 넘긴 항목을 spill 파일 끝에 추가"""
+        if not self._overflow:
+            return
+        items = []
+        while self._overflow:
+            data = self._overflow.popleft()
+            items.append(data.to_dict() if isinstance(data, Sample) else data)
+        try:
+            if self._spill_writer is None:
+                self._spill_writer = open(self.spill_path, mode='a', encoding='utf-8')
+            self._spill_writer.write(''.join(json.dumps(item, ensure_ascii=False) + '\n' for item in items))
+            self._spill_writer.flush()
+            with self._stats_lock:
+                self.spilled += len(items)
+        except OSError as e:
+            logging.error(f"spill 파일 기록 중 오류 발생 ({len(items)}건 유실): {e}")
+            with self._stats_lock:
+                self.dropped += len(items)
+
+    def _drain_spill(self):
+        """spill 파일에서 최대 SPILL_CHUNK건을 기록 순서대로 저장. 모두 저장했으면 spill을 끝냄"""
+        lines = []
+        try:
+            if self._spill_reader is None:
+                self._spill_reader = open(self.spill_path, mode='r', encoding='utf-8')
+            for _ in range(self.SPILL_CHUNK):
+                line = self._spill_reader.readline()
+                if not line:
+                    break
+                lines.append(line)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.error(f"spill 파일을 읽는 중 오류 발생: {e}")
+
+        for line in lines:
+            try:
+                self._write(Sample.from_dict(json.loads(line)))
+            except ValueError as e:
+                logging.error(f"spill 파일 항목을 읽을 수 없습니다: {e}")
+        if len(lines) == self.SPILL_CHUNK:
+            return
+
+        # 파일 끝까지 읽었고 그 사이 넘친 항목도 없으면 spill 종료
+        # (이후 항목은 다시 큐로, spill된 항목보다 새로운 데이터이므로 순서가 유지됨)
+        with self._spill_lock:
+            if self._overflow:
+                return
+            self._spilling = False
+        self._close_spill()
+        logging.info("spill 파일의 항목을 모두 저장했습니다.")
+
+    def _close_spill(self):
+        for f in (self._spill_writer, self._spill_reader):
+            if f is not None:
+                f.close()
+        self._spill_writer = None
+        self._spill_reader = None
+        try:
+            os.remove(self.spill_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.error(f"spill 파일을 삭제하는 중 오류 발생: {e}")
+
+    def get_stats(self):
+        """큐 깊이와 기록 지연 시간 등의 카운터"""
+        with self._stats_lock:
+            return {
+                'queue_depth': self.queue.qsize(),
+                'max_depth': self.max_depth,
+                'enqueued': self.enqueued,
+                'written': self.written,
+                'dropped': self.dropped,
+                'spilled': self.spilled,
+                'last_write_ms': self.last_write_ms,
+                'max_write_ms': self.max_write_ms,
+                'avg_write_ms': self.total_write_ms / self.written if self.written else 0.0,
+            }
+
+    def stop(self):
+        """남은 큐(및 spill 파일)를 모두 기록한 뒤 스레드를 종료"""
+        self._stop_event.set()
@@ -0,0 +1,321 @@
+# async_receiver.py
+#
+# asyncio 기반 수신 엔진 (DataReceiver 대신 선택 가능, main.py --engine asyncio).
+#
+# 스레드 하나에서 이벤트 루프 하나를 돌리고, 모든 포트의 수신 / 재연결 대기(지수 백오프) /
+# 끊김 처리를 코루틴으로 수행합니다. 파싱 → 계산 → 큐/저장은 DataReceiver와 같은 코드
+# (handle_line)를 그대로 사용합니다.
+#
+#   - POSIX: 포트의 파일 디스크립터를 loop.add_reader()로 감시하여 읽을 수 있을 때만 읽음
+#            (포트 수가 늘어도 스레드가 늘지 않음)
+#   - 그 외(Windows, loop:// 같은 URL 포트): 파일 디스크립터가 없으므로 전용 스레드 풀에서
+#            ser.read()를 기다림 (포트당 작업자 하나, 동작은 스레드 엔진과 같음)
+#
+# 디스크 기록은 이벤트 루프를 막지 않도록 지금처럼 AsyncDataWriter(기록 스레드)에 맡깁니다.
+#
+# Qt 연결: QtBridge.notify()를 on_data로 넘기면 새 데이터가 들어올 때 GUI 스레드에서
+# data_ready 신호가 (최대 min_interval_ms마다 한 번) 발생합니다. 수신기 제어(reconnect_sensor,
+# close_sensor_port, stop)는 어느 스레드에서 호출해도 loop.call_soon_threadsafe로 루프에 전달됩니다.
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+import metrics
+from data_receiver import DataReceiver
+from reconnect_supervisor import backoff_delay
+
+
+class QtBridge(QObject):
+    """수신 루프(다른 스레드) → Qt 이벤트 루프 알림"""
+
+    data_ready = pyqtSignal()  # GUI 스레드에서 발생: 데이터 큐에 새 항목이 있음
+    _notified = pyqtSignal()
+
+    def __init__(self, min_interval_ms=50, parent=None):
+        super().__init__(parent)
+        self._pending = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(min_interval_ms)
+        self._timer.timeout.connect(self._fire)
+        # 다른 스레드에서 emit하면 이 객체의 스레드(GUI)에서 실행됨 (QueuedConnection)
+        self._notified.connect(self._on_notified)
+
+    def notify(self):
+        """수신 스레드에서 호출. 아직 전달되지 않은 알림이 있으면 아무것도 하지 않음."""
+        if not self._pending:
+            self._pending = True
+            self._notified.emit()
+
+    def _on_notified(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _fire(self):
+        self._pending = False
+        self.data_ready.emit()
+
+
+class _PortState:
+    """포트 하나의 수신 상태 (이벤트 루프 스레드에서만 사용)"""
+    __slots__ = ('ser', 'fd', 'buffer', 'lost')
+
+    def __init__(self, ser, fd, lost):
+        self.ser = ser
+        self.fd = fd
+        self.buffer = b''
+        self.lost = lost  # 연결이 끊기면 완료되는 Future
+
+
+class AsyncDataReceiver(DataReceiver):
+    """DataReceiver와 같은 인터페이스(start/stop/join, reconnect_sensor 등)의 asyncio 수신기"""
+
+    READ_SIZE = 4096
+
+    def __init__(self, data_queue, port_settings, data_storage, hs_value, hr_value, temperature_source,
+                 capture_path=None, station=None, on_data=None, base_delay=1.0, max_delay=60.0):
+        super().__init__(data_queue, port_settings, data_storage, hs_value, hr_value, temperature_source,
+                         capture_path=capture_path, station=station)
+        self.on_data = on_data  # 새 데이터 알림 (QtBridge.notify 등, 루프 스레드에서 호출)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._loop = None
+        self._stopping = None  # asyncio.Event (루프 안에서 생성)
+        self._states = {}
+        self._tasks = {}
+        self._executor = None  # 파일 디스크립터가 없는 포트용
+
+    def _make_supervisor(self):
+        return None  # 재연결은 포트별 코루틴이 수행 (supervisor를 쓰는 메서드는 모두 재정의)
+
+    # ------------------------------------------------------------------
+    # 다른 스레드에서 호출
+    # ------------------------------------------------------------------
+    def run(self):
+        logging.info("AsyncDataReceiver 스레드가 시작되었습니다.")
+        try:
+            asyncio.run(self._main())
+        finally:
+            for sensor_name in list(self.serial_ports):
+                self._close_port(sensor_name)
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            if self.capture is not None:
+                self.capture.close()
+        logging.info("AsyncDataReceiver 스레드가 종료되었습니다.")
+
+    def stop(self):
+        self._stop_event.set()
+        self._call_in_loop(self._shutdown)
+
+    def reconnect_sensor(self, sensor_name):
+        """센서 재연결 요청 (포트를 닫으면 해당 포트의 코루틴이 곧바로 다시 연결)"""
+        self._call_in_loop(self._drop_port, sensor_name)
+
+    def close_sensor_port(self, sensor_name):
+        self._call_in_loop(self._drop_port, sensor_name)
+
+    def _call_in_loop(self, callback, *args):
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass  # 루프가 이미 종료됨
+
+    # ------------------------------------------------------------------
+    # 이벤트 루프 스레드
+    # ------------------------------------------------------------------
+    async def _main(self):
+        self._loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+        if self._stop_event.is_set():  # 시작 전에 stop()이 호출된 경우
+            return
+        for sensor_name in self.port_settings:
+            self._tasks[sensor_name] = asyncio.create_task(self._port_task(sensor_name))
+        await self._stopping.wait()
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    def _shutdown(self):
+        self._stopping.set()
+
+    async def _port_task(self, sensor_name):
+        """포트 하나: 연결 → 수신 → 끊기면 백오프 후 재연결"""
+        label = metrics.station_label(self.station, sensor_name)
+        failures = 0
+        down_since = None
+        while not self._stopping.is_set():
+            ser = self.serial_ports.get(sensor_name)
+            if ser is None or not ser.is_open:
+                if down_since is None:
+                    down_since = time.monotonic()
+                    logging.warning(f"{sensor_name}의 시리얼 포트가 닫혀 있습니다. 재연결 시도 중...")
+                metrics.counter('reconnect_attempts', label).inc()
+                ser = await self._reopen(sensor_name)
+                if ser is None:
+                    failures += 1
+                    metrics.counter('reconnect_failures', label).inc()
+                    delay = backoff_delay(failures, self.base_delay, self.max_delay)
+                    logging.warning(f"{sensor_name} 재연결 실패 {failures}회, {delay:.1f}초 후 다시 시도합니다.")
+                    await self._sleep(delay)
+                    continue
+                failures = 0
+                metrics.counter('reconnects', label).inc()
+                recover_ms = (time.monotonic() - down_since) * 1000.0
+                metrics.histogram('recover_ms', label).observe(recover_ms)
+                logging.info(f"{sensor_name} 재연결 완료 ({recover_ms / 1000.0:.1f}초 만에 복구)")
+                down_since = None
+
+            lost = await self._receive(sensor_name, ser)
+            self._close_port(sensor_name, ser)
+            if lost and not self._stopping.is_set():
+                logging.error(f"{sensor_name}의 시리얼 포트 연결이 끊겼습니다. 재연결 시도 중...")
+                self._count('disconnects', sensor_name).inc()
+                self.data_queue.put({'sensor': sensor_name, 'status': 'port_disconnected'})
+                self.notify_gui_sensor_disconnected(sensor_name)
+                self._notify()
+
+    async def _reopen(self, sensor_name):
+        """포트를 다시 열고 기압계면 'R' 명령 전송 (여는 동안 루프가 멈추지 않도록 스레드 풀에서)"""
+        settings = self.port_settings.get(sensor_name)
+        if not settings:
+            return None
+
+        def open_port():
+            ser = self._open_port(settings)
+            try:
+                if sensor_name == '기압계':
+                    ser.write(b'R\r\n')  # 아스키로 전송
+            except Exception:
+                ser.close()
+                raise
+            return ser
+
+        try:
+            ser = await self._loop.run_in_executor(None, open_port)
+        except Exception as e:
+            logging.error(f"{sensor_name}의 시리얼 포트를 열거나 명령어 전송 중 오류 발생: {e}")
+            return None
+        if self._stopping.is_set():
+            ser.close()
+            return None
+        with self._ports_lock:
+            self.serial_ports[sensor_name] = ser
+        logging.info(f"{sensor_name}의 시리얼 포트가 재연결되었습니다: {settings['port']}")
+        return ser
+
+    async def _receive(self, sensor_name, ser):
+        """연결이 끊기거나(True) 종료/재연결 요청(False)까지 수신"""
+        try:
+            fd = ser.fileno()
+        except Exception:
+            fd = None
+        state = _PortState(ser, fd, self._loop.create_future())
+        self._states[sensor_name] = state
+        try:
+            if fd is not None:
+                os.set_blocking(fd, False)
+                self._loop.add_reader(fd, self._on_readable, sensor_name, state)
+                try:
+                    return await state.lost
+                finally:
+                    self._loop.remove_reader(fd)
+            return await self._receive_blocking(sensor_name, state)
+        finally:
+            self._states.pop(sensor_name, None)
+
+    def _on_readable(self, sensor_name, state):
+        """add_reader 콜백: 읽을 수 있는 만큼 읽어 줄 단위로 처리"""
+        try:
+            chunk = os.read(state.fd, self.READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            logging.error(f"{sensor_name}에서 데이터 수신 중 오류 발생: {e}")
+            chunk = b''
+        if not chunk:
+            # 읽을 수 있다고 했는데 데이터가 없음 = 장치 분리 (pyserial과 같은 판단)
+            if not state.lost.done():
+                state.lost.set_result(True)
+            return
+        self._feed(sensor_name, state, chunk)
+
+    async def _receive_blocking(self, sensor_name, state):
+        """파일 디스크립터가 없는 포트: 전용 스레드 풀에서 ser.read() 대기"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=max(1, len(self.port_settings)),
+                                                thread_name_prefix='AsyncDataReceiver-read')
+        ser = state.ser
+        ser.timeout = 0.5  # 종료/재연결 요청을 확인하는 주기
+
+        def read():
+            return ser.read(max(1, ser.in_waiting))
+
+        while not state.lost.done():
+            read_future = self._loop.run_in_executor(self._executor, read)
+            done, _ = await asyncio.wait({read_future, state.lost}, return_when=asyncio.FIRST_COMPLETED)
+            if read_future not in done:
+                break  # 재연결 요청 등으로 포트를 놓음 (남은 read()는 timeout 후 끝남)
+            try:
+                chunk = read_future.result()
+            except Exception as e:
+                if self._stopping.is_set():
+                    return False
+                logging.error(f"{sensor_name}의 시리얼 포트에서 오류 발생: {e}")
+                return True
+            if chunk:
+                self._feed(sensor_name, state, chunk)
+        return state.lost.result()
+
+    def _feed(self, sensor_name, state, chunk):
+        """받은 바이트를 줄로 나누어 DataReceiver.handle_line으로 처리"""
+        *lines, buffer = (state.buffer + chunk).split(b'\n')
+        state.buffer = self._bound_pending(sensor_name, buffer)
+        if not lines:
+            return
+        for line in lines:
+            line += b'\n'
+            self._capture(sensor_name, line)
+            try:
+                self.handle_line(sensor_name, line)
+            except Exception as e:
+                logging.error(f"{sensor_name}에서 데이터 수신 중 오류 발생: {e}")
+        self._notify()
+
+    def _notify(self):
+        if self.on_data is not None:
+            try:
+                self.on_data()
+            except Exception as e:
+                logging.error(f"데이터 알림 중 오류 발생: {e}")
+
+    def _drop_port(self, sensor_name):
+        """포트를 놓고 재연결하도록 함 (루프 스레드)"""
+        state = self._states.get(sensor_name)
+        if state is not None and not state.lost.done():
+            state.lost.set_result(False)
+        else:
+            self._close_port(sensor_name)
+
+    async def _sleep(self, delay):
+        """delay초 대기 (종료 요청 시 바로 반환)"""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+
+# main.py --engine / Station.start(engine=...) 에서 사용
+ENGINES = {
+    'thread': DataReceiver,
+    'asyncio': AsyncDataReceiver,
+}
@@ -0,0 +1,63 @@
+# bench/_common.py
+# 벤치마크 스크립트 공통 도우미
+
+import os
+import sys
+import time
+
+# ver_2 모듈(flat 구조)을 import 할 수 있도록 상위 디렉토리를 경로에 추가
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+
+def percentile(values, pct):
+    """정렬된 값 목록에서 백분위수를 구합니다."""
+    if not values:
+        return float('nan')
+    index = min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))
+    return values[index]
+
+
+def summarize(values_ms):
+    """지연 시간(ms) 목록의 요약 통계"""
+    values = sorted(values_ms)
+    return {
+        'count': len(values),
+        'min_ms': values[0] if values else float('nan'),
+        'p50_ms': percentile(values, 50),
+        'p90_ms': percentile(values, 90),
+        'p99_ms': percentile(values, 99),
+        'max_ms': values[-1] if values else float('nan'),
+    }
+
+
+def print_histogram(title, values_ms, bounds_ms=(0.1, 0.5, 1, 5, 10, 50, 100, 200, 300, 500)):
+    """지연 시간(ms) 분포를 텍스트 히스토그램으로 출력합니다."""
+    counts = [0] * (len(bounds_ms) + 1)
+    for value in values_ms:
+        for i, bound in enumerate(bounds_ms):
+            if value <= bound:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+
+    total = max(1, len(values_ms))
+    print(f"\n[{title}] n={len(values_ms)}")
+    labels = [f"<= {b:g} ms" for b in bounds_ms] + [f">  {bounds_ms[-1]:g} ms"]
+    for label, count in zip(labels, counts):
+        bar = '#' * int(50 * count / total)
+        print(f"  {label:>12} | {count:6d} {bar}")
+    stats = summarize(values_ms)
+    print("  p50={p50_ms:.3f} ms  p90={p90_ms:.3f} ms  p99={p99_ms:.3f} ms  max={max_ms:.3f} ms".format(**stats))
+
+
+class Timer:
+    """with 블록의 경과 시간(초)을 측정"""
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.start
@@ -0,0 +1,61 @@
+# bench/calculator_batch.py
+# Calculator.calculate(스칼라) 대비 calculate_batch(NumPy) 처리량 비교
+#
+#   python bench/calculator_batch.py [--samples 1000000]
+
+import argparse
+
+import numpy as np
+
+import _common
+from _common import Timer
+from calculator import Calculator
+
+
+def run(samples=1000000, hs=35.5, hr=12.3, seed=0):
+    rng = np.random.default_rng(seed)
+    # 실제 기록처럼 소수점 둘째/첫째 자리 값
+    pressures = np.round(rng.uniform(950.0, 1050.0, samples), 2)
+    temperatures = np.round(rng.uniform(-20.0, 40.0, samples), 1)
+    calculator = Calculator(hs, hr)
+
+    pressure_list = pressures.tolist()
+    temperature_list = temperatures.tolist()
+    with Timer() as scalar_timer:
+        scalar = [calculator.calculate(p, t) for p, t in zip(pressure_list, temperature_list)]
+
+    with Timer() as batch_timer:
+        qnh, qfe, qff = calculator.calculate_batch(pressures, temperatures)
+
+    expected = np.array(scalar)
+    identical = (np.array_equal(expected[:, 0], qnh)
+                 and np.array_equal(expected[:, 1], qfe)
+                 and np.array_equal(expected[:, 2], qff))
+
+    return {
+        'samples': samples,
+        'scalar_s': scalar_timer.elapsed,
+        'batch_s': batch_timer.elapsed,
+        'scalar_per_s': samples / scalar_timer.elapsed,
+        'batch_per_s': samples / batch_timer.elapsed,
+        'speedup': scalar_timer.elapsed / batch_timer.elapsed,
+        'identical': identical,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Calculator 스칼라/배치 처리량 비교')
+    parser.add_argument('--samples', type=int, default=1000000)
+    args = parser.parse_args()
+
+    result = run(args.samples)
+    print(f"samples       : {result['samples']}")
+    print(f"scalar        : {result['scalar_s']:.3f} s ({result['scalar_per_s']:,.0f} /s)")
+    print(f"batch (NumPy) : {result['batch_s']:.3f} s ({result['batch_per_s']:,.0f} /s)")
+    print(f"speed-up      : x{result['speedup']:.1f}")
+    print(f"identical     : {result['identical']}")
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# bench/calculator_scalar.py
+# Calculator.calculate 한 번당 비용 측정 (고속 재생 시의 샘플당 계산 비용)
+#
+#   python bench/calculator_scalar.py [--samples 500000]
+#
+# reference: HS/HR 항을 매번 다시 계산하던 예전 calculate() 구현
+# current  : HS/HR 항을 미리 계산한 evaluator + 온도별 계수 메모 + 빠른 소수점 둘째 자리 반올림
+#            (실제 데이터에서는 직전 입력 재사용까지 더해져 더 빨라짐)
+
+import argparse
+import math
+
+import numpy as np
+
+import _common
+from _common import Timer
+from calculator import Calculator
+
+
+def reference_calculate(hs, hr, pressure, temperature):
+    """예전 Calculator.calculate (비교 및 결과 검증용)"""
+    exponent_qfe = hs / (7996 + 0.0086 * hs + 29.33 * temperature)
+    qfe = pressure * math.exp(exponent_qfe)
+    c = 0.00325
+    d = 0.19025 * (math.log(qfe / 1013.2315))
+    exponent = (0.03416 * hr * (1 - d)) / (288.2 + c * hr)
+    qnh = qfe * math.exp(exponent)
+    b = 0.0086
+    exponent = hr / (7996 + b * hr + 29.33 * temperature)
+    qff = qfe * math.exp(exponent)
+    return round(qnh, 2), round(qfe, 2), round(qff, 2)
+
+
+def run(samples=500000, hs=35.5, hr=12.3, seed=0):
+    rng = np.random.default_rng(seed)
+    pressures = np.round(rng.uniform(950.0, 1050.0, samples), 2).tolist()
+    temperatures = np.round(rng.uniform(15.0, 25.0, samples), 1).tolist()  # 0.1 단위 온도
+    calculator = Calculator(hs, hr)
+
+    with Timer() as reference_timer:
+        expected = [reference_calculate(hs, hr, p, t) for p, t in zip(pressures, temperatures)]
+    with Timer() as current_timer:
+        calculate = calculator.calculate
+        actual = [calculate(p, t) for p, t in zip(pressures, temperatures)]
+
+    return {
+        'samples': samples,
+        'reference_ns': reference_timer.elapsed / samples * 1e9,
+        'current_ns': current_timer.elapsed / samples * 1e9,
+        'speedup': reference_timer.elapsed / current_timer.elapsed,
+        'identical': expected == actual,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Calculator.calculate 샘플당 비용 측정')
+    parser.add_argument('--samples', type=int, default=500000)
+    args = parser.parse_args()
+
+    result = run(args.samples)
+    print(f"samples   : {result['samples']}")
+    print(f"reference : {result['reference_ns']:.0f} ns/sample")
+    print(f"current   : {result['current_ns']:.0f} ns/sample")
+    print(f"speed-up  : x{result['speedup']:.2f}")
+    print(f"identical : {result['identical']}")
+    return result
+
+
+if __name__ == '__main__':
+    main()
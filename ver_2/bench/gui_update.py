@@ -0,0 +1,113 @@
+# bench/gui_update.py
+# DataDisplayGUI.handle_new_data / update_data 비용 (화면 없이 Qt offscreen 플랫폼 사용)
+#
+#   python bench/gui_update.py [--samples 20000] [--backlog 5000]
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from queue import Queue
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import _common
+from _common import Timer
+from sample import Sample, Sensor
+
+_app = None
+
+
+class _Storage:
+    """실시간 표시만 측정하므로 조회 기능은 비워 둔 저장소"""
+    base_dir = tempfile.gettempdir()
+
+    def flush(self):
+        pass
+
+
+def _samples(count):
+    now = time.time()
+    monotonic = time.monotonic()
+    samples = []
+    for i in range(count):
+        kind = i % 3
+        t = now + i * 0.001
+        m = monotonic + i * 0.001
+        if kind == 0:
+            samples.append(Sample(Sensor.BAROMETER, t, m, 1013.25 + (i % 50) * 0.01, 21.3))
+        elif kind == 1:
+            samples.append(Sample(Sensor.HYGROMETER, t, m, None, None, 21.1, 45.2))
+        else:
+            samples.append(Sample(Sensor.CALCULATED, t, m, 1013.25, 21.3, 21.1,
+                                  temperature=21.1, QNH=1015.11, QFE=1013.22, QFF=1016.33))
+    return samples
+
+
+def make_gui():
+    """offscreen QApplication과 DataDisplayGUI (타이머는 멈춘 상태)"""
+    global _app
+    from PyQt5.QtWidgets import QApplication
+    from data_display_gui import DataDisplayGUI
+    _app = QApplication.instance() or QApplication([])
+    logging.disable(logging.ERROR)  # settings.json 없음 등의 로그 생략
+    gui = DataDisplayGUI(Queue(), None, _Storage())
+    logging.disable(logging.NOTSET)
+    gui.timer.stop()  # 큐 처리는 벤치마크에서 직접 호출
+    return gui
+
+
+def run(samples=20000, backlog=5000):
+    gui = make_gui()
+
+    # 1) 한 건씩 처리 + 매번 화면 갱신 (예전 update_data와 같은 호출 방식)
+    data = _samples(samples)
+    with Timer() as refresh_timer:
+        for sample in data:
+            gui.handle_new_data(sample, refresh=True)
+
+    # 2) 화면 갱신 없이 최신값 판정만
+    gui.latest_data.clear()
+    data = _samples(samples)
+    with Timer() as no_refresh_timer:
+        for sample in data:
+            gui.handle_new_data(sample, refresh=False)
+
+    # 3) 밀린 큐를 update_data 한 틱으로 처리 (틱당 최대 MAX_MESSAGES_PER_TICK건)
+    gui.latest_data.clear()
+    for sample in _samples(backlog):
+        gui.data_queue.put(sample)
+    with Timer() as tick_timer:
+        gui.update_data()
+    processed = backlog - gui.data_queue.qsize()
+    while not gui.data_queue.empty():
+        gui.data_queue.get_nowait()
+
+    gui.close()
+    return {
+        'samples': samples,
+        'handle_refresh_us': refresh_timer.elapsed / samples * 1e6,
+        'handle_no_refresh_us': no_refresh_timer.elapsed / samples * 1e6,
+        'backlog': backlog,
+        'tick_messages': processed,
+        'tick_ms': tick_timer.elapsed * 1000.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DataDisplayGUI 실시간 갱신 비용 (offscreen)')
+    parser.add_argument('--samples', type=int, default=20000)
+    parser.add_argument('--backlog', type=int, default=5000)
+    args = parser.parse_args()
+
+    result = run(args.samples, args.backlog)
+    print(f"handle_new_data (refresh)    : {result['handle_refresh_us']:.1f} us/sample")
+    print(f"handle_new_data (no refresh) : {result['handle_no_refresh_us']:.2f} us/sample")
+    print(f"update_data tick             : {result['tick_ms']:.2f} ms for {result['tick_messages']} of "
+          f"{result['backlog']} queued")
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# bench/history_load.py
+# 그래프용 지난 데이터 조회 시간: DataDisplayGUI.load_data_from_csv / DataStorage.load_data
+# (하루씩 작업 스레드에서 동시에 읽을 때와 한 스레드로 읽을 때 비교, Qt offscreen 플랫폼 사용)
+#
+#   python bench/history_load.py [--days 30] [--interval 5] [--archive] [--workers 8]
+#
+# storage_query.py와 같은 합성 CSV를 만들고 마지막 날까지 days일을 조회합니다.
+
+import argparse
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import _common
+from _common import Timer
+import data_storage
+from data_storage import DataStorage
+from gui_update import make_gui
+from storage_query import make_dataset
+
+DATA_TYPES = ['pressure', 'humidity', 'QNH']
+
+
+def _set_workers(workers):
+    import data_display_gui
+    data_storage.LOAD_WORKERS = workers
+    data_display_gui.LOAD_WORKERS = workers
+
+
+def run(days=30, interval=5.0, archive=False, workers=None):
+    workers = workers or data_storage.LOAD_WORKERS
+    results = {'days': days, 'interval_s': interval, 'archive': archive, 'workers': workers,
+               'cpu_count': os.cpu_count()}
+    original = data_storage.LOAD_WORKERS
+    with tempfile.TemporaryDirectory() as base_dir:
+        last_date, total_rows = make_dataset(base_dir, days, interval, archive)
+        results['dataset_rows'] = total_rows
+        storage = DataStorage(base_dir)
+        gui = make_gui()
+        gui.ds = storage
+        end_time = datetime.combine(last_date, datetime.max.time())
+        start_time = datetime.combine(last_date - timedelta(days=days - 1), datetime.min.time())
+
+        try:
+            for name, count in (('serial', 1), ('parallel', workers)):
+                _set_workers(count)
+                with Timer() as gui_timer:
+                    df = gui.load_data_from_csv(DATA_TYPES, start_time, end_time)
+                with Timer() as load_timer:
+                    rows = storage.load_data(start_time, end_time)
+                results[name] = {
+                    'gui_load_s': gui_timer.elapsed,
+                    'gui_rows': len(df),
+                    'gui_frame_bytes': int(df.memory_usage(deep=True).sum()),
+                    'load_data_s': load_timer.elapsed,
+                    'load_rows': len(rows),
+                }
+        finally:
+            _set_workers(original)
+            gui.close()
+            storage.close()
+
+    results['gui_speedup'] = results['serial']['gui_load_s'] / results['parallel']['gui_load_s']
+    results['load_data_speedup'] = results['serial']['load_data_s'] / results['parallel']['load_data_s']
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='지난 데이터 조회 시간 (한 스레드 / 날짜별 동시 읽기)')
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--interval', type=float, default=5.0, help='합성 데이터 기록 간격 (초)')
+    parser.add_argument('--archive', action='store_true', help='열별 보관본(.cols)도 생성')
+    parser.add_argument('--workers', type=int, help=f'작업 스레드 수 (기본 {data_storage.LOAD_WORKERS})')
+    args = parser.parse_args()
+
+    result = run(args.days, args.interval, args.archive, args.workers)
+    print(f"dataset  : {result['dataset_rows']:,} rows, {result['days']}일, archive={result['archive']}, "
+          f"cpu {result['cpu_count']}")
+    for name in ('serial', 'parallel'):
+        case = result[name]
+        print(f"{name:<9}: load_data_from_csv {case['gui_load_s']:.2f} s ({case['gui_rows']:,} rows, "
+              f"{case['gui_frame_bytes'] / 1e6:.1f} MB), "
+              f"load_data {case['load_data_s']:.2f} s ({case['load_rows']:,} rows)")
+    print(f"speedup  : load_data_from_csv x{result['gui_speedup']:.2f}, "
+          f"load_data x{result['load_data_speedup']:.2f} ({result['workers']} workers)")
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# bench/parse_throughput.py
+# 한 줄 파싱 처리량 비교: 예전 parse_data(디코딩 + 센서 이름 분기 + re.search 2회) 대비 parsers.py
+#
+#   python bench/parse_throughput.py [--lines 200000] [--capture FILE]
+#
+# --capture를 주면 수신 기록 파일(capture.py 형식)의 줄을, 없으면 현장 형식의 줄을 만들어 사용합니다.
+
+import argparse
+import random
+import re
+import time
+
+import _common
+from _common import Timer
+import capture
+import parsers
+from sample import Sample, Sensor
+
+
+def reference_parse(sensor_name, raw):
+    """예전 DataReceiver.handle_line + parse_data의 파싱 부분"""
+    data = raw.decode('utf-8').strip()
+    if not data:
+        return None
+    try:
+        if sensor_name == '기압계':
+            parts = data.strip().split()
+            if len(parts) >= 2:
+                return Sample(Sensor.BAROMETER, time.time(), time.monotonic(),
+                              pressure=float(parts[0]), temperature_barometer=float(parts[1]))
+            return None
+        elif sensor_name == '습도계':
+            humidity_match = re.search(r'RH=\s*([\d\.]+)', data)
+            temperature_match = re.search(r'T=\s*([\d\.]+)', data)
+            if humidity_match and temperature_match:
+                return Sample(Sensor.HYGROMETER, time.time(), time.monotonic(),
+                              humidity=float(humidity_match.group(1)),
+                              temperature_humidity=float(temperature_match.group(1)))
+            return None
+        return None
+    except Exception:
+        return None
+
+
+def _values(sample):
+    if sample is None:
+        return None
+    if sample.sensor == '기압계':
+        return sample.pressure, sample.temperature_barometer
+    return sample.humidity, sample.temperature_humidity
+
+
+def recorded_lines(count, seed=0):
+    """현장 형식의 (센서, 줄) 목록: 기압계와 습도계가 번갈아 들어옴"""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        if i % 2 == 0:
+            line = f"{rng.uniform(990, 1030):.2f} {rng.uniform(0, 35):.1f}\r\n"
+            lines.append(('기압계', line.encode('ascii')))
+        else:
+            line = f"RH= {rng.uniform(20, 95):.1f} %RH T= {rng.uniform(0, 35):.1f} 'C\r\n"
+            lines.append(('습도계', line.encode('ascii')))
+    return lines
+
+
+def run(lines=200000, capture_path=None):
+    if capture_path:
+        records = [(sensor, raw) for _, sensor, raw in capture.read_capture(capture_path)]
+    else:
+        records = recorded_lines(lines)
+    selected = {name: parsers.get_parser(name) for name in ('기압계', '습도계')}
+
+    with Timer() as reference_timer:
+        expected = [reference_parse(sensor, raw) for sensor, raw in records]
+
+    # 수신 스레드는 센서마다 파서가 정해져 있으므로 미리 고른 파서로 측정
+    with Timer() as parser_timer:
+        parsed = [selected[sensor].parse(raw) for sensor, raw in records]
+
+    identical = [_values(sample) for sample in expected] == [_values(sample) for sample in parsed]
+    count = len(records)
+    return {
+        'lines': count,
+        'reference_per_s': count / reference_timer.elapsed,
+        'parser_per_s': count / parser_timer.elapsed,
+        'reference_ns': reference_timer.elapsed / count * 1e9,
+        'parser_ns': parser_timer.elapsed / count * 1e9,
+        'speedup': reference_timer.elapsed / parser_timer.elapsed,
+        'identical': identical,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='센서 한 줄 파싱 처리량 비교')
+    parser.add_argument('--lines', type=int, default=200000)
+    parser.add_argument('--capture', help='capture.py 형식의 수신 기록 파일')
+    args = parser.parse_args()
+
+    result = run(args.lines, args.capture)
+    print(f"lines     : {result['lines']}")
+    print(f"reference : {result['reference_ns']:.0f} ns/line ({result['reference_per_s']:,.0f} /s)")
+    print(f"parsers   : {result['parser_ns']:.0f} ns/line ({result['parser_per_s']:,.0f} /s)")
+    print(f"speed-up  : x{result['speedup']:.2f}")
+    print(f"identical : {result['identical']}")
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# bench/receive_latency.py
+# 시리얼 수신 → 큐 전달 지연 시간 측정 (실제 센서 없이 pyserial loop:// 사용)
+#
+#   python bench/receive_latency.py [--samples 40] [--interval 0.5]
+#
+# legacy: 예전 run() 루프처럼 in_waiting 확인 후 0.3초 sleep 하는 폴링 방식
+# event : 포트별 수신 스레드가 readline()에서 블로킹 대기하는 현재 방식
+
+import argparse
+import tempfile
+import threading
+import time
+from queue import Queue, Empty
+
+import _common
+from _common import print_histogram, summarize
+from data_receiver import DataReceiver
+from data_storage import DataStorage
+
+PORT_SETTINGS = {
+    '기압계': {'port': 'loop://', 'baudrate': 9600, 'parity': 'None', 'data_bits': 8, 'stop_bits': 1},
+}
+
+
+def _send_lines(ser, samples, interval, sent_at):
+    for i in range(samples):
+        sent_at[i] = time.perf_counter()
+        ser.write(f"1013.25 {i}.0\r\n".encode('ascii'))  # 온도 자리에 일련번호
+        time.sleep(interval)
+
+
+def _collect(data_queue, samples, sent_at, timeout=5.0):
+    latencies = []
+    deadline = time.perf_counter() + timeout + samples
+    while len(latencies) < samples and time.perf_counter() < deadline:
+        try:
+            data = data_queue.get(timeout=timeout)
+        except Empty:
+            break
+        if getattr(data, 'sensor', None) != '기압계':
+            continue
+        received = time.perf_counter()
+        index = int(data.temperature_barometer)
+        latencies.append((received - sent_at[index]) * 1000.0)
+    return latencies
+
+
+def run_legacy(samples, interval):
+    """예전 폴링 루프(in_waiting + sleep 0.3)를 흉내 내어 측정"""
+    with tempfile.TemporaryDirectory() as base_dir:
+        data_queue = Queue()
+        receiver = DataReceiver(data_queue, PORT_SETTINGS, DataStorage(base_dir), 1.0, 1.0, 'barometer_sensor')
+        ser = receiver.serial_ports['기압계']
+        stop = threading.Event()
+
+        def poll():
+            while not stop.is_set():
+                if ser.in_waiting > 0:
+                    line = ser.readline()
+                    receiver.handle_line('기압계', line)
+                time.sleep(0.3)
+
+        poller = threading.Thread(target=poll, daemon=True)
+        poller.start()
+        sent_at = {}
+        sender = threading.Thread(target=_send_lines, args=(ser, samples, interval, sent_at))
+        sender.start()
+        latencies = _collect(data_queue, samples, sent_at)
+        sender.join()
+        stop.set()
+        poller.join()
+        receiver.stop()
+        return latencies
+
+
+def run_event(samples, interval):
+    """포트별 블로킹 수신 스레드(현재 DataReceiver.run)로 측정"""
+    with tempfile.TemporaryDirectory() as base_dir:
+        data_queue = Queue()
+        receiver = DataReceiver(data_queue, PORT_SETTINGS, DataStorage(base_dir), 1.0, 1.0, 'barometer_sensor')
+        ser = receiver.serial_ports['기압계']
+        receiver.start()
+        sent_at = {}
+        sender = threading.Thread(target=_send_lines, args=(ser, samples, interval, sent_at))
+        sender.start()
+        latencies = _collect(data_queue, samples, sent_at)
+        sender.join()
+        receiver.stop()
+        receiver.join()
+        return latencies
+
+
+def run(samples=40, interval=0.5, legacy=True):
+    """반환값: {'event': 요약, 'legacy': 요약(legacy=True일 때)} 및 원본 지연 시간 목록"""
+    result = {}
+    if legacy:
+        latencies = run_legacy(samples, interval)
+        result['legacy'] = summarize(latencies)
+        result['_legacy'] = latencies
+    latencies = run_event(samples, interval)
+    result['event'] = summarize(latencies)
+    result['_event'] = latencies
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시리얼 수신 → 큐 전달 지연 시간 측정')
+    parser.add_argument('--samples', type=int, default=40)
+    parser.add_argument('--interval', type=float, default=0.5, help='센서 출력 간격(초)')
+    args = parser.parse_args()
+
+    result = run(args.samples, args.interval)
+    print_histogram('legacy polling (sleep 0.3 s)', result.pop('_legacy'))
+    print_histogram('event-driven readers', result.pop('_event'))
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# bench/replay_pipeline.py
+# 수신 기록 파일을 재생하여 파싱 → 계산 → 큐 → 저장 전체 경로의 처리량과 지연 시간 측정
+#
+#   python bench/replay_pipeline.py [--capture FILE] [--lines 100000] [--speed 0]
+#
+# --capture가 없으면 기압계/습도계 줄을 번갈아 담은 기록 파일을 임시로 만듭니다.
+# (실제 프로그램은 main.py --capture FILE 로 기록)
+# --speed 0은 대기 없이 최대 속도, 1.0은 기록된 간격 그대로 재생합니다.
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from queue import Queue, Empty
+
+import _common
+from _common import Timer, print_histogram, summarize
+import capture
+from async_data_writer import AsyncDataWriter
+from data_receiver import DataReceiver
+from data_storage import DataStorage
+from parse_throughput import recorded_lines
+
+
+def write_synthetic_capture(path, lines, interval=0.1):
+    """현장 형식의 줄을 interval 초 간격으로 수신한 것처럼 기록"""
+    writer = capture.CaptureWriter(path)
+    start = time.time()
+    for i, (sensor_name, raw_line) in enumerate(recorded_lines(lines)):
+        writer.write(sensor_name, raw_line, start + i * interval)
+    writer.close()
+
+
+def _drain(data_queue, latencies, stop):
+    """GUI 대신 큐를 비우며 (파싱 시각 -> 꺼낸 시각) 지연 시간을 기록"""
+    while True:
+        try:
+            data = data_queue.get(timeout=0.1)
+        except Empty:
+            if stop.is_set():
+                return
+            continue
+        monotonic = getattr(data, 'monotonic', None)
+        if monotonic is not None:
+            latencies.append((time.monotonic() - monotonic) * 1000.0)
+
+
+def run(capture_path=None, lines=100000, speed=0.0):
+    with tempfile.TemporaryDirectory() as base_dir:
+        if capture_path is None:
+            capture_path = os.path.join(base_dir, 'synthetic.cap')
+            write_synthetic_capture(capture_path, lines)
+
+        storage = DataStorage(os.path.join(base_dir, 'data'))
+        writer = AsyncDataWriter(storage, policy='block')
+        writer.start()
+        data_queue = Queue()
+        receiver = DataReceiver(data_queue, {}, writer, 35.5, 12.3, 'humidity_sensor')
+
+        latencies = []
+        stop = threading.Event()
+        consumer = threading.Thread(target=_drain, args=(data_queue, latencies, stop), daemon=True)
+        consumer.start()
+
+        with Timer() as replay_timer:
+            count = capture.replay(capture_path, receiver, speed=speed)
+        with Timer() as drain_timer:
+            writer.stop()
+            writer.join()
+            storage.close()
+        stop.set()
+        consumer.join()
+
+        stats = writer.get_stats()
+        elapsed = replay_timer.elapsed + drain_timer.elapsed
+        return {
+            'lines': count,
+            'samples_written': stats['written'],
+            'replay_s': replay_timer.elapsed,
+            'drain_s': drain_timer.elapsed,
+            'lines_per_s': count / replay_timer.elapsed,
+            'end_to_end_lines_per_s': count / elapsed,
+            'queue_latency': summarize(latencies),
+            'writer': stats,
+            '_latencies': latencies,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='수신 기록 재생으로 전체 수신 경로 처리량/지연 측정')
+    parser.add_argument('--capture', help='capture.py 형식의 기록 파일 (없으면 임시 생성)')
+    parser.add_argument('--lines', type=int, default=100000, help='임시 기록 파일의 줄 수')
+    parser.add_argument('--speed', type=float, default=0.0, help='재생 배속 (0: 최대 속도)')
+    args = parser.parse_args()
+
+    result = run(args.capture, args.lines, args.speed)
+    print(f"lines           : {result['lines']} (저장 {result['samples_written']}건)")
+    print(f"replay          : {result['replay_s']:.2f} s ({result['lines_per_s']:,.0f} lines/s)")
+    print(f"writer drain    : {result['drain_s']:.2f} s")
+    print(f"end-to-end      : {result['end_to_end_lines_per_s']:,.0f} lines/s")
+    print_histogram('parse -> GUI queue', result.pop('_latencies'))
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+# bench/run_all.py
+# 전체 벤치마크 실행 후 결과를 JSON으로 저장 (릴리스 간 성능 비교용)
+#
+#   python bench/run_all.py                        # 전체, bench/results/<시각>.json
+#   python bench/run_all.py --quick                # 작은 크기로 빠르게
+#   python bench/run_all.py --only storage_write,storage_query
+#   python bench/run_all.py --baseline bench/results/20241023-120000.json
+#
+# --baseline을 주면 같은 항목끼리 비교하여 --threshold(%) 이상 나빠진 값을 표시합니다.
+# (이름이 _per_s, speedup, ratio로 끝나면 클수록, _s/_ms/_us/_ns/_bytes로 끝나면 작을수록 좋음)
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import traceback
+
+import _common
+
+# (이름, 모듈, 전체 실행 인자, --quick 인자)
+CASES = [
+    ('parse_throughput', 'parse_throughput', {'lines': 200000}, {'lines': 20000}),
+    ('calculator_scalar', 'calculator_scalar', {'samples': 500000}, {'samples': 50000}),
+    ('calculator_batch', 'calculator_batch', {'samples': 1000000}, {'samples': 100000}),
+    ('sample_memory', 'sample_memory', {'samples': 100000}, {'samples': 20000}),
+    ('storage_write', 'storage_write', {'rows': 200000}, {'rows': 30000}),
+    ('storage_query', 'storage_query', {'interval': 5.0, 'spans': (1, 7, 30)},
+     {'interval': 60.0, 'spans': (1, 7, 30)}),
+    ('storage_query_archive', 'storage_query', {'interval': 5.0, 'spans': (1, 7, 30), 'archive': True},
+     {'interval': 60.0, 'spans': (1, 7, 30), 'archive': True}),
+    ('history_load', 'history_load', {'days': 30, 'interval': 5.0}, {'days': 7, 'interval': 60.0}),
+    ('history_load_archive', 'history_load', {'days': 30, 'interval': 5.0, 'archive': True},
+     {'days': 7, 'interval': 60.0, 'archive': True}),
+    ('replay_pipeline', 'replay_pipeline', {'lines': 100000}, {'lines': 10000}),
+    ('gui_update', 'gui_update', {'samples': 20000, 'backlog': 5000}, {'samples': 3000, 'backlog': 2000}),
+    ('trend_chart', 'trend_chart', {'capacity': 86400, 'refreshes': 20}, {'capacity': 86400, 'refreshes': 5}),
+    ('receive_latency', 'receive_latency', {'samples': 40, 'interval': 0.5},
+     {'samples': 10, 'interval': 0.1, 'legacy': False}),
+    ('stress_simulator', 'stress_simulator', {'pairs': 4, 'rate': 50.0, 'duration': 20.0},
+     {'pairs': 2, 'rate': 50.0, 'duration': 3.0}),
+    ('station_scaling', 'station_scaling', {'stations': (1, 4, 16), 'rate': 10.0, 'duration': 10.0},
+     {'stations': (1, 4), 'rate': 10.0, 'duration': 3.0}),
+    ('station_scaling_asyncio', 'station_scaling',
+     {'stations': (1, 4, 16), 'rate': 10.0, 'duration': 10.0, 'engine': 'asyncio'},
+     {'stations': (1, 4), 'rate': 10.0, 'duration': 3.0, 'engine': 'asyncio'}),
+]
+
+# pty가 필요한 항목 (Windows에서는 건너뜀)
+POSIX_ONLY = {'stress_simulator', 'station_scaling', 'station_scaling_asyncio'}
+
+HIGHER_IS_BETTER = ('_per_s', 'speedup', 'ratio')
+LOWER_IS_BETTER = ('_s', '_ms', '_us', '_ns', '_bytes')
+
+
+def _strip_private(value):
+    """'_'로 시작하는 키(원본 지연 시간 목록 등)를 제외하고 JSON으로 저장 가능한 값으로 변환"""
+    if isinstance(value, dict):
+        return {str(k): _strip_private(v) for k, v in value.items() if not str(k).startswith('_')}
+    if isinstance(value, (list, tuple)):
+        return [_strip_private(v) for v in value]
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    try:
+        return float(value)  # numpy 숫자 등
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=_common.BENCH_DIR,
+            capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _flatten(value, prefix=''):
+    items = {}
+    if isinstance(value, dict):
+        for key, child in value.items():
+            items.update(_flatten(child, f'{prefix}.{key}' if prefix else key))
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        items[prefix] = float(value)
+    return items
+
+
+def compare(current, baseline, threshold=10.0):
+    """두 결과에서 같은 항목의 변화율 목록: [(항목, 이전, 현재, 변화 %, 나빠졌는지)]"""
+    now = _flatten(current.get('results', {}))
+    before = _flatten(baseline.get('results', {}))
+    rows = []
+    for key in sorted(now.keys() & before.keys()):
+        old, new = before[key], now[key]
+        if old == 0:
+            continue
+        change = (new - old) / abs(old) * 100.0
+        name = key.rsplit('.', 1)[-1]
+        if name.endswith(HIGHER_IS_BETTER):
+            worse = change < -threshold
+        elif name.endswith(LOWER_IS_BETTER):
+            worse = change > threshold
+        else:
+            continue  # 건수 등 방향이 없는 값
+        rows.append((key, old, new, change, worse))
+    return rows
+
+
+def run(only=None, quick=False):
+    results = {}
+    errors = {}
+    for name, module_name, full_args, quick_args in CASES:
+        if only and name not in only:
+            continue
+        if name in POSIX_ONLY and os.name != 'posix':
+            print(f"[{name}] 건너뜀 (POSIX 전용)")
+            continue
+        print(f"[{name}] 실행 중...", flush=True)
+        started = time.perf_counter()
+        try:
+            module = importlib.import_module(module_name)
+            results[name] = _strip_private(module.run(**(quick_args if quick else full_args)))
+        except Exception as e:
+            errors[name] = f"{type(e).__name__}: {e}"
+            traceback.print_exc()
+            continue
+        print(f"[{name}] 완료 ({time.perf_counter() - started:.1f} s)", flush=True)
+
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'commit': _git_commit(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+            'quick': quick,
+        },
+        'results': results,
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='전체 벤치마크 실행 및 JSON 저장')
+    parser.add_argument('--quick', action='store_true', help='작은 크기로 빠르게 실행')
+    parser.add_argument('--only', help='실행할 항목 (쉼표로 구분): ' + ', '.join(case[0] for case in CASES))
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: bench/results/<시각>.json)')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=10.0, help='나빠짐으로 표시할 변화율 (%%)')
+    args = parser.parse_args()
+
+    # 재연결/깨진 줄 등의 로그가 진행 표시를 가리지 않도록
+    logging.basicConfig(level=logging.CRITICAL)
+
+    only = set(args.only.split(',')) if args.only else None
+    report = run(only, args.quick)
+
+    output = args.output or os.path.join(_common.BENCH_DIR, 'results', time.strftime('%Y%m%d-%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, mode='w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+    if report['errors']:
+        print(f"실패: {', '.join(report['errors'])}")
+
+    if args.baseline:
+        with open(args.baseline, mode='r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare(report, baseline, args.threshold)
+        regressions = [row for row in rows if row[4]]
+        print(f"\n비교 기준: {args.baseline} (commit {baseline.get('meta', {}).get('commit')})")
+        for key, old, new, change, worse in rows:
+            mark = '  <-- 나빠짐' if worse else ''
+            print(f"  {key:<50} {old:>14.4g} -> {new:<14.4g} {change:+7.1f} %{mark}")
+        print(f"나빠진 항목: {len(regressions)}개 (기준 {args.threshold:g} %)")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# bench/sample_memory.py
+# 측정값 한 건당 메모리/생성 비용 비교: 예전 dict 레코드 대비 Sample(__slots__)
+#
+#   python bench/sample_memory.py [--samples 100000]
+#
+# 큐에 samples건이 밀려 있는 상황을 가정하고, tracemalloc으로 살아 있는 객체의
+# 크기를 재며, 생성 + 저장 행 변환(save_data가 하던 일) 시간을 비교합니다.
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import _common
+from _common import Timer
+from data_storage import FIELDS
+from sample import Sample, Sensor
+
+
+def _make_dicts(samples):
+    # 수신 스레드가 예전에 만들던 형태 (계산값 레코드)
+    return [{
+        'sensor': '계산값',
+        'pressure': 1013.25,
+        'temperature_barometer': 21.5,
+        'temperature_humidity': 21.7,
+        'temperature': 21.7,
+        'QNH': 1015.1,
+        'QFE': 1013.2,
+        'QFF': 1016.3,
+        'timestamp': time.time(),
+        'monotonic': time.monotonic(),
+    } for _ in range(samples)]
+
+
+def _make_samples(samples):
+    return [Sample(
+        Sensor.CALCULATED, time.time(), time.monotonic(),
+        pressure=1013.25,
+        temperature_barometer=21.5,
+        temperature_humidity=21.7,
+        temperature=21.7,
+        QNH=1015.1,
+        QFE=1013.2,
+        QFF=1016.3,
+    ) for _ in range(samples)]
+
+
+def _measure(factory, samples):
+    """factory(samples)가 만든 객체들의 (건당 바이트, 건당 할당 블록 수)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    records = factory(samples)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del records
+    return size / samples, blocks / samples
+
+
+def run(samples=100000):
+    dict_bytes, dict_blocks = _measure(_make_dicts, samples)
+    sample_bytes, sample_blocks = _measure(_make_samples, samples)
+
+    # 생성 + 저장 행 변환 시간
+    with Timer() as dict_timer:
+        for data in _make_dicts(samples):
+            [data.get(field, '') for field in FIELDS]
+    with Timer() as sample_timer:
+        for data in _make_samples(samples):
+            data.to_row()
+
+    return {
+        'samples': samples,
+        'dict_bytes': dict_bytes,
+        'sample_bytes': sample_bytes,
+        'dict_blocks': dict_blocks,
+        'sample_blocks': sample_blocks,
+        'memory_ratio': dict_bytes / sample_bytes,
+        'dict_ns': dict_timer.elapsed / samples * 1e9,
+        'sample_ns': sample_timer.elapsed / samples * 1e9,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='측정값 레코드 메모리/생성 비용 비교 (dict vs Sample)')
+    parser.add_argument('--samples', type=int, default=100000)
+    args = parser.parse_args()
+
+    result = run(args.samples)
+    print(f"samples : {result['samples']}")
+    print(f"dict    : {result['dict_bytes']:.0f} B/sample, {result['dict_blocks']:.1f} blocks, "
+          f"{result['dict_ns']:.0f} ns (생성 + 행 변환)")
+    print(f"Sample  : {result['sample_bytes']:.0f} B/sample, {result['sample_blocks']:.1f} blocks, "
+          f"{result['sample_ns']:.0f} ns (생성 + 행 변환)")
+    print(f"memory  : x{result['memory_ratio']:.2f} 감소")
+    return result
+
+
+if __name__ == '__main__':
+    main()
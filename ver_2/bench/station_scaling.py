@@ -0,0 +1,111 @@
+# bench/station_scaling.py
+# 관측소 수에 따른 CPU 사용량 (station.Station + 가상 센서, Linux 전용)
+#
+#   python bench/station_scaling.py [--stations 1,4,16] [--rate 10] [--duration 10] [--engine asyncio]
+#
+# 관측소마다 기압계/습도계 가상 센서 한 쌍을 만들고 Station.start()로 저장소/기록/수신
+# 스레드를 띄운 뒤, 수신 줄 하나당 CPU 시간이 관측소 수와 무관하게 유지되는지 확인합니다.
+
+import argparse
+import logging
+import os
+import tempfile
+import threading
+import time
+from queue import Empty
+
+import _common
+import metrics
+import simulator
+from station import Station
+
+
+def _drain(stations):
+    count = 0
+    for station in stations:
+        while True:
+            try:
+                station.data_queue.get_nowait()
+            except Empty:
+                break
+            count += 1
+    return count
+
+
+def run_once(count, rate=10.0, duration=10.0, engine='thread'):
+    metrics.REGISTRY.reset()
+    with tempfile.TemporaryDirectory() as base_dir:
+        sensors = simulator.start_sensors(count, count, start=False, rate=rate,
+                                          link_dir=os.path.join(base_dir, 'ports'), seed=0)
+        barometers = [s for s in sensors if s.kind == 'barometer']
+        hygrometers = [s for s in sensors if s.kind == 'hygrometer']
+
+        stations = []
+        for i, (barometer, hygrometer) in enumerate(zip(barometers, hygrometers)):
+            station = Station(f'S{i + 1:02d}', {
+                '기압계': simulator.port_settings(barometer.port),
+                '습도계': simulator.port_settings(hygrometer.port),
+            }, 35.5, 12.3)
+            station.start(os.path.join(base_dir, 'data'), engine=engine)
+            stations.append(station)
+
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        for sensor in sensors:
+            sensor.start()
+        threads = threading.active_count() - len(sensors)  # 시뮬레이터 스레드 제외
+        received = 0
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            time.sleep(0.2)  # GUI 타이머 대신 큐를 비움
+            received += _drain(stations)
+        for sensor in sensors:
+            sensor.stop()
+        for sensor in sensors:
+            sensor.join(timeout=2)
+        for station in stations:
+            station.stop()
+        received += _drain(stations)
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+
+        sent = sum(s.lines_sent for s in sensors)
+        partitions = sorted(os.listdir(os.path.join(base_dir, 'data', 'stations')))
+        return {
+            'stations': count,
+            'lines_sent': sent,
+            'messages': received,
+            'cpu_pct': 100.0 * cpu / wall,
+            'cpu_us_per_line': cpu / max(1, sent) * 1e6,
+            'partitions': len(partitions),
+            'threads': threads,
+        }
+
+
+def run(stations=(1, 4, 16), rate=10.0, duration=10.0, engine='thread'):
+    results = {'rate_hz': rate, 'duration_s': duration, 'engine': engine}
+    for count in stations:
+        results[f'{count}_stations'] = run_once(count, rate, duration, engine)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='관측소 수에 따른 CPU 사용량 (가상 센서)')
+    parser.add_argument('--stations', default='1,4,16', help='관측소 수 (쉼표로 구분)')
+    parser.add_argument('--rate', type=float, default=10.0, help='센서당 Hz')
+    parser.add_argument('--duration', type=float, default=10.0, help='측정 시간 (초)')
+    parser.add_argument('--engine', default='thread', choices=('thread', 'asyncio'))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    counts = tuple(int(count) for count in args.stations.split(','))
+    result = run(counts, args.rate, args.duration, args.engine)
+    for count in counts:
+        case = result[f'{count}_stations']
+        print(f"{count:>3} stations : {case['lines_sent']:>6} lines, cpu {case['cpu_pct']:5.1f} % "
+              f"({case['cpu_us_per_line']:.0f} us/line), 스레드 {case['threads']}개, 저장 폴더 {case['partitions']}개")
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+# bench/storage_query.py
+# DataStorage.load_data / search_data 조회 시간: 1일, 1주, 1개월 (합성 CSV)
+#
+#   python bench/storage_query.py [--interval 5] [--spans 1,7,30] [--archive]
+#
+# 어제까지 --interval 초 간격으로 기압계/습도계/계산값 3행씩 기록된 일별 CSV를 만들고
+# (시간 색인 포함), 어제로 끝나는 기간을 조회합니다. --archive를 주면 열별 보관본(.cols)도
+# 만들어 두므로 마감된 날짜는 보관본 경로로 조회됩니다.
+
+import argparse
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+import _common
+from _common import Timer
+import columnar_archive
+import time_index
+from data_storage import DataStorage, FIELDS
+
+
+def write_synthetic_day(base_dir, date, interval=5.0, seed=0):
+    """하루치 CSV를 현재 저장 형식('YYYY-MM-DD HH:MM:SS.fff')으로 생성하고 색인을 만듦"""
+    rng = random.Random(f'{seed}-{date}')
+    month_dir = os.path.join(base_dir, date.strftime('%Y-%m'))
+    os.makedirs(month_dir, exist_ok=True)
+    csv_path = os.path.join(month_dir, f"{date.strftime('%Y-%m-%d')}.csv")
+
+    start = datetime.combine(date, datetime.min.time())
+    steps = int(86400 / interval)
+    pressure = 1013.0
+    temperature = 20.0
+    humidity = 50.0
+    lines = [','.join(FIELDS)]
+    for i in range(steps):
+        timestamp = (start + timedelta(seconds=i * interval)).isoformat(sep=' ', timespec='milliseconds')
+        pressure += rng.gauss(0, 0.05)
+        temperature += rng.gauss(0, 0.02)
+        humidity = min(100.0, max(0.0, humidity + rng.gauss(0, 0.1)))
+        lines.append(f"{timestamp},기압계,{pressure:.2f},{temperature:.1f},,,,,")
+        lines.append(f"{timestamp},습도계,,,{temperature:.1f},{humidity:.1f},,,")
+        lines.append(f"{timestamp},계산값,{pressure:.2f},{temperature:.1f},{temperature:.1f},,"
+                     f"{pressure + 1.9:.2f},{pressure + 0.1:.2f},{pressure + 2.2:.2f}")
+    with open(csv_path, mode='w', newline='', encoding='utf-8') as f:
+        f.write('\r\n'.join(lines) + '\r\n')
+    time_index.build_index(csv_path)
+    return csv_path, len(lines) - 1
+
+
+def make_dataset(base_dir, days, interval=5.0, archive=False):
+    """어제로 끝나는 days일치 합성 데이터. 반환값: (마지막 날짜, 전체 행 수)"""
+    last_date = datetime.now().date() - timedelta(days=1)
+    total = 0
+    for i in range(days):
+        csv_path, rows = write_synthetic_day(base_dir, last_date - timedelta(days=i), interval)
+        if archive:
+            columnar_archive.convert_csv(csv_path)
+        total += rows
+    return last_date, total
+
+
+def run(interval=5.0, spans=(1, 7, 30), archive=False):
+    results = {'interval_s': interval, 'archive': archive}
+    with tempfile.TemporaryDirectory() as base_dir:
+        with Timer() as make_timer:
+            last_date, total_rows = make_dataset(base_dir, max(spans), interval, archive)
+        results['dataset_rows'] = total_rows
+        results['dataset_build_s'] = make_timer.elapsed
+
+        storage = DataStorage(base_dir)
+        end_time = datetime.combine(last_date, datetime.max.time())
+        for span in spans:
+            start_time = datetime.combine(last_date - timedelta(days=span - 1), datetime.min.time())
+            with Timer() as load_timer:
+                rows = storage.load_data(start_time, end_time)
+            with Timer() as search_timer:
+                calculated = storage.search_data('계산값', start_time, end_time)
+            # 한 시간 구간 (시간 색인/보관본으로 일부만 읽는 경우)
+            hour_start = datetime.combine(last_date, datetime.min.time()) + timedelta(hours=12)
+            with Timer() as hour_timer:
+                storage.search_data('계산값', hour_start, hour_start + timedelta(hours=1))
+            results[f'{span}d'] = {
+                'rows': len(rows),
+                'load_data_s': load_timer.elapsed,
+                'search_data_s': search_timer.elapsed,
+                'search_rows': len(calculated),
+                'load_rows_per_s': len(rows) / load_timer.elapsed if load_timer.elapsed else 0.0,
+            }
+            results['1h_search_s'] = hour_timer.elapsed
+        storage.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='load_data / search_data 조회 시간 (1일, 1주, 1개월)')
+    parser.add_argument('--interval', type=float, default=5.0, help='합성 데이터 기록 간격 (초)')
+    parser.add_argument('--spans', default='1,7,30', help='조회 기간 (일, 쉼표로 구분)')
+    parser.add_argument('--archive', action='store_true', help='열별 보관본(.cols)도 생성')
+    args = parser.parse_args()
+
+    spans = tuple(int(span) for span in args.spans.split(','))
+    result = run(args.interval, spans, args.archive)
+    print(f"dataset : {result['dataset_rows']:,} rows, {args.interval:g} s 간격, "
+          f"archive={result['archive']} (생성 {result['dataset_build_s']:.1f} s)")
+    for span in spans:
+        case = result[f'{span}d']
+        print(f"{span:>3} day : load_data {case['load_data_s']:.2f} s ({case['rows']:,} rows), "
+              f"search_data(계산값) {case['search_data_s']:.2f} s ({case['search_rows']:,} rows)")
+    print(f"1 hour  : search_data(계산값) {result['1h_search_s'] * 1000:.1f} ms")
+    return result
+
+
+if __name__ == '__main__':
+    main()
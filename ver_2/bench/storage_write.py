@@ -0,0 +1,69 @@
+# bench/storage_write.py
+# DataStorage.save_data 처리량 (수신 스레드 없이 직접 호출, 버퍼링 + 색인 + 집계 포함)
+#
+#   python bench/storage_write.py [--rows 200000] [--flush-rows 100]
+
+import argparse
+import os
+import tempfile
+import time
+
+import _common
+from _common import Timer
+from data_storage import DataStorage
+from sample import Sample, Sensor
+
+
+def make_samples(rows, interval=0.1):
+    """기압계 / 습도계 / 계산값이 번갈아 들어오는 현장 형식의 Sample 목록"""
+    start = time.time()
+    samples = []
+    for i in range(rows):
+        timestamp = start + (i // 3) * interval
+        kind = i % 3
+        if kind == 0:
+            samples.append(Sample(Sensor.BAROMETER, timestamp, None, 1013.25 + (i % 50) * 0.01, 21.3))
+        elif kind == 1:
+            samples.append(Sample(Sensor.HYGROMETER, timestamp, None, None, None, 21.1, 45.2))
+        else:
+            samples.append(Sample(Sensor.CALCULATED, timestamp, None, 1013.25, 21.3, 21.1,
+                                  temperature=21.1, QNH=1015.11, QFE=1013.22, QFF=1016.33))
+    return samples
+
+
+def run(rows=200000, flush_rows=100):
+    samples = make_samples(rows)
+    with tempfile.TemporaryDirectory() as base_dir:
+        storage = DataStorage(base_dir, flush_rows=flush_rows)
+        with Timer() as timer:
+            for sample in samples:
+                storage.save_data(sample)
+            storage.close()
+        size = sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, names in os.walk(base_dir) for name in names)
+    return {
+        'rows': rows,
+        'flush_rows': flush_rows,
+        'elapsed_s': timer.elapsed,
+        'rows_per_s': rows / timer.elapsed,
+        'us_per_row': timer.elapsed / rows * 1e6,
+        'bytes_on_disk': size,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DataStorage.save_data 처리량')
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--flush-rows', type=int, default=100)
+    args = parser.parse_args()
+
+    result = run(args.rows, args.flush_rows)
+    print(f"rows      : {result['rows']} (flush_rows={result['flush_rows']})")
+    print(f"elapsed   : {result['elapsed_s']:.2f} s")
+    print(f"throughput: {result['rows_per_s']:,.0f} rows/s ({result['us_per_row']:.1f} us/row)")
+    print(f"on disk   : {result['bytes_on_disk'] / 1e6:.1f} MB (CSV + 색인 + 집계)")
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+# bench/stress_simulator.py
+# 가상 센서(simulator.py, pty)로 수신 → 큐 → 저장 경로 부하 시험 (Linux 전용)
+#
+#   python bench/stress_simulator.py [--pairs 4] [--rate 50] [--duration 20]
+#                                    [--garbage 0.01] [--burst-every 5 --burst-size 200]
+#                                    [--disconnect-every 0] [--engine asyncio]
+#
+# 기압계+습도계 한 쌍마다 DataReceiver 하나를 띄우고, 모든 수신기가 하나의
+# AsyncDataWriter/DataStorage를 공유합니다. (현장은 한 쌍, 1 Hz 내외)
+
+import argparse
+import logging
+import os
+import tempfile
+import threading
+import time
+from queue import Queue, Empty
+
+import _common
+from _common import print_histogram, summarize
+import metrics
+import simulator
+from async_data_writer import AsyncDataWriter
+from async_receiver import ENGINES
+from data_storage import DataStorage
+
+
+def _drain(data_queue, counts, latencies, stop):
+    """GUI 대신 큐를 비우며 센서별 수신 건수와 (파싱 -> 꺼냄) 지연 시간을 기록"""
+    while True:
+        try:
+            data = data_queue.get(timeout=0.1)
+        except Empty:
+            if stop.is_set():
+                return
+            continue
+        sensor = getattr(data, 'sensor', None)
+        if sensor is None:
+            counts['status'] = counts.get('status', 0) + 1
+            continue
+        counts[sensor] = counts.get(sensor, 0) + 1
+        latencies.append((time.monotonic() - data.monotonic) * 1000.0)
+
+
+def run(pairs=4, rate=50.0, duration=20.0, garbage=0.0, burst_every=0.0, burst_size=100,
+        disconnect_every=0.0, policy='drop_oldest', engine='thread'):
+    metrics.REGISTRY.reset()
+    with tempfile.TemporaryDirectory() as base_dir:
+        link_dir = os.path.join(base_dir, 'ports')
+        sensors = simulator.start_sensors(
+            pairs, pairs, start=False, rate=rate, link_dir=link_dir, garbage=garbage,
+            burst_every=burst_every, burst_size=burst_size,
+            disconnect_every=disconnect_every, seed=0
+        )
+        barometers = [s for s in sensors if s.kind == 'barometer']
+        hygrometers = [s for s in sensors if s.kind == 'hygrometer']
+
+        storage = DataStorage(os.path.join(base_dir, 'data'))
+        writer = AsyncDataWriter(storage, maxsize=10000, policy=policy)
+        writer.start()
+
+        data_queue = Queue()
+        receivers = []
+        for i, (barometer, hygrometer) in enumerate(zip(barometers, hygrometers)):
+            port_settings = {
+                '기압계': simulator.port_settings(barometer.port),
+                '습도계': simulator.port_settings(hygrometer.port),
+            }
+            receiver = ENGINES[engine](data_queue, port_settings, writer, 35.5, 12.3, 'humidity_sensor',
+                                       station=f'S{i + 1:02d}')  # 지표를 쌍마다 따로 집계
+            receiver.start()
+            receivers.append(receiver)
+
+        counts = {}
+        latencies = []
+        stop = threading.Event()
+        consumer = threading.Thread(target=_drain, args=(data_queue, counts, latencies, stop), daemon=True)
+        consumer.start()
+
+        # 수신기가 포트를 연 뒤에 출력 시작 (포트를 열 때 입력 버퍼가 비워지므로)
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        for sensor in sensors:
+            sensor.start()
+        time.sleep(duration)
+        for sensor in sensors:
+            sensor.stop()
+        for sensor in sensors:
+            sensor.join(timeout=2)  # 남은 줄을 읽어 갈 때까지 최대 1초 대기 후 종료
+        for receiver in receivers:
+            receiver.stop()
+        for receiver in receivers:
+            receiver.join(timeout=5)
+        writer.stop()
+        writer.join()
+        storage.close()
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        stop.set()
+        consumer.join()
+
+        sent = sum(s.lines_sent for s in sensors)
+        garbage_sent = sum(s.garbage_sent for s in sensors)
+        received = counts.get('기압계', 0) + counts.get('습도계', 0)
+        snapshot = metrics.snapshot()
+        recover = {key: summary for key, summary in snapshot['histograms'].items() if key.startswith('recover_ms[')}
+        return {
+            'pairs': pairs,
+            'engine': engine,
+            'rate_hz': rate,
+            'duration_s': duration,
+            'lines_sent': sent,
+            'garbage_sent': garbage_sent,
+            'sim_dropped': sum(s.lines_dropped for s in sensors),
+            'samples_received': received,
+            'calculated': counts.get('계산값', 0),
+            'status_messages': counts.get('status', 0),
+            'valid_loss_pct': 100.0 * (1 - received / max(1, sent - garbage_sent)),
+            'cpu_pct': 100.0 * cpu / wall,
+            'queue_latency': summarize(latencies),
+            'writer': writer.get_stats(),
+            'reconnects': sum(value for key, value in snapshot['counters'].items() if key.startswith('reconnects[')),
+            'recover_max_ms': max((summary['max_ms'] for summary in recover.values()), default=0.0),
+            'recover': recover,
+            '_latencies': latencies,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가상 센서(pty) 부하 시험')
+    parser.add_argument('--pairs', type=int, default=4, help='기압계+습도계 쌍의 수')
+    parser.add_argument('--rate', type=float, default=50.0, help='센서당 Hz')
+    parser.add_argument('--duration', type=float, default=20.0, help='시험 시간 (초)')
+    parser.add_argument('--garbage', type=float, default=0.0)
+    parser.add_argument('--burst-every', type=float, default=0.0)
+    parser.add_argument('--burst-size', type=int, default=100)
+    parser.add_argument('--disconnect-every', type=float, default=0.0)
+    parser.add_argument('--policy', default='drop_oldest', choices=AsyncDataWriter.POLICIES)
+    parser.add_argument('--engine', default='thread', choices=sorted(ENGINES))
+    args = parser.parse_args()
+
+    # 깨진 줄/재연결 로그가 결과 출력을 가리지 않도록
+    logging.basicConfig(level=logging.CRITICAL)
+
+    result = run(args.pairs, args.rate, args.duration, args.garbage, args.burst_every,
+                 args.burst_size, args.disconnect_every, args.policy, args.engine)
+    print(f"sensors        : {result['pairs']} x (기압계 + 습도계) @ {result['rate_hz']:g} Hz, {result['duration_s']:g} s")
+    print(f"lines sent     : {result['lines_sent']} (깨진 줄 {result['garbage_sent']}, 시뮬레이터 버림 {result['sim_dropped']})")
+    print(f"received       : {result['samples_received']} (계산값 {result['calculated']}, 상태 {result['status_messages']})")
+    print(f"valid loss     : {result['valid_loss_pct']:.2f} %")
+    print(f"cpu            : {result['cpu_pct']:.0f} % (한 코어 기준)")
+    writer = result['writer']
+    print(f"writer         : written {writer['written']}, dropped {writer['dropped']}, "
+          f"max depth {writer['max_depth']}, avg {writer['avg_write_ms']:.3f} ms")
+    if result['reconnects']:
+        print(f"reconnects     : {result['reconnects']} (최대 복구 시간 {result['recover_max_ms']:.0f} ms)")
+    print_histogram('parse -> GUI queue', result.pop('_latencies'))
+    return result
+
+
+if __name__ == '__main__':
+    main()
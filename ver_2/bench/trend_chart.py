@@ -0,0 +1,90 @@
+# bench/trend_chart.py
+# 실시간 추이 그래프 비용: 링 버퍼 추가 + LiveTrendChart.refresh (Qt offscreen 플랫폼 사용)
+#
+#   python bench/trend_chart.py [--capacity 86400] [--refreshes 20]
+#
+# 버퍼가 1시간 분량일 때, 가득 찼을 때, 두 바퀴 돈 뒤의 refresh 시간을 비교하여
+# 실행 시간이 길어져도 메모리와 갱신 비용이 늘지 않는지 확인합니다.
+
+import argparse
+import os
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+
+import _common
+from _common import Timer, summarize
+from live_chart import LiveTrendChart, make_trend_buffer
+
+_app = None
+
+
+def _fill(buffer, count, start, rng):
+    for i in range(count):
+        buffer.append(start + i, (1013.25 + rng.normal(0, 0.5), 1015.1 + rng.normal(0, 0.5),
+                                  45.0 + rng.normal(0, 2.0)))
+    return start + count
+
+
+def _refresh_ms(chart, refreshes):
+    values = []
+    for _ in range(refreshes):
+        with Timer() as timer:
+            chart.refresh()
+            chart.graphics.grab()  # 실제 그리기까지 포함
+        values.append(timer.elapsed * 1000.0)
+    return summarize(values)['p50_ms']
+
+
+def run(capacity=86400, refreshes=20):
+    global _app
+    from PyQt5.QtWidgets import QApplication
+    _app = QApplication.instance() or QApplication([])
+
+    rng = np.random.default_rng(0)
+    buffer = make_trend_buffer(capacity)
+    chart = LiveTrendChart()
+    chart.resize(600, 300)
+    chart.show()
+    chart.combo_span.setCurrentIndex(len(chart.combo_span) - 1)  # 전체 구간 표시
+    chart.set_buffer(buffer)
+
+    t = time.time() - 2 * capacity
+    hour = min(3600, capacity)
+    with Timer() as append_timer:
+        t = _fill(buffer, hour, t, rng)
+    result = {
+        'capacity': capacity,
+        'buffer_bytes': buffer._time.nbytes + buffer._data.nbytes,
+        'append_us': append_timer.elapsed / hour * 1e6,
+        'refresh_1h_ms': _refresh_ms(chart, refreshes),
+    }
+    t = _fill(buffer, capacity - hour, t, rng)
+    result['refresh_full_ms'] = _refresh_ms(chart, refreshes)
+    _fill(buffer, capacity, t, rng)
+    result['refresh_wrapped_ms'] = _refresh_ms(chart, refreshes)
+    result['buffer_bytes_wrapped'] = buffer._time.nbytes + buffer._data.nbytes
+    chart.close()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='실시간 추이 그래프 갱신 비용 (offscreen)')
+    parser.add_argument('--capacity', type=int, default=86400)
+    parser.add_argument('--refreshes', type=int, default=20)
+    args = parser.parse_args()
+
+    result = run(args.capacity, args.refreshes)
+    print(f"buffer          : {result['capacity']} points, {result['buffer_bytes'] / 1e6:.2f} MB "
+          f"(wrapped {result['buffer_bytes_wrapped'] / 1e6:.2f} MB)")
+    print(f"append          : {result['append_us']:.2f} us/point")
+    print(f"refresh (1 h)   : {result['refresh_1h_ms']:.2f} ms")
+    print(f"refresh (full)  : {result['refresh_full_ms']:.2f} ms")
+    print(f"refresh (wrap)  : {result['refresh_wrapped_ms']:.2f} ms")
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -1,46 +1,152 @@
 import math
 
+import numpy as np
+
+# 온도별 계수 메모의 최대 크기 (넘으면 비움)
+FACTOR_CACHE_SIZE = 4096
+
+
 class Calculator:
     def __init__(self, hs=0.0, hr=0.0):
-        self.hs = hs  # HS 값
-        self.hr = hr  # HR 값
+        self._hs = hs  # HS 값
+        self._hr = hr  # HR 값
         # print(f"HS: {self.hs}, HR: {self.hr}")
         self.L = 0.0065  # 기온 감율(K/m)
         self.T0 = 288.15  # 표준 온도(K)
         self.g = 9.80665  # 중력 가속도(m/s^2)
         self.R = 287.05  # 기체 상수(J/(kg·K))
         self.b = 0.0086  # 기체 상수(J/(kg·K))  
-    
-    def calculate(self, pressure, temperature):
-        """QFE, QNH 및 QFF를 계산하는 함수"""
-        
-        # 1. QFE 계산
-        exponent_qfe = self.hs / (7996 + 0.0086 * self.hs + 29.33 * temperature)
-        qfe = pressure * math.exp(exponent_qfe)
+        self._build_evaluator()
+
+    @property
+    def hs(self):
+        return self._hs
+
+    @hs.setter
+    def hs(self, value):
+        self._hs = value
+        self._build_evaluator()
 
-        # 2. 온도를 켈빈으로 변환
-        temp_k = temperature + 273.15
+    @property
+    def hr(self):
+        return self._hr
+
+    @hr.setter
+    def hr(self, value):
+        self._hr = value
+        self._build_evaluator()
+
+    def _build_evaluator(self):
+        """
+        HS/HR에만 의존하는 항을 미리 계산해 두고, 이를 캡처한 계산 함수를 만듭니다.
+        원래 식과 연산 순서가 같으므로 결과도 비트 단위로 동일합니다.
+        """
+        hs = self._hs
+        hr = self._hr
 
         # 상수 정의
         c = 0.00325  # °C/m 상수
-        
-        # d 값 계산
-        d = 0.19025 * (math.log(qfe / 1013.2315))
-        
-        # 지수 계산
-        exponent = (0.03416 * self.hr * (1 - d)) / (288.2 + c * self.hr)
-        
-        # QNH 계산
-        qnh = qfe * math.exp(exponent)
-        
-        # 4. QFF 계산 (온도와 습도 기반)
         b = 0.0086  # °C/m 상수
 
-        # 지수 계산
-        exponent = self.hr / (7996 + b * self.hr + 29.33 * temperature)
-        
+        # HS/HR에만 의존하는 항
+        self._qfe_base = qfe_base = 7996 + 0.0086 * hs
+        self._qff_base = qff_base = 7996 + b * hr
+        self._qnh_numerator = qnh_numerator = 0.03416 * hr
+        self._qnh_denominator = qnh_denominator = 288.2 + c * hr
+
+        exp = math.exp
+        log = math.log
+        floor = math.floor
+        # 온도 -> (QFE 계수, QFF 계수) 메모. 센서 온도는 보통 0.1 단위라 같은 값이 반복됩니다.
+        factors = {}
+        # 직전 (기압, 온도, 결과). 습도계 데이터로 계산할 때는 기압계 값이 그대로인 경우가 많습니다.
+        # 포트별 수신 스레드가 동시에 호출하므로 한 번에 바꾸는 불변 튜플로 보관합니다.
+        last = (None, None, None)
+
+        def round2(value):
+            """round(value, 2)와 같은 결과를 더 빠르게 구함 (반올림 경계 근처만 내장 round 사용)"""
+            try:
+                scaled = value * 100.0
+                whole = floor(scaled)
+            except (ValueError, OverflowError):
+                return round(value, 2)
+            frac = scaled - whole
+            if -1e-6 < frac - 0.5 < 1e-6:
+                return round(value, 2)
+            return (whole + 1 if frac > 0.5 else whole) / 100.0
+
+        def evaluate(pressure, temperature):
+            nonlocal last
+            last_pressure, last_temperature, last_result = last
+            if pressure == last_pressure and temperature == last_temperature:
+                return last_result
+
+            factor = factors.get(temperature)
+            if factor is None:
+                if len(factors) >= FACTOR_CACHE_SIZE:
+                    factors.clear()
+                factor = (
+                    exp(hs / (qfe_base + 29.33 * temperature)),
+                    exp(hr / (qff_base + 29.33 * temperature))
+                )
+                factors[temperature] = factor
+
+            # 1. QFE 계산
+            qfe = pressure * factor[0]
+
+            # d 값 및 지수 계산 후 QNH 계산
+            d = 0.19025 * (log(qfe / 1013.2315))
+            qnh = qfe * exp((qnh_numerator * (1 - d)) / qnh_denominator)
+
+            # QFF 계산
+            qff = qfe * factor[1]
+
+            # 결과 반환 (QNH, QFE, QFF)
+            result = (round2(qnh), round2(qfe), round2(qff))
+            last = (pressure, temperature, result)
+            return result
+
+        self._evaluate = evaluate
+
+    def calculate(self, pressure, temperature):
+        """QFE, QNH 및 QFF를 계산하는 함수"""
+        return self._evaluate(pressure, temperature)
+
+    def calculate_batch(self, pressures, temperatures):
+        """
+        QNH, QFE, QFF를 NumPy 배열로 한 번에 계산하는 함수.
+        calculate()와 같은 연산 순서를 사용하며, 반올림 결과도 calculate()와 동일합니다.
+        """
+        pressures, temperatures = np.broadcast_arrays(
+            np.asarray(pressures, dtype=np.float64),
+            np.asarray(temperatures, dtype=np.float64)
+        )
+
+        # 1. QFE 계산
+        exponent_qfe = self._hs / (self._qfe_base + 29.33 * temperatures)
+        qfe = pressures * np.exp(exponent_qfe)
+
+        # d 값 및 지수 계산 후 QNH 계산
+        d = 0.19025 * np.log(qfe / 1013.2315)
+        exponent = (self._qnh_numerator * (1 - d)) / self._qnh_denominator
+        qnh = qfe * np.exp(exponent)
+
         # QFF 계산
-        qff = qfe * math.exp(exponent)
-        
-        # 결과 반환 (QFE, QNH, QFF)
-        return round(qnh, 2), round(qfe, 2), round(qff, 2)
+        exponent = self._hr / (self._qff_base + 29.33 * temperatures)
+        qff = qfe * np.exp(exponent)
+
+        results = [np.round(qnh, 2), np.round(qfe, 2), np.round(qff, 2)]
+
+        # np.exp/np.log는 math 모듈과 마지막 자리(ulp)가 다를 수 있어, 반올림 경계(x.xx5)에
+        # 아주 가까운 값만 스칼라 경로로 다시 계산해 calculate()와 결과를 맞춥니다.
+        near_tie = np.zeros(pressures.shape, dtype=bool)
+        for value in (qnh, qfe, qff):
+            scaled = value * 100
+            near_tie |= np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+        for index in zip(*np.nonzero(near_tie)):
+            exact = self.calculate(float(pressures[index]), float(temperatures[index]))
+            for result, value in zip(results, exact):
+                result[index] = value
+
+        # 결과 반환 (QNH, QFE, QFF)
+        return tuple(results)
@@ -0,0 +1,101 @@
+# capture.py
+#
+# 시리얼 수신 원본(raw bytes) 기록 및 재생.
+#
+# 파일 형식 (little-endian)
+#   헤더: MAGIC (8바이트)
+#   레코드: 수신 시각 float64 (epoch 초) | 센서 코드 uint8 | 길이 uint16 | 원본 줄 bytes
+#
+# 센서 코드는 columnar_archive.SENSOR_CODES를 따르며, 실제 센서 없이도
+# replay()로 파싱 → 계산 → 저장 경로를 그대로 다시 실행할 수 있습니다.
+
+import struct
+import threading
+import time
+import logging
+
+from columnar_archive import SENSOR_CODES, SENSOR_NAMES
+
+MAGIC = b'SICAP\x00\x00\x01'
+RECORD = struct.Struct('<dBH')
+MAX_LINE = 0xFFFF  # 길이 필드(uint16)로 나타낼 수 있는 최대 길이
+
+
+class CaptureWriter:
+    """수신 스레드들이 공유하는 기록 파일 (센서별 스레드에서 동시에 호출됨)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, mode='ab')
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        logging.info(f"수신 원본을 기록합니다: {path}")
+
+    def write(self, sensor_name, raw_line, timestamp=None):
+        """한 줄 기록. MAX_LINE보다 긴 줄은 잘라서 기록합니다."""
+        if len(raw_line) > MAX_LINE:
+            raw_line = raw_line[:MAX_LINE]
+        if timestamp is None:
+            timestamp = time.time()
+        record = RECORD.pack(timestamp, SENSOR_CODES.get(sensor_name, 0), len(raw_line)) + raw_line
+        with self._lock:
+            if self._file is not None:
+                self._file.write(record)
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_capture(path):
+    """기록 파일의 (수신 시각, 센서 이름, 원본 줄)을 순서대로 반환 (끝이 잘린 레코드는 무시)"""
+    with open(path, mode='rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"수신 기록 파일 형식이 아닙니다: {path}")
+        while True:
+            header = f.read(RECORD.size)
+            if len(header) < RECORD.size:
+                break
+            timestamp, code, length = RECORD.unpack(header)
+            raw_line = f.read(length)
+            if len(raw_line) < length:
+                break
+            yield timestamp, SENSOR_NAMES.get(code, ''), raw_line
+
+
+def replay(path, receiver, speed=1.0, stop_event=None):
+    """
+    기록 파일을 receiver.handle_line()으로 다시 흘려보냅니다.
+    speed: 1.0이면 기록된 간격 그대로, 2.0이면 두 배 빠르게, 0이면 대기 없이 최대 속도
+    반환값: 재생한 줄 수
+    """
+    count = 0
+    first = None
+    started = time.perf_counter()
+    for timestamp, sensor_name, raw_line in read_capture(path):
+        if stop_event is not None and stop_event.is_set():
+            break
+        if speed > 0:
+            if first is None:
+                first = timestamp
+            delay = (timestamp - first) / speed - (time.perf_counter() - started)
+            if delay > 0:
+                if stop_event is not None:
+                    if stop_event.wait(delay):
+                        break
+                else:
+                    time.sleep(delay)
+        try:
+            receiver.handle_line(sensor_name, raw_line)
+        except Exception as e:
+            logging.error(f"{sensor_name} 재생 중 오류 발생: {e}")
+        count += 1
+    return count
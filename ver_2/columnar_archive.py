@@ -0,0 +1,176 @@
+# columnar_archive.py
+#
+# 마감된 날짜의 CSV를 열(column)별 .npy 파일로 변환한 바이너리 보관 형식.
+#
+#   C:\Sitech\data\2024-10\2024-10-23.csv          <- 기존 CSV (그대로 유지, 아래 참고)
+#   C:\Sitech\data\2024-10\2024-10-23.cols\        <- 열별 보관 디렉토리
+#       timestamp.npy   int64   epoch 밀리초 (시간순 정렬)
+#       sensor.npy      uint8   SENSOR_CODES 참조
+#       pressure.npy    float32 (값이 없으면 NaN)
+#       ...
+#
+# 각 파일은 np.load(mmap_mode='r')로 메모리 매핑되므로, 조회 시 필요한 열만
+# 디스크에서 읽고 strptime 없이 searchsorted로 시간 범위를 잘라냅니다.
+#
+# 마감된 날짜의 조회(DataStorage.load_data/search_data, 그래프)는 모두 보관본을 읽습니다.
+# CSV는 원본으로 남겨 둡니다: 현장에서 엑셀로 직접 열어 보고, 자정 뒤에 늦게 온 행의 추가와
+# recompute.py의 재계산, 집계 재생성이 CSV를 고친 뒤 보관본을 다시 만드는 방식이기 때문입니다.
+# (보관본은 값마다 float32 고정 폭이라 CSV의 절반 정도 크기)
+# CSV가 보관본보다 새로우면(is_current가 False) 다시 변환할 때까지 CSV를 읽습니다.
+
+import os
+import csv
+import shutil
+import logging
+from datetime import datetime, timezone
+
+import numpy as np
+
+# 센서 이름 <-> 코드
+SENSOR_CODES = {'기압계': 1, '습도계': 2, '계산값': 3}
+SENSOR_NAMES = {code: name for name, code in SENSOR_CODES.items()}
+
+# 값 열 (float32)
+VALUE_FIELDS = [
+    'pressure',
+    'temperature_barometer',
+    'temperature_humidity',
+    'humidity',
+    'QNH',
+    'QFE',
+    'QFF'
+]
+
+
+def archive_dir(csv_path):
+    """CSV 파일에 대응하는 열별 보관 디렉토리 경로"""
+    return os.path.splitext(csv_path)[0] + '.cols'
+
+
+def has_archive(csv_path):
+    return os.path.isdir(archive_dir(csv_path))
+
+
+def is_current(csv_path):
+    """보관본이 있고 CSV가 그 뒤로 바뀌지 않았는지 (늦게 온 행이나 재계산 후 다시 변환하기 전이면 False)"""
+    target_dir = archive_dir(csv_path)
+    try:
+        archived = os.path.getmtime(target_dir)
+    except OSError:
+        return False
+    try:
+        return archived >= os.path.getmtime(csv_path)
+    except OSError:
+        return True  # CSV 없이 보관본만 있는 경우
+
+
+def to_epoch_ms(dt):
+    """naive 로컬 datetime -> epoch 밀리초"""
+    return round(dt.timestamp() * 1000)
+
+
+def epoch_ms_to_local(epoch_ms):
+    """epoch 밀리초 배열 -> 로컬 시간 datetime64[ms] 배열 (pandas 변환 없이)"""
+    epoch_ms = np.asarray(epoch_ms, dtype=np.int64)
+    if epoch_ms.size == 0:
+        return epoch_ms.astype('datetime64[ms]')
+    # 하루 단위 파일이므로 첫 값 기준의 UTC 오프셋을 사용
+    first = int(epoch_ms[0]) / 1000.0
+    offset = datetime.fromtimestamp(first) - datetime.fromtimestamp(first, timezone.utc).replace(tzinfo=None)
+    offset_ms = int(offset.total_seconds() * 1000)
+    return (epoch_ms + offset_ms).astype('datetime64[ms]')
+
+
+def format_rows(columns):
+    """
+    load_columns 결과를 CSV를 csv.DictReader로 읽은 것과 같은 행(dict) 목록으로 변환
+    (행마다 datetime/repr을 호출하지 않고 열 단위로 문자열을 만듦)
+    """
+    # 'YYYY-MM-DDTHH:MM:SS.fff' -> 'T' 자리만 공백으로 바꿈
+    timestamps = np.datetime_as_string(epoch_ms_to_local(columns['timestamp']), unit='ms').astype('U23')
+    if len(timestamps):
+        timestamps.view('U1').reshape(len(timestamps), 23)[:, 10] = ' '
+    names = ['timestamp', 'sensor']
+    values = [timestamps.tolist(), [SENSOR_NAMES.get(code, '') for code in columns['sensor'].tolist()]]
+    for field in VALUE_FIELDS:
+        if field not in columns:
+            continue
+        # float32 -> 원래 CSV 표기(소수점 둘째 자리 이하)로 복원, NaN은 빈 값
+        # 하루 안의 값은 종류가 적으므로 서로 다른 값만 문자열로 바꾼 뒤 펼침
+        unique, inverse = np.unique(columns[field], return_inverse=True)
+        text = np.round(unique.astype(np.float64), 2).astype(str)
+        text[np.isnan(unique)] = ''
+        names.append(field)
+        values.append(text[inverse].tolist())
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+def convert_csv(csv_path):
+    """
+    하루치 CSV를 열별 .npy 파일로 변환합니다.
+    임시 디렉토리에 먼저 기록한 뒤 이름을 바꿔, 중간에 실패해도 반쪽짜리 보관본이 남지 않습니다.
+    """
+    timestamps = []
+    sensors = []
+    values = {field: [] for field in VALUE_FIELDS}
+    nan = float('nan')
+
+    with open(csv_path, mode='r', newline='', encoding='utf-8') as csvfile:
+        reader = csv.DictReader(csvfile)
+        for row in reader:
+            try:
+                timestamp = datetime.fromisoformat(row['timestamp'])
+            except (TypeError, ValueError):
+                continue
+            timestamps.append(round(timestamp.timestamp() * 1000))
+            sensors.append(SENSOR_CODES.get(row.get('sensor'), 0))
+            for field in VALUE_FIELDS:
+                value = row.get(field)
+                try:
+                    values[field].append(float(value) if value else nan)
+                except ValueError:
+                    values[field].append(nan)
+
+    # 시간순 정렬 (시계 보정 등으로 순서가 어긋난 행 대비)
+    timestamp_array = np.asarray(timestamps, dtype=np.int64)
+    order = np.argsort(timestamp_array, kind='stable')
+    columns = {
+        'timestamp': timestamp_array[order],
+        'sensor': np.asarray(sensors, dtype=np.uint8)[order],
+    }
+    for field in VALUE_FIELDS:
+        columns[field] = np.asarray(values[field], dtype=np.float32)[order]
+
+    target_dir = archive_dir(csv_path)
+    tmp_dir = target_dir + '.tmp'
+    if os.path.exists(tmp_dir):
+        shutil.rmtree(tmp_dir)
+    os.makedirs(tmp_dir)
+    for name, column in columns.items():
+        np.save(os.path.join(tmp_dir, name + '.npy'), column)
+    if os.path.exists(target_dir):
+        shutil.rmtree(target_dir)
+    os.replace(tmp_dir, target_dir)
+    logging.info(f"열별 보관 파일로 변환했습니다: {target_dir} ({len(order)}행)")
+    return len(order)
+
+
+def load_columns(csv_path, fields, start_ms=None, end_ms=None, sensor=None):
+    """
+    보관 디렉토리에서 timestamp와 요청한 열만 메모리 매핑으로 읽어 시간 범위로 자릅니다.
+    반환값: {'timestamp': int64 epoch ms, 'sensor': uint8, field: float32, ...}
+    """
+    base = archive_dir(csv_path)
+    timestamps = np.load(os.path.join(base, 'timestamp.npy'), mmap_mode='r')
+    lo = 0 if start_ms is None else int(np.searchsorted(timestamps, start_ms, side='left'))
+    hi = len(timestamps) if end_ms is None else int(np.searchsorted(timestamps, end_ms, side='right'))
+
+    result = {'timestamp': timestamps[lo:hi]}
+    names = ['sensor'] + [field for field in fields if field in VALUE_FIELDS]
+    for name in names:
+        result[name] = np.load(os.path.join(base, name + '.npy'), mmap_mode='r')[lo:hi]
+
+    if sensor is not None:
+        mask = result['sensor'] == SENSOR_CODES.get(sensor, 0)
+        result = {name: column[mask] for name, column in result.items()}
+    return result
@@ -1,5 +1,6 @@
 # data_display_gui.py
 
+import io
 import sys
 import json
 from PyQt5.QtWidgets import (
@@ -13,9 +14,19 @@ import pyqtgraph as pg
 from datetime import datetime, timedelta
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+from columnar_archive import epoch_ms_to_local
+from data_storage import LOAD_WORKERS, parse_timestamps
+import rollup
+import metrics
+from metrics_panel import MetricsPanel
+from clickable_label import ClickableLabel
+from history_viewer import HistoryViewer
+from live_chart import LiveTrendChart, make_trend_buffer, trend_values, TREND_INTERVAL_MS
+from sample import Sample
 
 
 def resource_path(relative_path):
@@ -26,11 +37,11 @@ def resource_path(relative_path):
 
 
 class DataDisplayGUI(QMainWindow):
-    def __init__(self, data_queue, data_receiver, ds):
+    # 타이머 한 번에 큐에서 꺼낼 최대 메시지 수
+    MAX_MESSAGES_PER_TICK = 500
+
+    def __init__(self, data_queue, data_receiver, ds, stations=None):
         super().__init__()
-        
-        plt.rcParams['font.family'] ='Malgun Gothic'
-        plt.rcParams['axes.unicode_minus'] =False
 
         # settings.json 파일 경로 설정
         self.settings_file = os.path.join(r'C:\Sitech', 'settings.json')
@@ -43,7 +54,18 @@ class DataDisplayGUI(QMainWindow):
         self.ds = ds  # DataStorage 인스턴스 추가
         self.latest_data = {}
         self.connection_status = {}
+        # 관측소가 여럿이면 선택한 관측소의 큐/수신기/저장소를 위 속성으로 바꿔 가며 표시
+        self.stations = stations or []
+        self.station_state = {station.name: ({}, {}) for station in self.stations}  # (latest_data, connection_status)
+        if self.stations:
+            self.latest_data, self.connection_status = self.station_state[self.stations[0].name]
+        # 관측소별 실시간 추이 버퍼 (관측소가 없으면 None 하나)
+        self.trend_buffers = {name: make_trend_buffer() for name in (self.station_state or [None])}
         self.is_fullscreen = False  # 전체 화면 여부를 나타내는 플래그
+        self.metrics_panel = None  # 상태(지표) 창, 처음 열 때 생성
+        self.history_viewer = None  # 지난 데이터 그래프 창 (한 번에 하나)
+        self._metrics_snapshot = None  # 상태바 요약의 초당 건수 계산용
+        self._tick_ms = metrics.histogram('gui_tick_ms')
 
         # 초기 폰트 설정을 저장할 딕셔너리
         self.initial_fonts = {}
@@ -70,6 +92,11 @@ class DataDisplayGUI(QMainWindow):
         self.time_timer.timeout.connect(self.update_current_time)
         self.time_timer.start(1000)  # 1초마다 시간 업데이트
         
+        # 실시간 추이 그래프 타이머 설정
+        self.trend_timer = QTimer()
+        self.trend_timer.timeout.connect(self.record_trend)
+        self.trend_timer.start(TREND_INTERVAL_MS)  # 1초마다 최신값을 버퍼에 추가
+
         self.barometer_reconnect_timer = QTimer()
         self.barometer_reconnect_timer.timeout.connect(self.send_reconnect_command)
         self.barometer_reconnect_timer.start(1000)  # 1초마다 타이머 실행
@@ -84,7 +111,7 @@ class DataDisplayGUI(QMainWindow):
         self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
         
         # 창 초기 크기 설정 및 저장
-        self.resize(600, 400)
+        self.resize(600, 600)
         self.initial_geometry = self.geometry()  # 초기 창 크기를 저장합니다
         
 
@@ -96,6 +123,13 @@ class DataDisplayGUI(QMainWindow):
         self.main_layout = QVBoxLayout()
         main_widget.setLayout(self.main_layout)
 
+        # 관측소 선택 (관측소가 둘 이상일 때만 표시)
+        self.station_combo = QComboBox()
+        self.station_combo.addItems([station.name for station in self.stations])
+        self.station_combo.currentIndexChanged.connect(self.on_station_changed)
+        self.station_combo.setVisible(len(self.stations) > 1)
+        self.main_layout.addWidget(self.station_combo)
+
         # 폰트 설정
         custom_font = QFont("나눔스퀘어_ac")
 
@@ -155,6 +189,11 @@ class DataDisplayGUI(QMainWindow):
 
         self.main_layout.addLayout(grid_layout)
 
+        # 실시간 추이 그래프 (기압/QNH, 습도)
+        self.trend_chart = LiveTrendChart()
+        self.trend_chart.set_buffer(next(iter(self.trend_buffers.values())))
+        self.main_layout.addWidget(self.trend_chart, 1)
+
         # 버튼 추가
         self.button_pressure = QPushButton("기압 데이터 조회")
         self.button_pressure.setFont(custom_font)  # 폰트 설정
@@ -197,6 +236,11 @@ class DataDisplayGUI(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.current_time_label = QLabel()
         self.status_bar.addPermanentWidget(self.current_time_label)
+        # 지표 요약 (클릭하거나 F12를 누르면 상태 창 표시)
+        self.metrics_label = ClickableLabel()
+        self.metrics_label.setToolTip("클릭하면 상태 창을 엽니다 (F12)")
+        self.metrics_label.clicked.connect(self.show_metrics_panel)
+        self.status_bar.addWidget(self.metrics_label)
         self.update_current_time()  # 초기 시간 설정
 
         # 객체명 설정 (스타일시트에서 사용하기 위해)
@@ -370,78 +414,175 @@ class DataDisplayGUI(QMainWindow):
         current_time = QDateTime.currentDateTime().toString("yyyy-MM-dd hh:mm:ss")
         self.current_time_label.setText(current_time)
         self.current_time_label.setFont(QFont("나눔스퀘어_ac ExtraBold", 20))
+        self.update_metrics_summary()
+
+    def update_metrics_summary(self):
+        """상태바의 지표 요약 갱신 (1초마다)"""
+        snapshot = metrics.snapshot(self._metrics_snapshot)
+        self._metrics_snapshot = snapshot
+        self.metrics_label.setText(MetricsPanel.summary_text(snapshot))
+
+    def show_metrics_panel(self):
+        if self.metrics_panel is None:
+            self.metrics_panel = MetricsPanel(self)
+        self.metrics_panel.show()
+        self.metrics_panel.raise_()
 
     def update_data(self):
-        # 데이터 큐에서 데이터 가져오기
-        while not self.data_queue.empty():
-            data = self.data_queue.get()
+        # 타이머 한 번에 최대 MAX_MESSAGES_PER_TICK개만 꺼내고, 센서별로 가장 최신 데이터만 반영
+        start = time.perf_counter()
+        pending = {}
+        changed = False
+        for _ in range(self.MAX_MESSAGES_PER_TICK):
+            try:
+                data = self.data_queue.get_nowait()
+            except Empty:
+                break
             # print("[update_data] dequeued data:", data)
-            self.handle_new_data(data)
-            
+            if not isinstance(data, Sample):
+                # 포트 상태 메시지(dict)는 순서대로 바로 처리 (앞서 받은 같은 센서 데이터는 버림)
+                pending.pop(data.get('sensor'), None)
+                changed |= self.handle_new_data(data, refresh=False)
+            else:
+                pending[data.sensor] = data
+
+        for data in pending.values():
+            changed |= self.handle_new_data(data, refresh=False)
+
+        # 화면 갱신은 틱당 한 번만
+        if changed:
+            self.update_display()
+
+        # 선택되지 않은 관측소의 큐도 비움
+        backlog = not self.data_queue.empty()
+        if len(self.stations) > 1:
+            backlog |= self.drain_background_stations()
+
+        # 밀린 메시지가 남아 있으면 이벤트 루프에 양보한 뒤 이어서 처리 (UI가 멈추지 않도록)
+        if backlog:
+            QTimer.singleShot(0, self.update_data)
+
+        self._tick_ms.observe((time.perf_counter() - start) * 1000.0)
 
-    def handle_new_data(self, data):
+    def drain_background_stations(self):
+        """
+        선택되지 않은 관측소의 큐에서 센서별 최신값만 보관 (화면 갱신 없음, 선택하면 바로 표시).
+        반환값: 아직 비우지 못한 큐가 있는지 여부
+        """
+        now = datetime.now()
+        backlog = False
+        for station in self.stations:
+            if station.data_queue is None or station.data_queue is self.data_queue:
+                continue
+            latest_data, connection_status = self.station_state[station.name]
+            for _ in range(self.MAX_MESSAGES_PER_TICK):
+                try:
+                    data = station.data_queue.get_nowait()
+                except Empty:
+                    break
+                if isinstance(data, Sample):
+                    latest_data[data.sensor] = data
+                    connection_status[data.sensor] = now
+                elif data.get('status') == 'port_disconnected':
+                    latest_data.pop(data.get('sensor'), None)
+                    connection_status.pop(data.get('sensor'), None)
+            backlog |= not station.data_queue.empty()
+        return backlog
+
+    def record_trend(self):
+        """센서별 최신값을 관측소마다 추이 버퍼에 추가하고 보이는 그래프를 갱신 (1초마다)"""
+        now = time.time()
+        current = datetime.now()
+        if self.stations:
+            states = self.station_state.items()
+        else:
+            states = [(None, (self.latest_data, self.connection_status))]
+        for name, (latest_data, connection_status) in states:
+            self.trend_buffers[name].append(now, trend_values(latest_data, connection_status, current))
+        self.trend_chart.refresh()
+
+    def on_station_changed(self, index):
+        """표시할 관측소 변경: 큐/수신기/저장소와 최신값을 그 관측소 것으로 교체"""
+        if index < 0 or index >= len(self.stations):
+            return
+        station = self.stations[index]
+        self.data_queue = station.data_queue
+        self.data_receiver = station.receiver
+        self.ds = station.storage
+        self.latest_data, self.connection_status = self.station_state[station.name]
+        self.trend_chart.set_buffer(self.trend_buffers[station.name])
+        self.setWindowTitle(f"실황 정보 - {station.name}")
+        self.update_display()
+
+    def handle_new_data(self, data, refresh=True):
         """
         큐에서 전달된 데이터(센서 측정값, 포트 상태 등)를 받아,
         최신 데이터로 갱신하고 UI를 업데이트하는 함수.
+        refresh=False이면 화면 갱신은 호출한 쪽에서 한 번에 수행합니다.
+        반환값: 최신 데이터가 바뀌어 화면 갱신이 필요한지 여부
         """
 
-        # 1) sensor와 timestamp, status를 꺼냄
-        sensor = data.get('sensor')
-        status = data.get('status', 'valid')  # default: 'valid'
-        new_ts_str = data.get('timestamp')    # 새로 들어온 데이터의 타임스탬프 (문자열)
+        # 1) 포트 상태 메시지(dict)인 경우
+        if not isinstance(data, Sample):
+            # 'port_disconnected' 상태라면 바로 처리
+            if data.get('status') == 'port_disconnected' and data.get('sensor') in ('기압계', '습도계', '계산값'):
+                # 예: 포트가 해제된 경우 즉시 '-' 표시, 이전 데이터 삭제
+                self.disconnect_sensor_immediately(data.get('sensor'))
+            return False
+
+        # 2) 측정값(Sample)에서 sensor와 timestamp를 꺼냄
+        sensor = data.sensor
+        new_ts = data.timestamp    # 새로 들어온 데이터의 타임스탬프 (epoch 초)
 
         # sensor가 없거나, 우리가 관심 없는 센서면 무시
         if sensor not in ('기압계', '습도계','계산값'):
-            return
-
-        # 2) 만약 'port_disconnected' 같 상태라면, 바로 처리
-        if status == 'port_disconnected':
-            # 예: 포트가 해제된 경우 즉시 '-' 표시, 이전 데이터 삭제
-            self.disconnect_sensor_immediately(sensor)
-            return
+            return False
 
         # 3) 정상 or 기타 상태의 데이터인 경우 → 이전 데이터와 타임스탬프 비교
         old_data = self.latest_data.get(sensor)
-        old_ts_str = old_data.get('timestamp') if old_data else None
+        old_ts = old_data.timestamp if old_data else None
 
         # (A) 새 데이터에 timestamp가 없는 경우 → 그냥 로그 찍고 반환할 수도 있음
-        if not new_ts_str:
+        if new_ts is None:
             # timestamp 자체가 없으면, 일단 저장을 안 하거나 default로 처리
             logging.warning(f"New data for {sensor} has no timestamp! Data={data}")
-            return
+            return False
 
         # (B) 이전 데이터의 timestamp가 없는 경우 → (최초 데이터, 혹은 None)
-        if not old_ts_str:
+        if old_ts is None:
             # 이전 데이터가 없었거나 timestamp가 없었다면,
             # 그냥 '새 데이터'를 받아들이고 진행
             self.latest_data[sensor] = data
             self.connection_status[sensor] = datetime.now()
             # UI 업데이트
-            self.update_display()
-            return
+            if refresh:
+                self.update_display()
+            return True
 
-        # (C) 이제 둘 다 문자열이라면 strptime으로 비교 가능
+        # (C) 숫자 비교 (밀리초 이하 정밀도이므로 같은 초 안의 데이터도 구분됨)
+        #     둘 다 단조 시계 값이 있으면 그것으로 비교 (시스템 시계 보정 영향 없음)
         try:
-            new_ts = datetime.strptime(new_ts_str, '%Y-%m-%d %H:%M:%S')
-            old_ts = datetime.strptime(old_ts_str, '%Y-%m-%d %H:%M:%S')
-        except (ValueError, TypeError) as e:
-            # 만약 파싱 실패하면 -> 로그 찍고 그냥 새 데이터로 덮어쓸 수도 있음
-            logging.error(f"Timestamp parse error: {e}, new_ts={new_ts_str}, old_ts={old_ts_str}")
-            self.latest_data[sensor] = data
-            self.connection_status[sensor] = datetime.now()
-            self.update_display()
-            return
-
-        # (D) 타임스탬프 비교
-        if new_ts <= old_ts:
+            if data.monotonic is not None and old_data.monotonic is not None:
+                is_newer = data.monotonic > old_data.monotonic
+            else:
+                is_newer = new_ts > old_ts
+        except TypeError as e:
+            # 형식이 다른 타임스탬프끼리는 비교 불가 -> 로그 찍고 새 데이터로 덮어씀
+            logging.error(f"Timestamp compare error: {e}, new_ts={new_ts}, old_ts={old_ts}")
+            is_newer = True
+
+        # (D) 타임스탬프 비교 결과 반영
+        if not is_newer:
             # 더 과거 데이터라면 무시하거나 로그만 찍음
-            # logging.info(f"Ignored old (or same) data for {sensor}. old_ts={old_ts_str}, new_ts={new_ts_str}")
-            return
+            # logging.info(f"Ignored old (or same) data for {sensor}. old_ts={old_ts}, new_ts={new_ts}")
+            return False
         else:
             # 정말 '새로운' 데이터이므로 업데이트
             self.latest_data[sensor] = data
             self.connection_status[sensor] = datetime.now()
-            self.update_display()
+            if refresh:
+                self.update_display()
+            return True
  
     def disconnect_sensor_immediately(self, sensor):
         """
@@ -487,31 +628,31 @@ class DataDisplayGUI(QMainWindow):
                 return default
                 
         # 최신 데이터 가져오기
-        calc_data = self.latest_data.get('계산값', {})
-        barometer_data = self.latest_data.get('기압계', {})
-        humidity_data = self.latest_data.get('습도계', {})
+        calc_data = self.latest_data.get('계산값')
+        barometer_data = self.latest_data.get('기압계')
+        humidity_data = self.latest_data.get('습도계')
 
         # --- 1) 기압계 온도(temperature_barometer) ---
-        barometer_temp = barometer_data.get('temperature_barometer')
+        barometer_temp = barometer_data.temperature_barometer if barometer_data else None
         # 헬퍼 함수로 2자리 소수점 변환
         self.value_temperature_barometer.setText(format_float(barometer_temp))
 
         # --- 2) 기압계 기압(pressure) ---
-        barometer_pressure = barometer_data.get('pressure')
+        barometer_pressure = barometer_data.pressure if barometer_data else None
         self.value_pressure.setText(format_float(barometer_pressure))
 
         # --- 3) 습도계 온도(temperature_humidity) ---
-        humidity_temp = humidity_data.get('temperature_humidity')
+        humidity_temp = humidity_data.temperature_humidity if humidity_data else None
         self.value_temperature_humidity.setText(format_float(humidity_temp))
 
         # --- 4) 습도(humidity) ---
-        humidity = humidity_data.get('humidity')
+        humidity = humidity_data.humidity if humidity_data else None
         self.value_humidity.setText(format_float(humidity))
 
         # --- 5) QNH, QFE, QFF (단위 변환 후 소수점 2자리) ---
-        qnh = calc_data.get('QNH')  
-        qfe = calc_data.get('QFE')  
-        qff = calc_data.get('QFF')  
+        qnh = calc_data.QNH if calc_data else None
+        qfe = calc_data.QFE if calc_data else None
+        qff = calc_data.QFF if calc_data else None
 
         if qnh is not None:
             qnh_converted = self.convert_unit(qnh, self.qnh_unit)  
@@ -730,133 +871,137 @@ class DataDisplayGUI(QMainWindow):
         self.load_and_plot_data(selected_data_types, start_datetime, end_datetime)
 
     def load_and_plot_data(self, data_types, start_datetime, end_datetime):
-        # CSV 파일에서 데이터 로드
-        data_list = self.load_data_from_csv(data_types, start_datetime, end_datetime)
-
-        if data_list is not None:
-            df = pd.DataFrame(data_list)
-            #데이터 보간 처리
-            df = df.set_index('timestamp').resample('T').mean().interpolate().reset_index()
-            
-            self.plot_data(df, data_types)
-        else:
-            QMessageBox.information(self, "정보", "선택한 기간에 데이터가 없습니다.")
+        # 새 조회를 시작하면 이전 그래프 창의 조회는 취소하고 창을 교체
+        if self.history_viewer is not None:
+            self.history_viewer.close()
+
+        # 조회는 작업 스레드에서 하루씩 진행되고, 그동안 실황 화면은 계속 갱신됨
+        # (저장소는 조회를 시작한 관측소 것으로 고정)
+        ds = self.ds
+        loader = lambda *args, **kwargs: self.load_history(*args, ds=ds, **kwargs)
+        viewer = HistoryViewer(loader, data_types, self)
+        viewer.setAttribute(Qt.WA_DeleteOnClose)
+        viewer.finished.connect(lambda: setattr(self, 'history_viewer', None))
+        self.history_viewer = viewer
+        viewer.show_range(start_datetime, end_datetime)
+        viewer.show()
+
+    def load_history(self, data_types, start_datetime, end_datetime, tier=None,
+                     on_day=None, cancelled=None, ds=None):
+        """
+        그래프용 데이터 조회: tier가 있으면 집계(min/mean/max), 없거나 집계가 없으면 원본.
+        on_day(읽은 날 수, 전체 날 수, 그날 DataFrame 또는 None, 단계): 하루를 읽을 때마다 호출
+        (작업 스레드에서 호출되므로 화면은 건드리지 않음)
+        반환값: (DataFrame 또는 None, 실제 사용한 단계)
+        """
+        ds = ds or self.ds
+        if tier is not None:
+            report = None if on_day is None else (lambda done, total, day: on_day(done, total, day, tier))
+            df = ds.load_rollup(tier, data_types, start_datetime, end_datetime,
+                                on_day=report, cancelled=cancelled)
+            if df is not None or (cancelled is not None and cancelled.is_set()):
+                return df, tier
 
-    def load_data_from_csv(self, data_types, start_datetime, end_datetime):
+        # CSV 파일에서 데이터 로드
+        report = None if on_day is None else (lambda done, total, day: on_day(done, total, day, None))
+        df = self.load_data_from_csv(data_types, start_datetime, end_datetime,
+                                     on_day=report, cancelled=cancelled, ds=ds)
+        return df, None
+
+    def load_data_from_csv(self, data_types, start_datetime, end_datetime,
+                           on_day=None, cancelled=None, ds=None):
+        ds = ds or self.ds
         data_list = []
 
-        # 시작 날짜부터 종료 날짜까지 반복
-        current_date = start_datetime.date()
-        end_date = end_datetime.date()
-        delta = timedelta(days=1)
-
-        base_dir = self.ds.base_dir  # DataStorage의 데이터 저장 경로
+        # 시작 날짜부터 종료 날짜까지 하루씩 나누어 작업 스레드에서 동시에 읽음
+        start_date = start_datetime.date()
+        total = (end_datetime.date() - start_date).days + 1
+        dates = [start_date + timedelta(days=i) for i in range(total)]
 
-        while current_date <= end_date:
-            # 파일 경로 생성
-            month_str = current_date.strftime('%Y-%m')
-            date_str = current_date.strftime('%Y-%m-%d')
-            csv_file = os.path.join(base_dir, month_str, date_str + '.csv')
+        ds.flush()  # 버퍼에 남은 행을 먼저 파일에 기록
 
-            if os.path.exists(csv_file):
-                # CSV 파일 읽기
-                try:
-                    data = pd.read_csv(csv_file)
-                except Exception as e:
-                    print(f"CSV 파일을 읽는 중 오류 발생: {csv_file}, {e}")
-                    current_date += delta
-                    continue
-
-                # timestamp 열을 datetime 형식으로 변환
-                data['timestamp'] = pd.to_datetime(data['timestamp'], errors='coerce')
-
-                # 선택한 기간으로 필터링
-                data = data[(data['timestamp'] >= start_datetime) & (data['timestamp'] <= end_datetime)]
-
-                if not data.empty:
-                    # 필요한 데이터 타입만 선택
-                    columns_to_keep = ['timestamp'] + data_types
-                    data = data[columns_to_keep]
+        executor = ThreadPoolExecutor(max_workers=min(total, LOAD_WORKERS))
+        try:
+            futures = [
+                executor.submit(self.load_day_from_csv, ds, date, data_types, start_datetime, end_datetime)
+                for date in dates
+            ]
+            # 날짜 순서대로 결과를 받으므로 이어 붙이기만 하면 시간순 (전체 정렬 불필요)
+            for i, future in enumerate(futures):
+                # 취소되었으면 (새 조회 시작, 창 닫힘) 남은 날짜는 읽지 않음
+                if cancelled is not None and cancelled.is_set():
+                    return None
+                data = future.result()
+                if data is not None:
                     data_list.append(data)
-            else:
-                print(f"CSV 파일을 찾을 수 없습니다: {csv_file}")
-
-            current_date += delta
+                if on_day is not None:
+                    on_day(i + 1, total, data)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         if data_list:
             # 데이터프레임 연결
-            df = pd.concat(data_list, ignore_index=True)
-            # 시간순으로 정렬
-            df.sort_values('timestamp', inplace=True)
-            return df
+            return pd.concat(data_list, ignore_index=True)
         else:
             return None
 
-    def plot_data(self, df, data_types):
-        if df.empty:
-            QMessageBox.information(self, "정보", "데이터가 없습니다.")
-            return
+    def load_day_from_csv(self, ds, current_date, data_types, start_datetime, end_datetime):
+        """하루치 조회: timestamp와 data_types 열의 DataFrame (데이터가 없으면 None)"""
+        # 마감된 날짜는 열별 보관본(.cols)에서 필요한 열만 메모리 매핑으로 읽음
+        columns = ds.load_columns(current_date, data_types, start_datetime, end_datetime)
+        if columns is not None:
+            if not len(columns['timestamp']):
+                return None
+            data = pd.DataFrame({'timestamp': epoch_ms_to_local(columns['timestamp'])})
+            for data_type in data_types:
+                data[data_type] = columns[data_type]
+            return data
+
+        # 파일 경로 생성
+        month_str = current_date.strftime('%Y-%m')
+        date_str = current_date.strftime('%Y-%m-%d')
+        csv_file = os.path.join(ds.base_dir, month_str, date_str + '.csv')
+
+        # 시간 색인으로 조회 구간에 해당하는 행만 읽음 (파일이 없으면 None)
+        content = ds.read_csv_range(current_date, start_datetime, end_datetime)
+        if content is None:
+            print(f"CSV 파일을 찾을 수 없습니다: {csv_file}")
+            return None
 
-        # 스타일 적용
-        plt.style.use('ggplot')
+        # CSV 파일 읽기 (timestamp와 선택한 열만, 값은 float32로 바로 변환)
+        columns_to_keep = ['timestamp'] + data_types
+        dtypes = {data_type: 'float32' for data_type in data_types}
+        try:
+            try:
+                data = pd.read_csv(io.BytesIO(content), usecols=columns_to_keep, dtype=dtypes)
+            except ValueError:
+                # 숫자가 아닌 값이 섞인 파일은 추론으로 읽은 뒤 변환 (변환할 수 없는 값은 NaN)
+                data = pd.read_csv(io.BytesIO(content), usecols=columns_to_keep)
+                for data_type in data_types:
+                    data[data_type] = pd.to_numeric(data[data_type], errors='coerce').astype('float32')
+        except Exception as e:
+            print(f"CSV 파일을 읽는 중 오류 발생: {csv_file}, {e}")
+            return None
 
-        # Figure와 첫 번째 Y축 생성
-        fig, ax1 = plt.subplots(figsize=(12, 6))
+        # timestamp 열을 datetime 형식으로 변환
+        # (밀리초가 있는 형식과 없는 이전 형식 모두 고정 형식으로 빠르게 변환)
+        data['timestamp'] = parse_timestamps(data['timestamp'])
 
-        # X축 포맷 지정
-        ax1.set_xlabel('Timestamp')
-        
-        ax1.xaxis.set_major_locator(mdates.AutoDateLocator()) #자동으로 조정
-        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))
-        plt.xticks(rotation=45)
-        
-        # Y축 포맷 지정
-        ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'{x:.2f}'))
-
-        # 첫 번째 데이터 타입을 첫 번째 Y축에 플롯
-        color_cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
-        color_index = 0
-
-        y_axes = [ax1]
-        lines = []
-        labels = []
-
-        first_data_type = data_types[0]
-        ax = ax1
-        color = color_cycle[color_index % len(color_cycle)]
-        line, = ax.plot(df['timestamp'], df[first_data_type], label=first_data_type, linestyle='-', color=color)
-        lines.append(line)
-        labels.append(first_data_type)
-        ax.set_ylabel(first_data_type, color=color)
-        ax.tick_params(axis='y', labelcolor=color)
-        color_index += 1
-
-        # 나머지 데이터 타입들을 추가 Y축에 플롯
-        for data_type in data_types[1:]:
-            ax = ax1.twinx()
-            y_axes.append(ax)
-            ax.spines['right'].set_position(('outward', 60 * (len(y_axes) - 2)))  # Y축 간격 조정
-            color = color_cycle[color_index % len(color_cycle)]
-            line, = ax.plot(df['timestamp'], df[data_type], label=data_type, linestyle='-', color=color)
-            lines.append(line)
-            labels.append(data_type)
-            ax.set_ylabel(data_type, color=color)
-            ax.tick_params(axis='y', labelcolor=color)
-            color_index += 1
-
-        # 범례 설정
-        fig.legend(lines, labels, loc='upper right', bbox_to_anchor=(1, 1), ncol=1)
-
-        # 그리드 및 레이아웃 설정
-        plt.title('데이터 그래프')
-        plt.grid(True, linestyle='--', linewidth=0.7)
-        fig.tight_layout()
-
-        plt.show()
+        # 선택한 기간으로 필터링
+        data = data[(data['timestamp'] >= start_datetime) & (data['timestamp'] <= end_datetime)]
+        if data.empty:
+            return None
+
+        # 파일은 기록 순서이므로 센서 간 시각이 살짝 엇갈린 날만 그날 안에서 정렬
+        if not data['timestamp'].is_monotonic_increasing:
+            data = data.sort_values('timestamp', kind='stable')
+        return data
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_F11:
             self.toggle_fullscreen()
+        elif event.key() == Qt.Key_F12:
+            self.show_metrics_panel()
 
     def toggle_fullscreen(self):
         if not self.is_fullscreen:
@@ -934,6 +1079,22 @@ if __name__ == "__main__":
     class DummyDataStorage:
         def __init__(self):
             self.base_dir = r'C:\Sitech\data'  # 실제 데이터 저장 경로로 변경해야 함
+
+        def flush(self):
+            pass
+
+        def load_columns(self, date, fields, start_time=None, end_time=None):
+            return None
+
+        def load_rollup(self, tier, fields, start_time, end_time, on_day=None, cancelled=None):
+            return None
+
+        def read_csv_range(self, date, start_time=None, end_time=None):
+            csv_file = os.path.join(self.base_dir, date.strftime('%Y-%m'), date.strftime('%Y-%m-%d') + '.csv')
+            if not os.path.exists(csv_file):
+                return None
+            with open(csv_file, 'rb') as f:
+                return f.read()
     ds = DummyDataStorage()
     gui = DataDisplayGUI(data_queue, data_receiver, ds)
     gui.show()
@@ -2,7 +2,6 @@
 # data_receiver.py
 
 import os
-import re
 import json
 import threading
 import serial
@@ -10,13 +9,25 @@ import logging
 from datetime import datetime
 from calculator import Calculator
 from serial_port_manager import SerialPortManager
+from sample import Sample, Sensor
+import parsers
+import metrics
+from capture import CaptureWriter
+from reconnect_supervisor import ReconnectSupervisor
 from calculator import Calculator
 from datetime import datetime
 import time
 
 class DataReceiver(threading.Thread):
-    def __init__(self, data_queue, port_settings, data_storage, hs_value, hr_value, temperature_source):
+    # 줄 끝 없이 이보다 길게 쌓이면 버림 (센서 한 줄은 수백 바이트 이내)
+    MAX_LINE_BYTES = 4096
+    # 습도계 새 값이 이보다 오래 없으면 기압계 값만으로 계산 (습도계가 멈춰도 계산값이 끊기지 않도록)
+    PAIR_TIMEOUT_S = 5.0
+
+    def __init__(self, data_queue, port_settings, data_storage, hs_value, hr_value, temperature_source,
+                 capture_path=None, station=None):
         super().__init__()
+        self.station = station  # 관측소 이름 (지표 라벨용, 기본 관측소는 None)
         self.data_queue = data_queue
         self.port_settings = port_settings
         self.data_storage = data_storage
@@ -26,9 +37,20 @@ class DataReceiver(threading.Thread):
         self.user_temperature = temperature_source if isinstance(temperature_source, float) else None  # user_temperature 초기화
         self._stop_event = threading.Event()
         self.serial_ports = {}
+        self.reader_threads = {}  # 센서별 수신 스레드
+        self._ports_lock = threading.Lock()  # 포트 교체/닫기 (수신 스레드, 재연결 스레드, stop()이 동시에 접근)
+        self._port_ready = {}  # 센서별 Event: 재연결되면 대기 중인 수신 스레드를 깨움
+        # 끊긴 포트의 재연결은 별도 스레드가 포트별 지수 백오프로 수행
+        self.supervisor = self._make_supervisor()
+        self.parsers = {}  # 센서별 파서 (포트 설정 시 한 번 선택)
+        # 수신 원본 기록 (capture.replay로 센서 없이 재생 가능)
+        self.capture = CaptureWriter(capture_path) if capture_path else None
+        self._counters = {}  # (지표 이름, 센서) -> metrics.Counter
+        metrics.gauge('queue_depth', metrics.station_label(station, 'gui'), data_queue.qsize)
         self.latest_data = {}
         self.lock = threading.Lock()
         self.calculator = Calculator(self.hs_value, self.hr_value)
+        self._calc_inputs = (None, None)  # 마지막 계산에 사용한 (기압계, 습도계) 값 (self.lock 안에서 갱신)
         self.initial_data_received = False
         
 
@@ -37,36 +59,15 @@ class DataReceiver(threading.Thread):
         self.init_serial_ports()
         
 
+    def _make_supervisor(self):
+        """재연결 스레드 생성 (재연결을 직접 처리하는 하위 클래스는 None을 반환)"""
+        return ReconnectSupervisor(self._reopen_port, station=self.station)
+
     def init_serial_ports(self):
         for sensor_name, settings in self.port_settings.items():
+            self.parsers[sensor_name] = parsers.get_parser(sensor_name)
             try:
-                # 패리티 변환
-                parity_dict = {
-                    'None': serial.PARITY_NONE,
-                    'Even': serial.PARITY_EVEN,
-                    'Odd': serial.PARITY_ODD,
-                    'Mark': serial.PARITY_MARK,
-                    'Space': serial.PARITY_SPACE
-                }
-                parity_value = parity_dict.get(settings['parity'], serial.PARITY_NONE)
-
-                # 스탑 비트 변환
-                stop_bits_dict = {
-                    1: serial.STOPBITS_ONE,
-                    1.5: serial.STOPBITS_ONE_POINT_FIVE,
-                    2: serial.STOPBITS_TWO
-                }
-                stop_bits_value = stop_bits_dict.get(settings['stop_bits'], serial.STOPBITS_ONE)
-
-                # 시리얼 포트 열기
-                ser = serial.Serial(
-                    port=settings['port'],
-                    baudrate=settings['baudrate'],
-                    bytesize=settings['data_bits'],
-                    parity=parity_value,
-                    stopbits=stop_bits_value,
-                    timeout=1
-                )
+                ser = self._open_port(settings)
                 self.serial_ports[sensor_name] = ser
                 logging.info(f"{sensor_name}의 시리얼 포트가 열렸습니다: {settings['port']}")
                 
@@ -74,135 +75,227 @@ class DataReceiver(threading.Thread):
             except Exception as e:
                 logging.error(f"{sensor_name}의 시리얼 포트를 열 수 없습니다: {e}")
 
+    def _open_port(self, settings):
+        """포트 설정으로 시리얼 포트를 엽니다. (loop:// 등 pyserial URL도 허용)"""
+        # 패리티 변환
+        parity_dict = {
+            'None': serial.PARITY_NONE,
+            'Even': serial.PARITY_EVEN,
+            'Odd': serial.PARITY_ODD,
+            'Mark': serial.PARITY_MARK,
+            'Space': serial.PARITY_SPACE
+        }
+        parity_value = parity_dict.get(settings['parity'], serial.PARITY_NONE)
+
+        # 스탑 비트 변환
+        stop_bits_dict = {
+            1: serial.STOPBITS_ONE,
+            1.5: serial.STOPBITS_ONE_POINT_FIVE,
+            2: serial.STOPBITS_TWO
+        }
+        stop_bits_value = stop_bits_dict.get(settings['stop_bits'], serial.STOPBITS_ONE)
+
+        # 시리얼 포트 열기
+        return serial.serial_for_url(
+            settings['port'],
+            baudrate=settings['baudrate'],
+            bytesize=settings['data_bits'],
+            parity=parity_value,
+            stopbits=stop_bits_value,
+            timeout=1
+        )
+
     def run(self):
         logging.info("DataReceiver 스레드가 시작되었습니다.")
-        time.sleep(0.3)  # 데이터 수신을 위한 지연 시간 추가
-        while not self._stop_event.is_set():
-            new_data_received = False  # 새로운 데이터 수신 여부를 확인하는 변수
-            barometer_received = False  # 기압계 데이터 수신 여부
-            humidity_received = False  # 습도계 데이터 수신 여부
+        # 포트마다 수신 스레드를 하나씩 띄워 readline()에서 블로킹 대기합니다.
+        # 한 줄이 완성되는 즉시 처리되므로 폴링 지연(최대 0.3초)이 없습니다.
+        self.supervisor.start()
+        for sensor_name in self.port_settings:
+            self._port_ready[sensor_name] = threading.Event()
+            reader = threading.Thread(
+                target=self._read_port,
+                args=(sensor_name,),
+                name=f"DataReceiver-{metrics.station_label(self.station, sensor_name)}",
+                daemon=True
+            )
+            self.reader_threads[sensor_name] = reader
+            reader.start()
 
-            for sensor_name, ser in self.serial_ports.items():
-                # 시리얼 포트가 None이거나 닫혀 있는 경우 재연결 시도
-                if ser is None or not ser.is_open:
+        self._stop_event.wait()
+
+        for reader in self.reader_threads.values():
+            reader.join(timeout=2)
+        self.supervisor.join(timeout=2)
+        if self.capture is not None:
+            self.capture.close()
+        logging.info("DataReceiver 스레드가 종료되었습니다.")
+
+    def _read_port(self, sensor_name):
+        """센서 하나의 포트에서 줄 단위로 블로킹 수신하는 스레드 본체"""
+        pending = b''  # timeout으로 잘린 미완성 줄
+        ready = self._port_ready[sensor_name]
+        while not self._stop_event.is_set():
+            ser = self.serial_ports.get(sensor_name)
+            # 시리얼 포트가 None이거나 닫혀 있으면 재연결을 요청하고 다시 열릴 때까지 대기
+            if ser is None or not ser.is_open:
+                pending = b''
+                ready.clear()
+                if self.supervisor.request(sensor_name):
                     logging.warning(f"{sensor_name}의 시리얼 포트가 닫혀 있습니다. 재연결 시도 중...")
-                    self.reconnect_sensor(sensor_name)
-                    continue  # 다음 센서로 넘어감
-
-                try:
-                    if ser.in_waiting > 0:
-                        data = ser.readline().decode('utf-8').strip()
-                        if data:
-                            # logging.info(f"{sensor_name}에서 데이터 수신: {data}")
-                            parsed_data = self.parse_data(sensor_name, data)
-                            if parsed_data:
-                                with self.lock:
-                                    self.latest_data[sensor_name] = parsed_data
-                                self.data_queue.put(parsed_data)
-                                self.data_storage.save_data(parsed_data)
-
-                                new_data_received = True  # 새로운 데이터가 수신되었음을 표시
-                                if sensor_name == '기압계':
-                                    barometer_received = True  # 기압계 데이터 수신
-                                elif sensor_name == '습도계':
-                                    humidity_received = True  # 습도계 데이터 수신
-
-                except serial.SerialException:
-                    logging.error(f"{sensor_name}의 시리얼 포트에서 SerialException 발생. 재연결 시도 중...")
-                    self.data_queue.put({'sensor': sensor_name, 'status': 'port_disconnected'})
-                    ser.close()
-                    self.serial_ports[sensor_name] = None  # 포트를 None으로 설정하여 재연결 시도 가능하게 함
-                    self.reconnect_sensor(sensor_name)  # 재연결 시도
-                    self.notify_gui_sensor_disconnected(sensor_name)  # GUI에 연결 해제 알림
-                except Exception as e:
-                    logging.error(f"{sensor_name}에서 데이터 수신 중 오류 발생: {e}")
-
-            time.sleep(0.3)  # CPU 사용량을 줄이기 위해 잠시 대기
-
-            # 새로운 데이터가 수신되었거나, 기압계와 습도계 데이터가 모두 수신되었을 때 계산 수행
-            if new_data_received or (barometer_received and humidity_received):
-                self.generate_calculated_data()
+                ready.wait(1.0)
+                continue
+
+            try:
+                # 줄 끝(\n)이 들어오거나 timeout(1초)이 지날 때까지 블로킹
+                chunk = ser.readline()
+            except serial.SerialException:
+                if self._stop_event.is_set():
+                    break
+                logging.error(f"{sensor_name}의 시리얼 포트에서 SerialException 발생. 재연결 시도 중...")
+                self._count('disconnects', sensor_name).inc()
+                self.data_queue.put({'sensor': sensor_name, 'status': 'port_disconnected'})
+                self._close_port(sensor_name, ser)  # 포트를 None으로 설정하여 재연결 시도 가능하게 함
+                self.notify_gui_sensor_disconnected(sensor_name)  # GUI에 연결 해제 알림
+                continue  # 다음 반복에서 재연결 요청
+            except Exception as e:
+                if self._stop_event.is_set():
+                    break
+                logging.error(f"{sensor_name}에서 데이터 수신 중 오류 발생: {e}")
+                continue
+
+            if not chunk:
+                continue
+            if not chunk.endswith(b'\n'):
+                # timeout으로 줄 중간에서 반환된 경우 다음 읽기와 이어 붙임
+                pending = self._bound_pending(sensor_name, pending + chunk)
+                continue
+
+            line, pending = pending + chunk, b''
+            self._capture(sensor_name, line)
+            try:
+                self.handle_line(sensor_name, line)
+            except Exception as e:
+                logging.error(f"{sensor_name}에서 데이터 수신 중 오류 발생: {e}")
+
+    def _bound_pending(self, sensor_name, pending):
+        """줄 끝(\n) 없이 MAX_LINE_BYTES를 넘게 쌓인 미완성 줄은 버림 (잡음이 들어오는 포트 등)"""
+        if len(pending) <= self.MAX_LINE_BYTES:
+            return pending
+        logging.warning(f"{sensor_name}에서 줄 끝 없이 {len(pending)}바이트가 들어와 버립니다.")
+        self._count('dropped_bytes', sensor_name).inc(len(pending))
+        return b''
+
+    def _capture(self, sensor_name, line):
+        """수신 원본 기록 (기록 실패가 수신을 멈추지 않도록 오류는 로그만 남김)"""
+        if self.capture is None:
+            return
+        try:
+            self.capture.write(sensor_name, line)
+        except Exception as e:
+            logging.error(f"수신 원본 기록 중 오류 발생: {e}")
+
+    def handle_line(self, sensor_name, raw_line):
+        """수신된 한 줄(bytes)을 파싱 → 큐/저장 → 계산값 생성까지 처리"""
+        self._count('lines_read', sensor_name).inc()
+        if not raw_line.strip():
+            return
+        # logging.info(f"{sensor_name}에서 데이터 수신: {raw_line}")
+        parsed_data = self.parse_data(sensor_name, raw_line)
+        if parsed_data:
+            self._count('samples', sensor_name).inc()
+            with self.lock:
+                self.latest_data[sensor_name] = parsed_data
+            self.data_queue.put(parsed_data)
+            self.data_storage.save_data(parsed_data)
+
+            # 두 센서 모두 새 값이 들어왔을 때 계산 수행 (_is_new_pair 참고)
+            self.generate_calculated_data()
 
     def parse_data(self, sensor_name, data):
-        # print(sensor_name, data)
+        """센서별 파서로 한 줄(bytes, str도 허용)을 Sample로 변환. 실패 시 None."""
+        parser = self.parsers.get(sensor_name)
+        if parser is None and sensor_name not in self.parsers:
+            # 포트 설정 없이 들어온 센서(재생 등)는 처음 한 번 선택
+            parser = self.parsers[sensor_name] = parsers.get_parser(sensor_name)
+        if parser is None:
+            logging.warning(f"알 수 없는 센서 데이터 수신: {sensor_name}")
+            return None
+        if isinstance(data, str):
+            data = data.encode('utf-8')
         try:
-            if sensor_name == '기압계':
-                # 데이터 문자열을 공백으로 분리
-                parts = data.strip().split()
-                if len(parts) >= 2:
-                    pressure = float(parts[0])
-                    temperature = float(parts[1])
-                    # print(pressure, temperature)
-                    parsed = {
-                        'sensor': '기압계',
-                        'pressure': pressure,
-                        'temperature_barometer': temperature,
-                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    }
-                    return parsed
-                else:
-                    logging.error(f"{sensor_name} 데이터 형식 오류: {data}")
-                    self.reconnect_sensor(sensor_name)  # 데이터 형식 오류 시 reconnect_sensor 호출
-                    return None
-            elif sensor_name == '습도계':
-                # 정규 표현식을 사용하여 습도와 온도 값 추출
-                humidity_match = re.search(r'RH=\s*([\d\.]+)', data)
-                temperature_match = re.search(r'T=\s*([\d\.]+)', data)
-                # print(humidity_match, temperature_match)
-                if humidity_match and temperature_match:
-                    humidity = float(humidity_match.group(1))
-                    temperature = float(temperature_match.group(1))
-                    parsed = {
-                    'sensor': '습도계',
-                    'humidity': humidity,
-                    'temperature_humidity': temperature,
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                    return parsed
-                
-                else:
-                    logging.error(f"{sensor_name} 데이터 형식 오류: {data}")
-                    return None
-            else:
-                logging.warning(f"알 수 없는 센서 데이터 수신: {sensor_name}")
-                return None
+            parsed = parser.parse(data)
         except Exception as e:
+            self._count('parse_failures', sensor_name).inc()
             logging.error(f"{sensor_name} 데이터 파싱 중 오류 발생: {e}")
             return None
+        if parsed is None:
+            # 줄 하나가 깨진 것은 포트 문제가 아니므로 재연결하지 않음 (포트 오류는 _read_port에서 처리)
+            self._count('parse_failures', sensor_name).inc()
+            logging.error(f"{sensor_name} 데이터 형식 오류: {data.decode('utf-8', 'replace').strip()}")
+        return parsed
+
+    def _count(self, name, sensor_name):
+        """센서별 카운터 (레지스트리에서는 처음 한 번만 찾음)"""
+        counter = self._counters.get((name, sensor_name))
+        if counter is None:
+            counter = self._counters[(name, sensor_name)] = metrics.counter(
+                name, metrics.station_label(self.station, sensor_name))
+        return counter
+
+    def _is_new_pair(self, barometer_data, humidity_data):
+        """
+        마지막 계산 이후 기압계와 습도계가 모두 새 값을 보냈는지 (self.lock 안에서 호출)
+        습도계가 설정되지 않았거나 PAIR_TIMEOUT_S 넘게 새 값이 없으면 기압계 새 값만으로 판단합니다.
+        """
+        last_barometer, last_humidity = self._calc_inputs
+        if barometer_data is last_barometer:
+            return False
+        if '습도계' not in self.port_settings or humidity_data is None:
+            return True
+        if humidity_data is not last_humidity:
+            return True
+        if barometer_data.monotonic is None or humidity_data.monotonic is None:
+            return True
+        return barometer_data.monotonic - humidity_data.monotonic > self.PAIR_TIMEOUT_S
 
     def generate_calculated_data(self):
         with self.lock:
             barometer_data = self.latest_data.get('기압계')
             humidity_data = self.latest_data.get('습도계')
+            if barometer_data:
+                if not self._is_new_pair(barometer_data, humidity_data):
+                    return
+                self._calc_inputs = (barometer_data, humidity_data)
 
         if barometer_data:
             try:
-                pressure = barometer_data.get('pressure')
-                temperature_barometer = barometer_data.get('temperature_barometer')
+                pressure = barometer_data.pressure
+                temperature_barometer = barometer_data.temperature_barometer
 
                 # 온도값 결정
                 if self.temperature_source == 'barometer_sensor':
                     temperature = temperature_barometer
                 elif self.temperature_source == 'humidity_sensor':
-                    temperature = humidity_data.get('temperature_humidity')
+                    temperature = humidity_data.temperature_humidity
                 else:
                     temperature = self.user_temperature
 
                 # 계산 수행
                 qnh, qfe, qff = self.calculator.calculate(pressure, temperature)
 
-                calculated_data = {
-                    'sensor': '계산값',
-                    'pressure': pressure,
-                    'temperature_barometer': temperature_barometer,
-                    'temperature_humidity': humidity_data.get('temperature_humidity') if humidity_data else None,
-                    'temperature': temperature,  # 계산에 사용된 온도값
-                    'QNH': qnh,
-                    'QFE': qfe,
-                    'QFF': qff,
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
+                calculated_data = Sample(
+                    Sensor.CALCULATED, time.time(), time.monotonic(),
+                    pressure=pressure,
+                    temperature_barometer=temperature_barometer,
+                    temperature_humidity=humidity_data.temperature_humidity if humidity_data else None,
+                    temperature=temperature,  # 계산에 사용된 온도값
+                    QNH=qnh,
+                    QFE=qfe,
+                    QFF=qff
+                )
 
+                with self.lock:  # 기압계/습도계 수신 스레드가 모두 올리는 카운터
+                    self._count('samples', Sensor.CALCULATED.value).inc()
                 self.data_queue.put(calculated_data)
                 self.data_storage.save_data(calculated_data)
                 
@@ -213,59 +306,61 @@ class DataReceiver(threading.Thread):
             
     def stop(self):
         self._stop_event.set()
-        # 시리얼 포트 닫기
-        for sensor_name, ser in self.serial_ports.items():
-            try:
-                ser.close()
-                logging.info(f"{sensor_name}의 시리얼 포트를 닫았습니다.")
-            except Exception as e:
-                logging.error(f"{sensor_name}의 시리얼 포트를 닫는 중 오류 발생: {e}")
+        self.supervisor.stop()
+        # 시리얼 포트 닫기 (블로킹 중인 readline()도 깨어남)
+        for sensor_name in list(self.serial_ports):
+            self._close_port(sensor_name)
 
-    def reconnect_sensor(self, sensor_name):
-        """센서 재연결 및 필요한 경우 명령어 전송"""
+    def _close_port(self, sensor_name, ser=None):
+        """
+        센서 포트를 목록에서 빼고 닫습니다. ser를 주면 그 포트가 아직 등록되어 있을 때만 닫습니다.
+        같은 포트를 두 스레드가 동시에 닫지 않도록 목록에서 꺼낸 쪽만 close()를 호출합니다.
+        """
+        with self._ports_lock:
+            current = self.serial_ports.get(sensor_name)
+            if current is None or (ser is not None and current is not ser):
+                return
+            self.serial_ports[sensor_name] = None
+        try:
+            current.close()
+            logging.info(f"{sensor_name}의 시리얼 포트를 닫았습니다.")
+        except Exception as e:
+            logging.error(f"{sensor_name}의 시리얼 포트를 닫는 중 오류 발생: {e}")
+
+    def _reopen_port(self, sensor_name):
+        """재연결 스레드에서 호출: 포트를 다시 열고 필요한 경우 명령어 전송. 성공하면 True."""
         settings = self.port_settings.get(sensor_name)
-        if settings:
-            try:
-                # 패리티 변환
-                parity_dict = {
-                    'None': serial.PARITY_NONE,
-                    'Even': serial.PARITY_EVEN,
-                    'Odd': serial.PARITY_ODD,
-                    'Mark': serial.PARITY_MARK,
-                    'Space': serial.PARITY_SPACE
-                }
-                parity_value = parity_dict.get(settings['parity'], serial.PARITY_NONE)
-
-                # 스탑 비트 변환
-                stop_bits_dict = {
-                    1: serial.STOPBITS_ONE,
-                    1.5: serial.STOPBITS_ONE_POINT_FIVE,
-                    2: serial.STOPBITS_TWO
-                }
-                stop_bits_value = stop_bits_dict.get(settings['stop_bits'], serial.STOPBITS_ONE)
-
-                # 시리얼 포트 열기
-                ser = serial.Serial(
-                    port=settings['port'],
-                    baudrate=settings['baudrate'],
-                    bytesize=settings['data_bits'],
-                    parity=parity_value,
-                    stopbits=stop_bits_value,
-                    timeout=1
-                )
-                self.serial_ports[sensor_name] = ser
-                logging.info(f"{sensor_name}의 시리얼 포트가 재연결되었습니다: {settings['port']}")
+        if not settings or self._stop_event.is_set():
+            return True  # 더 이상 재연결할 필요 없음
+        ser = None
+        try:
+            ser = self._open_port(settings)
+            # 기압계일 때만 'R' 명령어 전송
+            if sensor_name == '기압계':
+                ser.write(b'R\r\n')  # 아스키로 전송
+                logging.info(f"{sensor_name}에 명령어 'R'을 전송하였습니다.")
+        except Exception as e:
+            logging.error(f"{sensor_name}의 시리얼 포트를 열거나 명령어 전송 중 오류 발생: {e}")
+            if ser is not None:
+                ser.close()
+            return False
 
-                # 기압계일 때만 'R' 명령어 전송
-                if sensor_name == '기압계':
-                    ser.write(b'R\r\n')  # 아스키로 전송
-                    logging.info(f"{sensor_name}에 명령어 'R'을 전송하였습니다.")
+        with self._ports_lock:
+            if self._stop_event.is_set():
+                ser.close()
+                return True
+            self.serial_ports[sensor_name] = ser
+        logging.info(f"{sensor_name}의 시리얼 포트가 재연결되었습니다: {settings['port']}")
+        ready = self._port_ready.get(sensor_name)
+        if ready is not None:
+            ready.set()
+        return True
+
+    def reconnect_sensor(self, sensor_name):
+        """센서 재연결 요청. 현재 포트를 닫고 재연결 스레드에 맡기므로 바로 반환합니다."""
+        self._close_port(sensor_name)
+        self.supervisor.request(sensor_name)
 
-            except Exception as e:
-                logging.error(f"{sensor_name}의 시리얼 포트를 열거나 명령어 전송 중 오류 발생: {e}")
-                self.serial_ports[sensor_name] = None  # 재연결 실패 시 포트를 None으로 설정
-                time.sleep(10)  # 재연결 시도 간격을 두기 위해 잠시 대기
-                
     def notify_gui_sensor_disconnected(self, sensor_name):
         """GUI에 센서 연결 해제 알림"""
         # 이 메서드는 GUI에 연결 해제 알림을 보냅니다.
@@ -273,13 +368,5 @@ class DataReceiver(threading.Thread):
         self.data_queue.put({'sensor': sensor_name, 'status': 'disconnected'})
 
     def close_sensor_port(self, sensor_name):
-        """지정된 센서의 시리얼 포트를 닫습니다."""
-        ser = self.serial_ports.get(sensor_name)
-        if ser and ser.is_open:
-            try:
-                ser.close()
-                self.serial_ports[sensor_name] = None  # 포트를 None으로 설정하여 재연결 시도 가능하게 함
-                logging.info(f"{sensor_name}의 시리얼 포트를 닫았습니다.")
-            except Exception as e:
-                logging.error(f"{sensor_name}의 시리얼 포트를 닫는 중 오류 발생: {e}") 
-                
+        """지정된 센서의 시리얼 포트를 닫습니다. (수신 스레드가 이후 재연결을 요청)"""
+        self._close_port(sensor_name)
@@ -3,11 +3,63 @@
 import csv
 import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import io
 import os
+import time
+import pandas as pd
+import columnar_archive
+import metrics
+import rollup
+import time_index
+from sample import Sample
+
+# 여러 날짜를 조회할 때 하루씩 동시에 읽는 작업 스레드 수
+LOAD_WORKERS = min(8, os.cpu_count() or 1)
+
+# CSV 파일의 필드(열) 목록
+FIELDS = [
+    'timestamp',
+    'sensor',
+    'pressure',
+    'temperature_barometer',
+    'temperature_humidity',
+    'humidity',
+    'QNH',
+    'QFE',
+    'QFF'
+]
+
+
+def format_timestamp(timestamp):
+    """
+    epoch 초(float) -> 'YYYY-MM-DD HH:MM:SS.fff' 로컬 시각 문자열 (CSV 기록용)
+    이전 형식의 문자열이 들어오면 그대로 반환합니다.
+    """
+    if isinstance(timestamp, (int, float)):
+        return datetime.fromtimestamp(timestamp).isoformat(sep=' ', timespec='milliseconds')
+    return timestamp if timestamp is not None else ''
+
+
+def parse_timestamps(values):
+    """
+    저장 형식('YYYY-MM-DD HH:MM:SS.fff', 이전 형식은 밀리초 없음)의 timestamp 열을 datetime64로 변환.
+    고정 형식이므로 NumPy로 바로 변환하고, 깨진 값이 섞여 있으면 pandas로 변환(해당 값은 NaT).
+    """
+    try:
+        return pd.Series(values.to_numpy().astype('datetime64[ms]'), index=values.index)
+    except ValueError:
+        return pd.to_datetime(values, format='ISO8601', errors='coerce')
+
+
+def timestamp_key(dt):
+    """조회 구간(datetime)을 CSV 타임스탬프와 문자열로 비교할 수 있는 키로 변환"""
+    return dt.isoformat(sep=' ', timespec='milliseconds')
+
 
 class DataStorage:
-    def __init__(self, base_dir=None):
+    def __init__(self, base_dir=None, flush_rows=100, flush_interval=1.0, station=None):
         # 기본 디렉토리 설정
         if base_dir is None:
             self.base_dir = r'C:\Sitech\data'
@@ -17,152 +69,451 @@ class DataStorage:
             os.makedirs(self.base_dir)
             
         self.lock = threading.Lock()  # 스레드 안전성을 위한 락
-        self.current_date = datetime.now().date()  # 현재 날짜를 저장
-
-    def _get_csv_path(self):
-        now = datetime.now()
-        dir_path = os.path.join(self.base_dir, now.strftime('%Y-%m'))
-        if not os.path.exists(dir_path):
-            os.makedirs(dir_path)
-        csv_filename = now.strftime('%Y-%m-%d') + '.csv'
-        csv_path = os.path.join(dir_path, csv_filename)
+        self._convert_lock = threading.Lock()  # 열별 보관본 변환 (백그라운드 스레드끼리)
+        self.current_date = datetime.now().date()  # 현재 열려 있는 CSV 파일의 날짜
+        self._current_day = None  # current_date의 'YYYY-MM-DD' (행 날짜와 문자열로 비교)
+
+        # 버퍼링 쓰기 설정: flush_rows 행이 쌓이거나 flush_interval 초가 지나면 파일에 기록
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self._csv_file = None  # 현재 날짜 CSV 파일 핸들 (열린 상태로 유지)
+        self._csv_offset = 0  # CSV 파일 끝의 바이트 위치 (시간 색인용)
+        self._index_file = None  # 시간 색인(.idx) 파일 핸들
+        self._last_indexed_minute = -1  # 현재 파일의 마지막 행의 분 (시간 색인용)
+        self._row_buffer = io.StringIO()  # 행을 문자열로 만들기 위한 버퍼
+        self._row_writer = csv.writer(self._row_buffer)
+        self._pending_rows = []  # 아직 파일에 쓰지 않은 행
+        self._late_rows = {}  # 파일 교체 뒤에 도착한 이전 날짜 행 (날짜 -> 행 목록)
+        self._rollups = rollup.RollupSet()  # 1분/10분/1시간 집계 (저장 시점에 갱신)
+        self._last_flush = time.monotonic()
+        # 처리 시간 분포 (self.lock 안에서만 갱신)
+        self._write_ms = metrics.histogram('storage_write_ms', station)
+        self._flush_ms = metrics.histogram('storage_flush_ms', station)
+
+    def _get_csv_path(self, date):
+        """날짜의 CSV 파일 경로 (월 폴더가 없으면 생성)"""
+        csv_path = self._day_csv_path(date)
+        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
         return csv_path
 
     def _initialize_csv_file(self, csv_path):
         if not os.path.exists(csv_path):
             with open(csv_path, mode='w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
-                fields = [
-                    'timestamp',
-                    'sensor',
-                    'pressure',
-                    'temperature_barometer',
-                    'temperature_humidity',
-                    'humidity',
-                    'QNH',
-                    'QFE',
-                    'QFF'
-                ]
-                writer.writerow(fields)  # 필드 헤더 추가
+                writer.writerow(FIELDS)  # 필드 헤더 추가
+
+    def _rotate_csv_file(self, date):
+        """버퍼를 비우고 date 날짜의 CSV 파일을 새로 엽니다. (시작 시와 행 날짜가 바뀔 때 한 번)"""
+        if self._csv_file is not None:
+            self._flush_locked()
+            self._close_files()
+            logging.info(f'{date}csv 파일이 생성되었습니다.')
+
+            # 마감된 날짜는 백그라운드에서 열별 보관본으로 변환
+            self._start_convert(self.current_date)
+
+        csv_path = self._get_csv_path(date)
+        self._initialize_csv_file(csv_path)
+
+        # 시간 색인은 파일을 열 때 한 번 다시 만들어 CSV와 항상 일치하도록 함
+        entries = time_index.build_index(csv_path)
+        self._last_indexed_minute = entries[-1][0] if entries else -1
+        self._index_file = time_index.open_for_append(csv_path)
+
+        self._csv_file = open(csv_path, mode='a', newline='', encoding='utf-8')
+        self._csv_offset = os.path.getsize(csv_path)
+        self.current_date = date
+        self._current_day = date.isoformat()
+
+    def _format_row(self, row):
+        """행 하나를 CSV 한 줄 문자열로 변환"""
+        self._row_buffer.seek(0)
+        self._row_buffer.truncate()
+        self._row_writer.writerow(row)
+        return self._row_buffer.getvalue()
+
+    def _encode_rows(self, rows, offset, day, last_minute):
+        """
+        행들을 CSV 문자열로 만들고, 분(minute)이 바뀌는 행의 위치를 시간 색인 줄로 만듦
+        day: 파일 날짜 ('YYYY-MM-DD'), last_minute: 파일의 마지막 행의 분 (모르면 -1)
+        반환값: (CSV 문자열, 색인 줄 목록, 끝 바이트 위치, 마지막 행의 분)
+        """
+        lines = []
+        offsets = []
+        for row in rows:
+            line = self._format_row(row)
+            lines.append(line)
+            offsets.append(offset)
+            offset += len(line.encode('utf-8'))
+        index_lines, last_minute = time_index.index_lines([row[0] for row in rows], offsets, day, last_minute)
+        return ''.join(lines), index_lines, offset, last_minute
+
+    def _flush_locked(self):
+        """버퍼에 쌓인 행을 한 번에 기록 (self.lock을 잡은 상태에서 호출)"""
+        self._last_flush = time.monotonic()
+        if self._late_rows:
+            late_rows, self._late_rows = self._late_rows, {}
+            for date, rows in sorted(late_rows.items()):
+                self._write_late_rows(date, rows)
+        if not self._pending_rows or self._csv_file is None:
+            return
+        start = time.perf_counter()
+        rows, self._pending_rows = self._pending_rows, []
+        text, index_lines, offset, last_minute = self._encode_rows(
+            rows, self._csv_offset, self._current_day, self._last_indexed_minute)
+
+        try:
+            self._csv_file.write(text)
+            self._csv_file.flush()
+            self._csv_offset = offset
+            self._last_indexed_minute = last_minute
+            if index_lines:
+                self._index_file.write(''.join(index_lines))
+                self._index_file.flush()
+            self._flush_ms.observe((time.perf_counter() - start) * 1000.0)
+        except OSError as e:
+            logging.error(f"CSV 파일 기록 중 오류 발생 ({len(rows)}행 유실): {e}")
+            # 다음 저장 시 파일을 다시 열도록 함
+            self._close_files()
+
+    def _write_late_rows(self, date, rows):
+        """
+        파일 교체 뒤에 도착한 이전 날짜 행(자정 직전 값, 밀린 큐, 재생 등)을 그 날짜 파일 끝에 추가
+        (self.lock을 잡은 상태에서 호출, 드물게만 일어나므로 파일을 그때마다 열고 닫음)
+        """
+        csv_path = self._get_csv_path(date)
+        try:
+            self._initialize_csv_file(csv_path)
+            text, index_lines, _, _ = self._encode_rows(rows, os.path.getsize(csv_path), date.isoformat(), -1)
+            with open(csv_path, mode='a', newline='', encoding='utf-8') as f:
+                f.write(text)
+            with time_index.open_for_append(csv_path) as f:
+                f.writelines(index_lines)
+            logging.warning(f"늦게 도착한 {date} 데이터 {len(rows)}행을 해당 날짜 파일에 기록했습니다.")
+            if columnar_archive.has_archive(csv_path):
+                self._start_convert(date)  # 이미 만든 보관본에 늦게 온 행 반영
+        except OSError as e:
+            logging.error(f"CSV 파일 기록 중 오류 발생 ({len(rows)}행 유실): {e}")
+
+    def _close_files(self):
+        """CSV 및 색인 파일 핸들을 닫음"""
+        for f in (self._csv_file, self._index_file):
+            if f is None:
+                continue
+            try:
+                f.close()
+            except OSError:
+                pass
+        self._csv_file = None
+        self._index_file = None
+
+    def read_csv_range(self, date, start_time=None, end_time=None):
+        """
+        시간 색인으로 해당 날짜 CSV에서 [start_time, end_time] 구간만 읽습니다.
+        반환값: 헤더 줄 + 구간 행들의 bytes (파일이 없으면 None)
+        경계 분(minute) 안의 행이나 구간 사이의 다른 분 행도 포함되므로 호출한 쪽에서 정확한 시각으로 한 번 더 거릅니다.
+        기록 중인 날짜는 버퍼를 먼저 기록하고 잠금 안에서 읽으므로 반쯤 기록된 행이 섞이지 않습니다.
+        """
+        csv_path = self._day_csv_path(date)
+        bounds = self._minute_bounds(date, start_time, end_time)
+        if date < self.current_date:
+            return time_index.read_range(csv_path, *bounds)
+        with self.lock:
+            self._flush_locked()
+            return time_index.read_range(csv_path, *bounds)
+
+    @staticmethod
+    def _minute_bounds(date, start_time, end_time):
+        """조회 구간을 해당 날짜의 (시작 분, 종료 분)으로 변환. 날짜 밖이면 None (제한 없음)"""
+        start_minute = None
+        if start_time is not None and start_time.date() == date:
+            start_minute = start_time.hour * 60 + start_time.minute
+        end_minute = None
+        if end_time is not None and end_time.date() == date:
+            end_minute = end_time.hour * 60 + end_time.minute
+        return start_minute, end_minute
+
+    def flush(self):
+        """버퍼에 남은 행을 즉시 파일에 기록"""
+        with self.lock:
+            self._flush_locked()
 
     def save_data(self, data):
+        start = time.perf_counter()
+        # 저장할 데이터 준비 (타임스탬프는 여기서 처음 문자열로 변환)
+        if not isinstance(data, Sample):
+            data = Sample.from_dict(data)
+        row = data.to_row()
+        timestamp = row[0]
+        row[0] = format_timestamp(timestamp)
+        if not isinstance(timestamp, (int, float)):
+            timestamp = time.time()
+
+        day = row[0][:10]  # 'YYYY-MM-DD' (집계와 같이 행 자신의 날짜로 파일을 정함)
+
         with self.lock:
-            # 현재 날짜 확인
-            now_date = datetime.now().date()
-            if now_date != self.current_date:
-                # 날짜가 변경되었을 때 처리
-                self.current_date = now_date
-                logging.info(f'{now_date}csv 파일이 생성되었습니다.')
-                
+            late = False
+            if self._csv_file is None or day != self._current_day:
+                date = self._row_date(day, timestamp)
+                if date < self.current_date:
+                    # 파일 교체 뒤에 도착한 이전 날짜 행은 그 날짜 파일에 따로 기록
+                    self._late_rows.setdefault(date, []).append(row)
+                    late = True
+                elif self._csv_file is None or date > self.current_date:
+                    # 행 날짜가 바뀌었거나 아직 파일이 열리지 않았으면 파일 교체
+                    self._rotate_csv_file(date)
+            if not late:
+                self._pending_rows.append(row)
 
-            csv_path = self._get_csv_path()
+            # 집계 갱신, 끝난 구간은 집계 파일에 추가
+            for tier, rollup_row in self._rollups.add(row[0], row[2:], row[1]):
+                self._write_rollup_row(tier, rollup_row)
 
-            # CSV 파일 초기화
-            self._initialize_csv_file(csv_path)
+            if (len(self._pending_rows) >= self.flush_rows
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush_locked()
+            self._write_ms.observe((time.perf_counter() - start) * 1000.0)
 
-            # 저장할 필드 목록 정의
-            fields = [
-                'timestamp',
-                'sensor',
-                'pressure',
-                'temperature_barometer',
-                'temperature_humidity',
-                'humidity',
-                'QNH',
-                'QFE',
-                'QFF'
-            ]
-
-            # 저장할 데이터 준비
-            row = [data.get(field, '') for field in fields]
-
-            # 데이터 저장
-            with open(csv_path, mode='a', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(row)
+    @staticmethod
+    def _row_date(day, timestamp):
+        """행 timestamp 문자열의 날짜 부분 -> date (형식이 다르면 epoch 초 timestamp의 날짜)"""
+        try:
+            return datetime.strptime(day, '%Y-%m-%d').date()
+        except ValueError:
+            return datetime.fromtimestamp(timestamp).date()
 
-    def load_data(self, start_time=None, end_time=None):
-        data_list = []
+    def _day_csv_path(self, date):
+        """날짜에 해당하는 CSV 파일 경로"""
+        return os.path.join(
+            self.base_dir,
+            date.strftime('%Y-%m'),
+            f"{date.strftime('%Y-%m-%d')}.csv"
+        )
+
+    def _read_day_rows(self, date, sensor, start_time, end_time):
+        """
+        하루치 행을 읽어 조건에 맞는 행(dict)만 반환.
+        마감된 날짜는 열별 보관본(.cols)에서, 기록 중인 날짜나 보관본이 CSV보다 오래된 날짜는 CSV에서 읽음
+        """
+        csv_path = self._day_csv_path(date)
+        if date < self.current_date and columnar_archive.is_current(csv_path):
+            return self._read_archived_rows(csv_path, sensor, start_time, end_time)
+
+        # 'YYYY-MM-DD HH:MM:SS.fff' 형식은 문자열 순서가 시간 순서와 같으므로 파싱 없이 비교
+        start_key = timestamp_key(start_time) if start_time else None
+        end_key = timestamp_key(end_time) if end_time else None
+        rows = []
+        content = time_index.read_range(csv_path, *self._minute_bounds(date, start_time, end_time))
+        if content:
+            reader = csv.DictReader(io.StringIO(content.decode('utf-8'), newline=''))
+            for row in reader:
+                if sensor and row['sensor'] != sensor:
+                    continue
+                timestamp = row['timestamp']
+                if len(timestamp) == 19:  # 밀리초가 없는 이전 형식
+                    timestamp += '.000'
+                if start_key and timestamp < start_key:
+                    continue
+                if end_key and timestamp > end_key:
+                    continue
+                rows.append(row)
+        return rows
+
+    def _read_archived_rows(self, csv_path, sensor, start_time, end_time):
+        """열별 보관본에서 시간 범위만 잘라 CSV와 같은 형태의 행(dict)으로 변환"""
+        columns = columnar_archive.load_columns(
+            csv_path,
+            columnar_archive.VALUE_FIELDS,
+            start_ms=columnar_archive.to_epoch_ms(start_time) if start_time else None,
+            end_ms=columnar_archive.to_epoch_ms(end_time) if end_time else None,
+            sensor=sensor
+        )
+        return columnar_archive.format_rows(columns)
+
+    def load_columns(self, date, fields, start_time=None, end_time=None):
+        """
+        마감된 날짜의 열별 보관본에서 timestamp와 요청한 열만 읽습니다.
+        보관본이 없거나 CSV보다 오래되었거나 아직 기록 중인 날짜면 None을 반환합니다.
+        """
+        csv_path = self._day_csv_path(date)
+        if date >= self.current_date or not columnar_archive.is_current(csv_path):
+            return None
+        return columnar_archive.load_columns(
+            csv_path,
+            fields,
+            start_ms=columnar_archive.to_epoch_ms(start_time) if start_time else None,
+            end_ms=columnar_archive.to_epoch_ms(end_time) if end_time else None
+        )
+
+    def convert_day(self, date):
+        """하루치 CSV를 열별 보관본으로 변환 (변환은 한 번에 하나씩, 늦게 시작한 변환이 최신 CSV를 읽도록)"""
+        csv_path = self._day_csv_path(date)
+        with self._convert_lock:
+            if not os.path.exists(csv_path):
+                return
+            try:
+                columnar_archive.convert_csv(csv_path)
+            except Exception as e:
+                logging.error(f"열별 보관 파일 변환 중 오류 발생: {csv_path}, {e}")
+
+    def _start_convert(self, date):
+        """마감된 날짜를 백그라운드에서 열별 보관본으로 변환"""
+        threading.Thread(
+            target=self.convert_day,
+            args=(date,),
+            name='ColumnarArchive',
+            daemon=True
+        ).start()
+
+    def convert_closed_days(self):
+        """보관본이 없거나 CSV보다 오래된 지난 날짜들을 모두 변환 (시작 시 백그라운드로 호출)"""
+        today = datetime.now().date()
+        for month_dir in sorted(os.listdir(self.base_dir)):
+            month_path = os.path.join(self.base_dir, month_dir)
+            if not os.path.isdir(month_path):
+                continue
+            for filename in sorted(os.listdir(month_path)):
+                if not filename.endswith('.csv'):
+                    continue
+                try:
+                    date = datetime.strptime(filename[:-4], '%Y-%m-%d').date()
+                except ValueError:
+                    continue
+                if date >= today:
+                    continue
+                if columnar_archive.is_current(os.path.join(month_path, filename)):
+                    continue
+                self.convert_day(date)
+
+    def _write_rollup_row(self, tier, rollup_row):
+        """집계 행을 구간 날짜의 집계 파일에 추가"""
+        day = rollup_row[0][:10]  # 'YYYY-MM-DD'
+        csv_path = os.path.join(self.base_dir, day[:7], f"{day}.csv")
         try:
-            with self.lock:
-                # 시작 날짜와 종료 날짜 계산
-                if start_time is None:
-                    start_date = datetime.now().date()
-                else:
-                    start_date = start_time.date()
+            rollup.append_rows(csv_path, tier, [rollup_row])
+        except OSError as e:
+            logging.error(f"집계 파일 기록 중 오류 발생: {e}")
+
+    def _rebuild_rollups(self, date, csv_path):
+        """
+        CSV로 하루치 집계 파일을 다시 만듦 (self.lock을 잡은 상태에서 호출)
+        기록 중인 날짜면 버퍼를 먼저 기록하고, 진행 중인 구간은 다시 만든 파일에 이미 들어갔으므로
+        누적값을 비웁니다. (이후 같은 구간의 새 행은 따로 기록되어 조회 시 count 가중으로 합쳐짐)
+        """
+        if date == self.current_date:
+            self._flush_locked()
+            for tier, rollup_row in self._rollups.partial_rows():
+                if not rollup_row[0].startswith(date.isoformat()):
+                    self._write_rollup_row(tier, rollup_row)
+            self._rollups = rollup.RollupSet()
+        if os.path.exists(csv_path):
+            rollup.build_rollups(csv_path)
+
+    def load_rollup(self, tier, fields, start_time, end_time, on_day=None, cancelled=None):
+        """
+        집계 단계(tier)의 timestamp 및 필드별 min/mean/max를 DataFrame으로 반환합니다.
+        집계 파일이 없거나 CSV의 앞부분을 빠뜨린 날짜는 CSV로부터 다시 생성합니다. 데이터가 없으면 None.
+        on_day(읽은 날 수, 전체 날 수, 그날 DataFrame 또는 None): 하루를 읽을 때마다 호출
+        cancelled(threading.Event)가 설정되면 중간에 None을 반환합니다.
+        """
+        columns = ['timestamp'] + [f'{field}_{stat}' for field in fields for stat in rollup.STATS]
+        frames = []
+        start_date = start_time.date()
+        end_date = end_time.date()
+        total = (end_date - start_date).days + 1
+        for i in range(total):
+            if cancelled is not None and cancelled.is_set():
+                return None
+            date = start_date + timedelta(days=i)
+            day_frames = []
+            try:
+                # 하루씩 잠금을 잡아 긴 조회 중에도 기록 스레드가 오래 기다리지 않도록 함
+                with self.lock:
+                    csv_path = self._day_csv_path(date)
+                    path = rollup.rollup_path(csv_path, tier)
+                    if date <= self.current_date and rollup.needs_rebuild(csv_path, tier):
+                        self._rebuild_rollups(date, csv_path)
+                    if os.path.exists(path):
+                        day_frames.append(pd.read_csv(path, usecols=columns,
+                                                      dtype={column: 'float32' for column in columns[1:]}))
+
+                    # 아직 끝나지 않은 현재 구간도 포함
+                    for partial_tier, rollup_row in self._rollups.partial_rows():
+                        if partial_tier == tier and rollup_row[0].startswith(date.isoformat()):
+                            day_frames.append(pd.DataFrame([rollup_row], columns=rollup.HEADER)[columns])
+            except Exception as e:
+                logging.error(f"집계 데이터 로드 중 오류 발생: {e}")
+                return None
 
-                if end_time is None:
-                    end_date = datetime.now().date()
+            df = None
+            if day_frames:
+                df = pd.concat(day_frames, ignore_index=True)
+                df['timestamp'] = pd.to_datetime(df['timestamp'], format='%Y-%m-%d %H:%M:%S')
+                df = rollup.merge_duplicates(df)
+                df = df[(df['timestamp'] >= start_time) & (df['timestamp'] <= end_time)]
+                if df.empty:
+                    df = None
                 else:
-                    end_date = end_time.date()
-
-                # 날짜 범위에 해당하는 파일들을 읽음
-                delta = end_date - start_date
-                for i in range(delta.days + 1):
-                    date = start_date + timedelta(days=i)
-                    csv_path = os.path.join(
-                        self.base_dir,
-                        date.strftime('%Y-%m'),
-                        f"{date.strftime('%Y-%m-%d')}.csv"
-                    )
-
-                    if os.path.exists(csv_path):
-                        with open(csv_path, mode='r', newline='', encoding='utf-8') as csvfile:
-                            reader = csv.DictReader(csvfile)
-                            for row in reader:
-                                timestamp = datetime.strptime(row['timestamp'], '%Y-%m-%d %H:%M:%S')
-                                if start_time and timestamp < start_time:
-                                    continue
-                                if end_time and timestamp > end_time:
-                                    continue
-                                data_list.append(row)
-                return data_list
+                    frames.append(df)
+            if on_day is not None:
+                on_day(i + 1, total, df)
+
+        if not frames:
+            return None
+        return pd.concat(frames, ignore_index=True)
+
+    def load_data(self, start_time=None, end_time=None):
+        try:
+            return self._read_days(None, start_time, end_time)
         except Exception as e:
             logging.error(f"데이터 로드 중 오류 발생: {e}")
             return []
 
     def search_data(self, sensor=None, start_time=None, end_time=None):
-        data_list = []
         try:
-            with self.lock:
-                # 시작 날짜와 종료 날짜 계산
-                if start_time is None:
-                    start_date = datetime.now().date()
-                else:
-                    start_date = start_time.date()
-
-                if end_time is None:
-                    end_date = datetime.now().date()
-                else:
-                    end_date = end_time.date()
-
-                # 날짜 범위에 해당하는 파일들을 읽음
-                delta = end_date - start_date
-                for i in range(delta.days + 1):
-                    date = start_date + timedelta(days=i)
-                    csv_path = os.path.join(
-                        self.base_dir,
-                        date.strftime('%Y-%m'),
-                        f"{date.strftime('%Y-%m-%d')}.csv"
-                    )
-
-                    if os.path.exists(csv_path):
-                        with open(csv_path, mode='r', newline='', encoding='utf-8') as csvfile:
-                            reader = csv.DictReader(csvfile)
-                            for row in reader:
-                                if sensor and row['sensor'] != sensor:
-                                    continue
-                                timestamp = datetime.strptime(row['timestamp'], '%Y-%m-%d %H:%M:%S')
-                                if start_time and timestamp < start_time:
-                                    continue
-                                if end_time and timestamp > end_time:
-                                    continue
-                                data_list.append(row)
-                return data_list
+            return self._read_days(sensor, start_time, end_time)
         except Exception as e:
             logging.error(f"데이터 검색 중 오류 발생: {e}")
             return []
 
+    def _read_days(self, sensor, start_time, end_time):
+        """
+        조회 기간의 날짜들을 작업 스레드에서 하루씩 동시에 읽고 날짜 순서대로 이어 붙입니다.
+        지난 날짜 파일은 더 이상 기록되지 않으므로 잠금 없이 읽고, 기록 중인 날짜만 잠금을 잡습니다.
+        """
+        with self.lock:
+            self._flush_locked()  # 버퍼에 남은 행도 읽을 수 있도록 기록
+            current_date = self.current_date
+
+        # 시작 날짜와 종료 날짜 계산
+        start_date = start_time.date() if start_time is not None else datetime.now().date()
+        end_date = end_time.date() if end_time is not None else datetime.now().date()
+        dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+
+        def read(date):
+            if date >= current_date:
+                with self.lock:
+                    return self._read_day_rows(date, sensor, start_time, end_time)
+            return self._read_day_rows(date, sensor, start_time, end_time)
+
+        data_list = []
+        if len(dates) <= 1:
+            for date in dates:
+                data_list.extend(read(date))
+            return data_list
+        with ThreadPoolExecutor(max_workers=min(len(dates), LOAD_WORKERS)) as executor:
+            # map은 날짜 순서대로 결과를 돌려주므로 정렬 없이 시간순
+            for rows in executor.map(read, dates):
+                data_list.extend(rows)
+        return data_list
+
     def close(self):
-        # CSV 파일은 별도의 연결을 유지하지 않으므로 특별한 종료 작업이 필요하지 않습니다.
-        pass
+        # 버퍼에 남은 행을 기록하고 CSV 및 색인 파일 핸들을 닫습니다.
+        with self.lock:
+            self._flush_locked()
+            self._close_files()
+
+            # 진행 중인 집계 구간도 기록 (재시작 후 같은 구간은 조회 시 count 가중으로 합쳐짐)
+            for tier, rollup_row in self._rollups.partial_rows():
+                self._write_rollup_row(tier, rollup_row)
+            self._rollups = rollup.RollupSet()
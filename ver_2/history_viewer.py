@@ -0,0 +1,272 @@
+# history_viewer.py
+#
+# 지난 데이터 그래프 창 (pyqtgraph).
+#
+# 데이터 종류마다 한 줄씩 그래프를 쌓고 X축(시간)을 서로 연결합니다.
+# 그리기는 clipToView + peak 다운샘플링(화면 한 칸마다 min/max)으로 화면 폭만큼만 하고,
+# 확대/이동이 멈추면 보이는 구간(앞뒤 여유 포함)만 loader로 다시 읽어 옵니다.
+# 구간이 길면 집계(1분/10분/1시간) 평균선과 min~max 띠를, 짧으면 원본 값을 표시합니다.
+#
+# 조회는 QThreadPool 작업 스레드(HistoryLoadTask)에서 하루씩 진행되며, 읽은 날마다 부분 결과와
+# 진행률을 시그널로 보내므로 그동안에도 실황 화면은 계속 갱신됩니다. 새 조회를 시작하거나
+# 창을 닫으면 이전 조회는 취소되고(다음 날짜로 넘어가기 전에 멈춤) 늦게 온 결과는 버립니다.
+#
+# 시각은 로컬 시각을 그대로 epoch 초처럼 다루고 DateAxisItem(utcOffset=0)으로 표시합니다.
+
+import logging
+import threading
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+import pyqtgraph as pg
+
+import rollup
+
+DATA_TYPE_LABELS = {
+    'pressure': '기압',
+    'temperature_barometer': '기압계 온도',
+    'temperature_humidity': '습도계 온도',
+    'humidity': '습도',
+    'QNH': 'QNH',
+    'QFE': 'QFE',
+    'QFF': 'QFF',
+}
+TIER_LABELS = {None: '원본', '1m': '1분 집계', '10m': '10분 집계', '1h': '1시간 집계'}
+COLORS = ['#0000ff', '#008000', '#c05000', '#800080', '#008080', '#a00000', '#606000']
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_seconds(timestamps):
+    """로컬 datetime64 열 -> 그래프 X값 (초)"""
+    return timestamps.values.astype('datetime64[ms]').astype(np.int64) / 1000.0
+
+
+def to_datetime(seconds):
+    """그래프 X값 (초) -> 로컬 datetime"""
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+class HistoryLoadSignals(QObject):
+    # 모두 첫 인자는 조회 번호 (이전 조회의 늦은 결과를 구분)
+    partial = pyqtSignal(int, object, object)  # 그날 DataFrame, 단계
+    progress = pyqtSignal(int, int, int)  # 읽은 날 수, 전체 날 수
+    finished = pyqtSignal(int, object, object)  # 전체 DataFrame 또는 None, 단계
+    failed = pyqtSignal(int, str)
+
+
+class HistoryLoadTask(QRunnable):
+    """작업 스레드에서 loader를 실행하고 결과를 시그널로 전달"""
+
+    def __init__(self, generation, loader, data_types, start, end, tier):
+        super().__init__()
+        self.generation = generation
+        self.loader = loader
+        self.args = (data_types, start, end, tier)
+        self.signals = HistoryLoadSignals()  # GUI 스레드에서 생성 -> 시그널은 GUI 스레드에서 처리
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self):
+        try:
+            df, tier = self.loader(*self.args, on_day=self._on_day, cancelled=self.cancelled)
+        except Exception as e:
+            logging.error(f"그래프 데이터 조회 중 오류 발생: {e}")
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        if not self.cancelled.is_set():
+            self.signals.finished.emit(self.generation, df, tier)
+
+    def _on_day(self, done, total, df, tier):
+        if self.cancelled.is_set():
+            return
+        self.signals.progress.emit(self.generation, done, total)
+        if df is not None:
+            self.signals.partial.emit(self.generation, df, tier)
+
+
+class HistoryViewer(QDialog):
+    # 확대/이동이 멈춘 뒤 다시 읽기까지 기다리는 시간
+    FETCH_DELAY_MS = 200
+    MIN_SPAN_S = 10
+
+    def __init__(self, loader, data_types, parent=None):
+        """
+        loader(data_types, start, end, tier, on_day=, cancelled=) -> (DataFrame 또는 None, 실제 사용한 단계)
+        작업 스레드에서 호출됩니다. 단계(tier)가 None이 아니면 DataFrame 열은 '<종류>_min/_mean/_max'
+        """
+        super().__init__(parent)
+        self.loader = loader
+        self.data_types = list(data_types)
+        self.loaded = None  # (요청한 단계, 시작, 끝)
+        self.task = None  # 진행 중인 조회
+        self.generation = 0
+        self._parts = []  # 진행 중인 조회의 부분 결과
+        self._parts_tier = None
+
+        self.setWindowTitle("데이터 그래프")
+        self.setWindowFlags(self.windowFlags() | Qt.WindowMinMaxButtonsHint)
+        self.resize(1000, 150 + 170 * len(self.data_types))
+
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        status_layout = QHBoxLayout()
+        self.status_label = QLabel("-")
+        status_layout.addWidget(self.status_label, 1)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setFormat("%v / %m일")
+        self.progress_bar.hide()
+        status_layout.addWidget(self.progress_bar)
+        layout.addLayout(status_layout)
+
+        self.graphics = pg.GraphicsLayoutWidget()
+        self.graphics.setBackground('w')
+        layout.addWidget(self.graphics)
+
+        self.plots = []
+        self.curves = {}  # 종류 -> (평균/원본 선, min 선, max 선)
+        for row, data_type in enumerate(self.data_types):
+            plot = self.graphics.addPlot(row=row, col=0, axisItems={'bottom': pg.DateAxisItem(utcOffset=0)})
+            color = COLORS[row % len(COLORS)]
+            plot.setLabel('left', DATA_TYPE_LABELS.get(data_type, data_type), color=color)
+            plot.setClipToView(True)
+            plot.setDownsampling(auto=True, mode='peak')
+            plot.setMouseEnabled(x=True, y=False)
+            plot.showGrid(x=True, y=True, alpha=0.3)
+            plot.enableAutoRange(axis='y')
+            plot.setAutoVisible(y=True)
+            plot.setLimits(minXRange=self.MIN_SPAN_S)
+            if self.plots:
+                plot.setXLink(self.plots[0])
+
+            low = plot.plot(pen=None)
+            high = plot.plot(pen=None)
+            band = pg.FillBetweenItem(low, high, brush=pg.mkBrush(pg.mkColor(color).lighter(170)))
+            plot.addItem(band)
+            line = plot.plot(pen=pg.mkPen(color, width=1.2))
+            self.curves[data_type] = (line, low, high)
+            self.plots.append(plot)
+
+        self.fetch_timer = QTimer(self)
+        self.fetch_timer.setSingleShot(True)
+        self.fetch_timer.timeout.connect(self.fetch_visible)
+        self.plots[0].sigXRangeChanged.connect(lambda *_: self.fetch_timer.start(self.FETCH_DELAY_MS))
+
+    def show_range(self, start, end):
+        """start~end 구간을 표시하고 그 구간을 조회"""
+        x0 = (start - _EPOCH).total_seconds()
+        x1 = (end - _EPOCH).total_seconds()
+        self.start_load(rollup.choose_tier(x1 - x0), start, end)
+        self.plots[0].setXRange(x0, x1, padding=0)
+
+    def fetch_visible(self):
+        """보이는 구간이 읽어 둔(또는 읽는 중인) 구간을 벗어났거나 알맞은 집계 단계가 바뀌었으면 다시 읽음"""
+        x0, x1 = self.plots[0].viewRange()[0]
+        start, end = to_datetime(x0), to_datetime(x1)
+        requested = rollup.choose_tier(x1 - x0)
+        if self.loaded is not None:
+            loaded_tier, loaded_start, loaded_end = self.loaded
+            if requested == loaded_tier and loaded_start <= start and end <= loaded_end:
+                return
+
+        # 조금씩 이동할 때마다 다시 읽지 않도록 앞뒤로 보이는 폭의 절반씩 더 읽음
+        margin = (end - start) / 2
+        self.start_load(requested, start - margin, end + margin)
+
+    def start_load(self, requested, start, end):
+        """이전 조회를 취소하고 작업 스레드에서 새 조회 시작"""
+        self.cancel_load()
+        self.generation += 1
+        self.loaded = (requested, start, end)
+        self._parts = []
+        self._parts_tier = None
+        self.status_label.setText(f"{start:%Y-%m-%d %H:%M} ~ {end:%Y-%m-%d %H:%M} · 조회 중...")
+        self.progress_bar.setRange(0, (end.date() - start.date()).days + 1)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+
+        task = HistoryLoadTask(self.generation, self.loader, self.data_types, start, end, requested)
+        task.signals.partial.connect(self.on_partial)
+        task.signals.progress.connect(self.on_progress)
+        task.signals.finished.connect(self.on_finished)
+        task.signals.failed.connect(self.on_failed)
+        self.task = task
+        QThreadPool.globalInstance().start(task)
+
+    def cancel_load(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        self.progress_bar.hide()
+
+    def on_progress(self, generation, done, total):
+        if generation != self.generation:
+            return
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+
+    def on_partial(self, generation, df, tier):
+        """하루치가 도착할 때마다 지금까지 읽은 부분을 표시"""
+        if generation != self.generation:
+            return
+        if tier != self._parts_tier:
+            # 집계가 없어 원본으로 바뀌었으면 앞의 부분 결과는 버림
+            self._parts = []
+            self._parts_tier = tier
+        self._parts.append(df)
+        self.set_data(pd.concat(self._parts, ignore_index=True), tier, loading=True)
+
+    def on_finished(self, generation, df, tier):
+        if generation != self.generation:
+            return
+        self.task = None
+        self._parts = []
+        self.progress_bar.hide()
+        self.set_data(df, tier)
+
+    def on_failed(self, generation, message):
+        if generation != self.generation:
+            return
+        self.task = None
+        self.progress_bar.hide()
+        self.status_label.setText(f"조회 중 오류 발생: {message}")
+
+    def closeEvent(self, event):
+        self.fetch_timer.stop()
+        self.cancel_load()
+        super().closeEvent(event)
+
+    def set_data(self, df, tier, loading=False):
+        _, start, end = self.loaded
+        period = f"{start:%Y-%m-%d %H:%M} ~ {end:%Y-%m-%d %H:%M}"
+        if df is None or df.empty:
+            for curves in self.curves.values():
+                for curve in curves:
+                    curve.setData([], [])
+            self.status_label.setText(f"{period} · 조회 중..." if loading else f"{period} · 데이터 없음")
+            return
+
+        x = to_seconds(df['timestamp'])
+        for data_type, (line, low, high) in self.curves.items():
+            if tier is None:
+                y = df[data_type].to_numpy(dtype=np.float64)
+                mask = np.isfinite(y)  # 다른 센서의 행은 비어 있으므로 값이 있는 점만 연결
+                line.setData(x[mask], y[mask])
+                low.setData([], [])
+                high.setData([], [])
+            else:
+                y = df[f'{data_type}_mean'].to_numpy(dtype=np.float64)
+                mask = np.isfinite(y)
+                line.setData(x[mask], y[mask])
+                low.setData(x[mask], df[f'{data_type}_min'].to_numpy(dtype=np.float64)[mask])
+                high.setData(x[mask], df[f'{data_type}_max'].to_numpy(dtype=np.float64)[mask])
+
+        self.status_label.setText(
+            f"{period} · {TIER_LABELS.get(tier, tier)} · {len(df)}점" + (" · 조회 중..." if loading else "")
+        )
@@ -0,0 +1,117 @@
+# live_chart.py
+#
+# 실황 화면 아래의 실시간 추이 그래프 (기압/QNH, 습도).
+#
+# 값은 1초마다 ring_buffer.RingBuffer(기본 24시간 = 86400칸)에 쌓이고, 그래프는 버퍼의
+# view를 그대로 setData에 넘깁니다. 버퍼는 처음에 한 번만 할당되므로 오래 켜 두어도
+# 메모리와 갱신 비용이 늘지 않고, 그리기는 clipToView + peak 다운샘플링으로 화면 폭만큼만 합니다.
+
+import time
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox
+import pyqtgraph as pg
+
+import metrics
+from ring_buffer import RingBuffer
+
+TREND_FIELDS = ('pressure', 'QNH', 'humidity')
+# (센서, 필드): 추이 그래프에 쌓는 최신값
+TREND_SOURCES = (('기압계', 'pressure'), ('계산값', 'QNH'), ('습도계', 'humidity'))
+TREND_INTERVAL_MS = 1000
+TREND_CAPACITY = 24 * 3600  # 1초 간격 24시간
+TREND_STALE_S = 60  # 이보다 오래 수신이 없으면 빈 값(그래프 끊김)으로 기록
+
+# (표시 이름, 초)
+SPANS = [('10분', 600), ('1시간', 3600), ('6시간', 6 * 3600), ('24시간', 24 * 3600)]
+
+
+def make_trend_buffer(capacity=TREND_CAPACITY):
+    return RingBuffer(capacity, TREND_FIELDS)
+
+
+def trend_values(latest_data, connection_status, now):
+    """센서별 최신값 중 추이 그래프에 쌓을 값 (TREND_FIELDS 순서, 오래된 값은 None)"""
+    values = []
+    for sensor, field in TREND_SOURCES:
+        data = latest_data.get(sensor)
+        received = connection_status.get(sensor)
+        if data is None or received is None or (now - received).total_seconds() > TREND_STALE_S:
+            values.append(None)
+        else:
+            values.append(getattr(data, field))
+    return values
+
+
+class LiveTrendChart(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.buffer = None
+        self.span = SPANS[1][1]
+        self._refresh_ms = metrics.histogram('trend_refresh_ms')
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+        top_layout = QHBoxLayout()
+        top_layout.addWidget(QLabel("추이"))
+        self.combo_span = QComboBox()
+        self.combo_span.addItems([name for name, _ in SPANS])
+        self.combo_span.setCurrentIndex(1)
+        self.combo_span.currentIndexChanged.connect(self.on_span_changed)
+        top_layout.addWidget(self.combo_span)
+        top_layout.addStretch()
+        layout.addLayout(top_layout)
+
+        self.graphics = pg.GraphicsLayoutWidget()
+        self.graphics.setBackground('#f0f0f0')
+        self.graphics.setMinimumHeight(150)
+        layout.addWidget(self.graphics)
+
+        self.pressure_plot = self.graphics.addPlot(row=0, col=0, axisItems={'bottom': pg.DateAxisItem()})
+        self.pressure_plot.setLabel('left', 'hPa')
+        self.pressure_plot.addLegend(offset=(5, 5))
+        self.humidity_plot = self.graphics.addPlot(row=1, col=0, axisItems={'bottom': pg.DateAxisItem()})
+        self.humidity_plot.setLabel('left', '%')
+        self.humidity_plot.addLegend(offset=(5, 5))
+        self.humidity_plot.setXLink(self.pressure_plot)
+
+        for plot in (self.pressure_plot, self.humidity_plot):
+            plot.setClipToView(True)
+            plot.setDownsampling(auto=True, mode='peak')
+            plot.setMouseEnabled(x=False, y=False)
+            plot.hideButtons()
+            plot.showGrid(x=True, y=True, alpha=0.3)
+            plot.enableAutoRange(axis='y')
+            plot.setAutoVisible(y=True)
+
+        self.curves = {
+            'pressure': self.pressure_plot.plot(pen=pg.mkPen('#0000ff', width=1.5), name='기압'),
+            'QNH': self.pressure_plot.plot(pen=pg.mkPen('#008000', width=1.5), name='QNH'),
+            'humidity': self.humidity_plot.plot(pen=pg.mkPen('#c05000', width=1.5), name='습도'),
+        }
+
+    def set_buffer(self, buffer):
+        """표시할 버퍼 변경 (관측소 선택)"""
+        self.buffer = buffer
+        self.refresh()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def on_span_changed(self, index):
+        self.span = SPANS[index][1]
+        self.refresh()
+
+    def refresh(self):
+        """버퍼의 현재 내용을 그래프에 반영 (복사 없이 view 전달)"""
+        if self.buffer is None or not self.isVisible():
+            return
+        start = time.perf_counter()
+        times = self.buffer.times()
+        for field, curve in self.curves.items():
+            curve.setData(times, self.buffer.values(field), connect='finite')
+        end = times[-1] if len(times) else time.time()  # 가장 최근 값을 오른쪽 끝에
+        self.pressure_plot.setXRange(end - self.span, end, padding=0)
+        self._refresh_ms.observe((time.perf_counter() - start) * 1000.0)
@@ -1,14 +1,15 @@
 import sys
 import os
 import logging
+import threading
+import argparse
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QIcon  # QIcon 모듈 추가
 from data_display_gui import DataDisplayGUI
-from data_receiver import DataReceiver
-from data_storage import DataStorage
+from metrics import SnapshotWriter
+from async_receiver import ENGINES, QtBridge
 from port_settings_gui import PortSettingsGUI
 from serial_port_manager import SerialPortManager
-from queue import Queue
 from custom_timed_rotating_file_handler import CustomTimedRotatingFileHandler
 
 
@@ -45,22 +46,22 @@ def main():
     # 프로그램 초기화
     logging.info("프로그램이 시작되었습니다.")
     
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--capture', help='시리얼 수신 원본을 기록할 파일 경로')
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='thread',
+                        help='수신 엔진: thread (포트마다 스레드) / asyncio (이벤트 루프 하나)')
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
 
     # 아이콘 설정 (타이틀 바와 작업 표시줄 아이콘 설정)
     app.setWindowIcon(QIcon("icon.ico"))  # 아이콘 파일 경로를 정확히 지정해야 합니다.
     
-    # 데이터 큐 생성
-    data_queue = Queue()
-    
     # 기본 데이터 저장 경로 설정
     base_dir = r'C:\Sitech\data'
     if not os.path.exists(base_dir):
         os.makedirs(base_dir)
 
-    # 데이터 저장 객체 생성
-    ds = DataStorage(base_dir=base_dir)
-
     # 포트 설정 GUI 표시
     spm = SerialPortManager()
     port_settings_gui = PortSettingsGUI(spm)
@@ -68,28 +69,46 @@ def main():
         # print("포트 설정이 취소되었습니다.")
         sys.exit()
 
-    port_settings = port_settings_gui.port_settings
-    hs_value = port_settings_gui.hs_value
-    hr_value = port_settings_gui.hr_value
-    temperature_source = port_settings_gui.temperature_source
-
-    if not port_settings:
+    # 관측소별 설정 (관측소마다 포트, HS/HR, 온도값 선택)
+    stations = port_settings_gui.stations
+    if not stations or not stations[0].port_settings:
         # print("포트 설정이 없습니다.")
         sys.exit()
 
-    # 데이터 수신 객체 생성
-    data_receiver = DataReceiver(data_queue, port_settings, ds, hs_value, hr_value, temperature_source)
-    data_receiver.start()
-
-    # 데이터 표시 GUI 생성
-    gui = DataDisplayGUI(data_queue, data_receiver, ds)
+    # 관측소마다 저장소 + 저장 전용 스레드 + 수신 스레드를 시작
+    # (기본 관측소는 C:\Sitech\data, 그 외는 C:\Sitech\data\stations\<이름>)
+    # --capture <파일> 로 실행하면 수신 원본을 기록 (capture.py 형식, 관측소별로 파일 이름에 이름을 붙임)
+    # asyncio 엔진은 새 데이터가 들어오면 bridge로 GUI에 바로 알림 (1초 타이머를 기다리지 않음)
+    bridge = QtBridge()
+    for station in stations:
+        capture_path = args.capture
+        if capture_path and not station.is_default:
+            root, ext = os.path.splitext(capture_path)
+            capture_path = f"{root}_{station.name}{ext}"
+        station.start(base_dir, capture_path=capture_path, engine=args.engine, on_data=bridge.notify)
+
+    # 지난 날짜 CSV 중 열별 보관본이 없는 것은 백그라운드에서 변환
+    def convert_closed_days():
+        for station in stations:
+            station.storage.convert_closed_days()
+    threading.Thread(target=convert_closed_days, name='ColumnarArchive', daemon=True).start()
+
+    # 지표 스냅샷을 로그 폴더에 주기적으로 기록 (C:\Sitech\logs\metrics.json)
+    metrics_writer = SnapshotWriter(r'C:\Sitech\logs', interval=60.0)
+    metrics_writer.start()
+
+    # 데이터 표시 GUI 생성 (처음에는 첫 관측소 표시)
+    first = stations[0]
+    gui = DataDisplayGUI(first.data_queue, first.receiver, first.storage, stations=stations)
+    bridge.data_ready.connect(gui.update_data)
     gui.show()
 
     # 프로그램 종료 시 처리
     def on_exit():
-        data_receiver.stop()
-        data_receiver.join()
-        ds.close() 
+        for station in stations:
+            station.stop()
+        metrics_writer.stop()
+        metrics_writer.join(timeout=5)
 
     app.aboutToQuit.connect(on_exit)
     sys.exit(app.exec_())
@@ -0,0 +1,258 @@
+# metrics.py
+#
+# 파이프라인 단계별 카운터 / 게이지 / 지연 시간 분포 (수신 → 파싱 → 큐 → 저장 → 화면 갱신).
+#
+# 지표는 '이름[센서]' 단위로 나누어 대부분 한 스레드만 갱신합니다.
+# (센서별 수신 스레드, 저장은 DataStorage.lock 안, 화면 갱신은 GUI 스레드)
+# Counter/Histogram 자체는 락을 잡지 않으므로(비용은 속성 덧셈 한 번, 히스토그램은 bisect 한 번)
+# 여러 스레드가 갱신하는 지표는 호출한 쪽에서 락을 잡고 갱신해야 합니다.
+# (samples[계산값]은 두 수신 스레드가 모두 올리므로 DataReceiver.lock 안에서 증가)
+# 읽는 쪽(상태 창, 스냅샷 파일)은 값을 복사만 합니다.
+#
+#   lines_read[센서]         수신한 줄 수
+#   parse_failures[센서]     파싱 실패 수
+#   samples[센서]            큐/저장으로 넘긴 측정값 수 (스냅샷 간 차이로 초당 건수 계산)
+#   disconnects[센서]        포트 오류로 연결이 끊긴 횟수
+#   dropped_bytes[센서]      줄 끝 없이 너무 길게 들어와 버린 바이트 수
+#   reconnects[센서] 등      재연결 횟수와 복구 시간 (reconnect_supervisor.py 참고)
+#   queue_depth[gui|storage] 화면/저장 큐 깊이
+#
+# 관측소가 여럿이면 기본 관측소 외에는 라벨 앞에 관측소 이름이 붙습니다. (예: samples[2번/기압계])
+#   storage_write_ms         DataStorage.save_data 한 건 처리 시간
+#   storage_flush_ms         버퍼 → 파일 기록 한 번의 시간
+#   gui_tick_ms              DataDisplayGUI.update_data 한 틱의 시간
+#
+# 스냅샷 파일 (SnapshotWriter, 기본 C:\Sitech\logs)
+#   metrics.json               가장 최근 스냅샷 (덮어씀)
+#   metrics_YYYY-MM-DD.jsonl   스냅샷 기록 (한 줄에 하나, keep_days일 보관)
+
+import os
+import json
+import time
+import glob
+import logging
+import threading
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+DEFAULT_LOG_DIR = r'C:\Sitech\logs'
+
+# 지연 시간 구간 경계 (ms), 마지막 구간은 그 이상
+BUCKETS_MS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500,
+              1000, 2000, 5000, 10000, 30000, 60000, 300000)
+
+
+def metric_key(name, label=None):
+    return f"{name}[{label}]" if label is not None else name
+
+
+def station_label(station, label=None):
+    """관측소별 라벨: '관측소/센서' (station이 None이면 label 그대로)"""
+    if station is None:
+        return label
+    return f"{station}/{label}" if label is not None else station
+
+
+class Counter:
+    """누적 횟수 (락 없음: 여러 스레드가 올리면 호출한 쪽에서 락을 잡음)"""
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+class Gauge:
+    """현재 값. fn을 주면 읽을 때마다 호출 (예: queue.qsize)"""
+    __slots__ = ('value', 'fn')
+
+    def __init__(self, fn=None):
+        self.value = None
+        self.fn = fn
+
+    def set(self, value):
+        self.value = value
+
+    def read(self):
+        if self.fn is None:
+            return self.value
+        try:
+            return self.fn()
+        except Exception:
+            return None
+
+
+class Histogram:
+    """고정 구간 지연 시간 분포 (ms). 백분위는 해당 구간의 상한으로 근사합니다."""
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value_ms):
+        self.counts[bisect_left(BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def summary(self):
+        counts = list(self.counts)
+        count = sum(counts)
+        result = {
+            'count': count,
+            'mean_ms': self.total / count if count else 0.0,
+            'max_ms': self.max,
+        }
+        for name, fraction in (('p50_ms', 0.50), ('p90_ms', 0.90), ('p99_ms', 0.99)):
+            result[name] = self._percentile(counts, count, fraction)
+        return result
+
+    def _percentile(self, counts, count, fraction):
+        if not count:
+            return 0.0
+        target = fraction * count
+        seen = 0
+        for i, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= target:
+                # 마지막(상한 없음) 구간은 최댓값으로
+                return BUCKETS_MS[i] if i < len(BUCKETS_MS) else self.max
+        return self.max
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()  # 지표 생성 시에만 사용
+        self._metrics = {}
+        self.started = time.monotonic()
+
+    def _get(self, cls, name, label):
+        key = metric_key(name, label)
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = self._metrics[key] = cls()
+        return metric
+
+    def counter(self, name, label=None):
+        return self._get(Counter, name, label)
+
+    def histogram(self, name, label=None):
+        return self._get(Histogram, name, label)
+
+    def gauge(self, name, label=None, fn=None):
+        gauge = self._get(Gauge, name, label)
+        if fn is not None:
+            gauge.fn = fn  # 새 수신기/기록기가 만들어지면 그쪽 큐를 가리키도록 교체
+        return gauge
+
+    def reset(self):
+        """모든 지표 삭제 (벤치마크 등에서 사용, 이미 받아 둔 지표 객체는 더 이상 집계되지 않음)"""
+        with self._lock:
+            self._metrics = {}
+            self.started = time.monotonic()
+
+    def snapshot(self, previous=None):
+        """
+        현재 값을 dict로 복사합니다.
+        previous(이전 스냅샷)를 주면 그 사이의 카운터 증가량으로 초당 건수(rates)를 계산합니다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            metrics = list(self._metrics.items())
+
+        counters, gauges, histograms = {}, {}, {}
+        for key, metric in sorted(metrics):
+            if isinstance(metric, Counter):
+                counters[key] = metric.value
+            elif isinstance(metric, Gauge):
+                gauges[key] = metric.read()
+            else:
+                histograms[key] = metric.summary()
+
+        snapshot = {
+            'time': datetime.now().isoformat(sep=' ', timespec='seconds'),
+            'uptime_s': now - self.started,
+            'counters': counters,
+            'rates': {},
+            'gauges': gauges,
+            'histograms': histograms,
+        }
+        if previous:
+            elapsed = snapshot['uptime_s'] - previous['uptime_s']
+            if elapsed > 0:
+                before = previous['counters']
+                snapshot['rates'] = {
+                    key: (value - before.get(key, 0)) / elapsed for key, value in counters.items()
+                }
+        return snapshot
+
+
+# 프로그램 전체에서 공유하는 기본 레지스트리
+REGISTRY = Registry()
+counter = REGISTRY.counter
+histogram = REGISTRY.histogram
+gauge = REGISTRY.gauge
+snapshot = REGISTRY.snapshot
+
+
+class SnapshotWriter(threading.Thread):
+    """interval초마다 스냅샷을 log_dir에 기록하는 스레드"""
+
+    def __init__(self, log_dir=DEFAULT_LOG_DIR, interval=60.0, keep_days=7, registry=REGISTRY):
+        super().__init__(name='MetricsSnapshot', daemon=True)
+        self.log_dir = log_dir
+        self.interval = interval
+        self.keep_days = keep_days
+        self.registry = registry
+        self._stop_event = threading.Event()
+        self._previous = None
+        self._current_day = None
+
+    def run(self):
+        logging.info(f"지표 스냅샷 기록을 시작합니다: {self.log_dir} ({self.interval:g}초 간격)")
+        while not self._stop_event.wait(self.interval):
+            self.write_snapshot()
+        self.write_snapshot()  # 종료 직전 값도 남김
+
+    def write_snapshot(self):
+        snapshot = self.registry.snapshot(self._previous)
+        self._previous = snapshot
+        line = json.dumps(snapshot, ensure_ascii=False)
+        try:
+            os.makedirs(self.log_dir, exist_ok=True)
+            latest = os.path.join(self.log_dir, 'metrics.json')
+            with open(latest + '.tmp', mode='w', encoding='utf-8') as f:
+                f.write(line)
+            os.replace(latest + '.tmp', latest)
+
+            day = snapshot['time'][:10]
+            with open(os.path.join(self.log_dir, f'metrics_{day}.jsonl'), mode='a', encoding='utf-8') as f:
+                f.write(line + '\n')
+            if day != self._current_day:
+                self._current_day = day
+                self._remove_old_files()
+        except OSError as e:
+            logging.error(f"지표 스냅샷 기록 중 오류 발생: {e}")
+        return snapshot
+
+    def _remove_old_files(self):
+        oldest = (datetime.now().date() - timedelta(days=self.keep_days)).isoformat()
+        for path in glob.glob(os.path.join(self.log_dir, 'metrics_*.jsonl')):
+            day = os.path.basename(path)[len('metrics_'):-len('.jsonl')]
+            if day < oldest:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logging.error(f"오래된 지표 파일 삭제 중 오류 발생: {e}")
+
+    def stop(self):
+        self._stop_event.set()
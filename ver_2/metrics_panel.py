@@ -0,0 +1,85 @@
+# metrics_panel.py
+
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView, QLabel
+from PyQt5.QtCore import Qt, QTimer
+
+import metrics
+
+
+class MetricsPanel(QDialog):
+    """수신/파싱/저장/화면 갱신 지표를 1초마다 표로 보여 주는 상태 창"""
+
+    COLUMNS = ['항목', '값', '초당', 'p50 (ms)', 'p99 (ms)', '최대 (ms)']
+
+    def __init__(self, parent=None, registry=metrics.REGISTRY):
+        super().__init__(parent)
+        self.registry = registry
+        self._previous = None
+
+        self.setWindowTitle("상태 (지표)")
+        self.resize(560, 420)
+
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        self.label_time = QLabel("-")
+        layout.addWidget(self.label_time)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    def showEvent(self, event):
+        self.timer.start(1000)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        snapshot = self.registry.snapshot(self._previous)
+        self._previous = snapshot
+
+        rows = []
+        for key, value in snapshot['counters'].items():
+            rate = snapshot['rates'].get(key)
+            rows.append((key, str(value), f"{rate:.1f}" if rate is not None else "-", "", "", ""))
+        for key, value in snapshot['gauges'].items():
+            rows.append((key, "-" if value is None else str(value), "", "", "", ""))
+        for key, summary in snapshot['histograms'].items():
+            rows.append((key, str(summary['count']), "",
+                         f"{summary['p50_ms']:g}", f"{summary['p99_ms']:g}", f"{summary['max_ms']:.2f}"))
+
+        self.table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, text in enumerate(values):
+                item = self.table.item(row, column)
+                if item is None:
+                    item = QTableWidgetItem()
+                    if column:
+                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                    self.table.setItem(row, column, item)
+                item.setText(text)
+
+        self.label_time.setText(f"{snapshot['time']} (실행 {snapshot['uptime_s'] / 3600:.1f}시간)")
+
+    @staticmethod
+    def summary_text(snapshot):
+        """상태바 한 줄 요약: 초당 수신 건수, 파싱 실패, 큐 깊이"""
+        counters = snapshot['counters']
+        rates = snapshot['rates']
+        received = sum(rate for key, rate in rates.items() if key.startswith('samples['))
+        failures = sum(value for key, value in counters.items() if key.startswith('parse_failures['))
+        depths = [value for key, value in snapshot['gauges'].items()
+                  if key.startswith('queue_depth[') and key.endswith('storage]') and value is not None]
+        text = f"수신 {received:.1f}/s · 파싱 오류 {failures}"
+        if depths:
+            text += f" · 저장 큐 {sum(depths)}"
+        return text
@@ -0,0 +1,75 @@
+# parsers.py
+#
+# 센서 프로토콜별 한 줄 파서. 포트를 설정할 때 센서마다 한 번 골라 두고,
+# readline()이 돌려준 bytes를 디코딩 없이 바로 파싱합니다. (float()는 bytes도 받음)
+#
+#   기압계: b"1013.25 21.3\r\n"
+#   습도계: b"RH= 45.2 %RH T= 21.1 'C\r\n"
+
+import re
+import time
+
+from sample import Sample, Sensor
+
+# 줄마다 호출되므로 전역 조회를 줄이기 위해 미리 묶어 둠
+_time = time.time
+_monotonic = time.monotonic
+
+
+class BarometerParser:
+    """기압계: 공백으로 구분된 '기압 온도'"""
+
+    sensor = Sensor.BAROMETER
+
+    def parse(self, raw):
+        """형식이 맞지 않으면 None, 숫자 변환 실패 시 ValueError"""
+        parts = raw.split(None, 2)
+        if len(parts) < 2:
+            return None
+        # Sample(sensor, timestamp, monotonic, pressure, temperature_barometer)
+        return Sample(self.sensor, _time(), _monotonic(), float(parts[0]), float(parts[1]))
+
+
+class HygrometerParser:
+    """습도계: 'RH= <습도> %RH T= <온도> ...'"""
+
+    sensor = Sensor.HYGROMETER
+
+    # 공백이 있는 현장 형식이 아니면 정규식으로 처리
+    # 일반적인 순서(RH 다음 T)는 한 번의 match로
+    _pattern = re.compile(rb'\s*RH=\s*([\d.]+)\D*?T=\s*(-?[\d.]+)')
+    # 순서가 다르거나 앞에 다른 문자가 있는 경우 각각 검색
+    _humidity = re.compile(rb'RH=\s*([\d.]+)')
+    _temperature = re.compile(rb'T=\s*(-?[\d.]+)')
+
+    def parse(self, raw):
+        # 현장 형식 [b'RH=', b'45.2', b'%RH', b'T=', b'21.1', ...]은 split만으로 처리
+        parts = raw.split(None, 5)
+        if len(parts) >= 5 and parts[0] == b'RH=' and parts[3] == b'T=':
+            humidity, temperature = parts[1], parts[4]
+        else:
+            match = self._pattern.match(raw)
+            if match is not None:
+                humidity, temperature = match.groups()
+            else:
+                humidity_match = self._humidity.search(raw)
+                temperature_match = self._temperature.search(raw)
+                if not (humidity_match and temperature_match):
+                    return None
+                humidity = humidity_match.group(1)
+                temperature = temperature_match.group(1)
+        # Sample(sensor, timestamp, monotonic, pressure, temperature_barometer, temperature_humidity, humidity)
+        return Sample(self.sensor, _time(), _monotonic(), None, None, float(temperature), float(humidity))
+
+
+# 센서 이름 -> 파서 클래스
+PARSERS = {
+    Sensor.BAROMETER: BarometerParser,
+    Sensor.HYGROMETER: HygrometerParser,
+}
+
+
+def get_parser(sensor_name):
+    """센서 이름에 해당하는 파서 객체. 알 수 없는 센서면 None."""
+    parser_class = PARSERS.get(sensor_name)
+    return parser_class() if parser_class else None
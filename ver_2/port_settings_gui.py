@@ -10,6 +10,8 @@ from PyQt5.QtGui import QDoubleValidator, QIntValidator
 import serial
 import serial.tools.list_ports
 from password_dialog import PasswordDialog  # PasswordDialog 가져옵니다.
+from serial_port_manager import available_ports
+from station import Station, DEFAULT_STATION, is_valid_name, load_stations, station_settings
 
 def resource_path(relative_path):
     """ PyInstaller가 생성한 임시 경로에서 리소스를 가져옴 """
@@ -30,6 +32,8 @@ class PortSettingsGUI(QtWidgets.QDialog):
         self.qnh_unit = 'hPa'
         self.qfe_unit = 'hPa'
         self.qff_unit = 'hPa'
+        self.stations = []  # 관측소 목록 (station.Station), 첫 관측소 값은 위 속성에도 반영
+        self.current_station = 0  # 화면에 표시 중인 관측소 번호
         # self.barometer_interval = 60  # 기압계 interval 기본값 (주석 처리)
         # self.humidity_interval = 60   # 습도계 interval 기본값 (주석 처리)
 
@@ -56,12 +60,30 @@ class PortSettingsGUI(QtWidgets.QDialog):
         layout = QtWidgets.QVBoxLayout()
 
         # 사용 가능한 포트 목록 검색하기
-        ports = [port.device for port in serial.tools.list_ports.comports()]
+        # (SITECH_SIMULATOR=1이면 실행 중인 simulator.py의 가상 센서 포트도 포함)
+        ports = available_ports()
         if not ports:
             QtWidgets.QMessageBox.critical(self, "오류", "사용 가능한 COM 포트가 없습니다.")
             self.reject()
             return
 
+        # 관측소 선택 (관측소마다 포트, 온도값, HS/HR을 따로 설정)
+        station_group_box = QtWidgets.QGroupBox("관측소")
+        station_layout = QtWidgets.QHBoxLayout()
+        self.station_combo = QtWidgets.QComboBox()
+        self.station_combo.addItems([station.name for station in self.stations])
+        self.station_combo.currentIndexChanged.connect(self.on_station_changed)
+        add_station_button = QtWidgets.QPushButton("추가")
+        add_station_button.clicked.connect(self.add_station)
+        remove_station_button = QtWidgets.QPushButton("삭제")
+        remove_station_button.clicked.connect(self.remove_station)
+        station_layout.addWidget(self.station_combo, 1)
+        station_layout.addWidget(add_station_button)
+        station_layout.addWidget(remove_station_button)
+        station_group_box.setLayout(station_layout)
+        layout.addWidget(station_group_box)
+        self.ports = ports
+
         # 센서 목록
         sensors = ['기압계', '습도계']
 
@@ -108,20 +130,6 @@ class PortSettingsGUI(QtWidgets.QDialog):
             stop_bits_combo.addItems([str(sb) for sb in stop_bits_options])
             form_layout.addRow("스톱 비트:", stop_bits_combo)
 
-            # 이전 설정 있으면 적용
-            if sensor in self.saved_settings:
-                saved_settings = self.saved_settings[sensor]
-                if 'port' in saved_settings and saved_settings['port'] in ports:
-                    port_combo.setCurrentText(saved_settings['port'])
-                if 'baudrate' in saved_settings:
-                    baudrate_combo.setCurrentText(str(saved_settings['baudrate']))
-                if 'parity' in saved_settings:
-                    parity_combo.setCurrentText(saved_settings['parity'])
-                if 'data_bits' in saved_settings:
-                    data_bits_combo.setCurrentText(str(saved_settings['data_bits']))
-                if 'stop_bits' in saved_settings:
-                    stop_bits_combo.setCurrentText(str(saved_settings['stop_bits']))
-
             self.widgets[sensor] = {
                 'port': port_combo,
                 'baudrate': baudrate_combo,
@@ -130,6 +138,9 @@ class PortSettingsGUI(QtWidgets.QDialog):
                 'stop_bits': stop_bits_combo
             }
 
+            # 이전 설정 있으면 적용
+            self.show_sensor_settings(sensor, self.saved_settings.get(sensor, {}))
+
             group_box.setLayout(form_layout)
             layout.addWidget(group_box)
 
@@ -285,6 +296,130 @@ class PortSettingsGUI(QtWidgets.QDialog):
             else:
                 self.temperature_source = None
 
+    def show_sensor_settings(self, sensor, saved_settings):
+        """센서 하나의 포트 설정을 입력 위젯에 표시 (없는 값은 기본값)"""
+        widgets = self.widgets[sensor]
+        if saved_settings.get('port') in self.ports:
+            widgets['port'].setCurrentText(saved_settings['port'])
+        else:
+            widgets['port'].setCurrentIndex(0)
+        widgets['baudrate'].setCurrentText(str(saved_settings.get('baudrate', 4800)))
+        widgets['parity'].setCurrentText(saved_settings.get('parity', 'None'))
+        widgets['data_bits'].setCurrentText(str(saved_settings.get('data_bits', 5)))
+        widgets['stop_bits'].setCurrentText(f"{float(saved_settings.get('stop_bits', 1)):g}")  # 1.0 -> '1'
+
+    def store_station(self, index):
+        """입력 위젯의 값을 관측소 설정에 저장 (검증은 on_run에서)"""
+        station = self.stations[index]
+        station.port_settings = {}
+        for sensor, widgets in self.widgets.items():
+            station.port_settings[sensor] = {
+                'port': widgets['port'].currentText(),
+                'baudrate': int(widgets['baudrate'].currentText()),
+                'parity': widgets['parity'].currentText(),
+                'data_bits': int(widgets['data_bits'].currentText()),
+                'stop_bits': float(widgets['stop_bits'].currentText())
+            }
+        if self.radio_humidity_sensor.isChecked():
+            station.temperature_source = 'humidity_sensor'
+        elif self.radio_barometer_sensor.isChecked():
+            station.temperature_source = 'barometer_sensor'
+        else:
+            try:
+                station.temperature_source = float(self.temperature_input.text())
+            except ValueError:
+                station.temperature_source = None
+        for name, line_edit in (('hs_value', self.hs_input), ('hr_value', self.hr_input)):
+            try:
+                setattr(station, name, float(line_edit.text()))
+            except ValueError:
+                setattr(station, name, None)
+
+    def show_station(self, index):
+        """관측소 설정을 입력 위젯에 표시"""
+        station = self.stations[index]
+        for sensor in self.widgets:
+            self.show_sensor_settings(sensor, station.port_settings.get(sensor, {}))
+        self.temperature_source = station.temperature_source
+        if station.temperature_source == 'barometer_sensor':
+            self.radio_barometer_sensor.setChecked(True)
+        elif station.temperature_source == 'humidity_sensor':
+            self.radio_humidity_sensor.setChecked(True)
+        else:
+            self.radio_user_defined.setChecked(True)
+            self.temperature_input.setText('' if station.temperature_source is None else str(station.temperature_source))
+        self.hs_input.setText('' if station.hs_value is None else str(station.hs_value))
+        self.hr_input.setText('' if station.hr_value is None else str(station.hr_value))
+
+    def on_station_changed(self, index):
+        if index < 0 or index == self.current_station:
+            return
+        self.store_station(self.current_station)
+        self.current_station = index
+        self.show_station(index)
+
+    def add_station(self):
+        name, ok = QtWidgets.QInputDialog.getText(self, "관측소 추가", "관측소 이름:")
+        if not ok:
+            return
+        name = name.strip()
+        if not is_valid_name(name):
+            QtWidgets.QMessageBox.warning(self, "경고", "관측소 이름에 사용할 수 없는 문자가 있습니다.")
+            return
+        if any(station.name == name for station in self.stations):
+            QtWidgets.QMessageBox.warning(self, "경고", f"이미 있는 관측소 이름입니다: {name}")
+            return
+        self.store_station(self.current_station)
+        current = self.stations[self.current_station]
+        # 새 관측소는 현재 관측소의 통신 설정(포트 제외)과 높이를 복사해서 시작
+        port_settings = {sensor: dict(settings, port='') for sensor, settings in current.port_settings.items()}
+        self.stations.append(Station(name, port_settings, current.hs_value, current.hr_value,
+                                     current.temperature_source))
+        self.station_combo.addItem(name)
+        self.station_combo.setCurrentIndex(len(self.stations) - 1)
+
+    def remove_station(self):
+        if len(self.stations) <= 1:
+            QtWidgets.QMessageBox.warning(self, "경고", "관측소가 하나 이상 있어야 합니다.")
+            return
+        index = self.current_station
+        del self.stations[index]
+        self.station_combo.blockSignals(True)
+        self.station_combo.removeItem(index)
+        self.station_combo.setCurrentIndex(0)
+        self.station_combo.blockSignals(False)
+        self.current_station = 0
+        self.show_station(0)
+
+    def validate_stations(self):
+        """모든 관측소 설정 검증. 문제가 있으면 경고를 띄우고 False"""
+        used_ports = {}
+        for station in self.stations:
+            prefix = f"[{station.name}] " if len(self.stations) > 1 else ""
+            for sensor, settings in station.port_settings.items():
+                port = settings['port']
+                if not port:
+                    QtWidgets.QMessageBox.warning(self, "경고", f"{prefix}{sensor}의 포트를 선택해야 합니다.")
+                    return False
+                if port in used_ports:
+                    QtWidgets.QMessageBox.warning(self, "경고", f"{prefix}{sensor}의 포트 {port}가 "
+                                                            f"{used_ports[port]}와 겹칩니다.")
+                    return False
+                used_ports[port] = f"{station.name} {sensor}"
+            if station.temperature_source is None:
+                QtWidgets.QMessageBox.warning(self, "경고", f"{prefix}온도값을 입력하세요.")
+                return False
+            if station.hs_value is None or station.hr_value is None:
+                QtWidgets.QMessageBox.warning(self, "경고", f"{prefix}유효한 HS 및 HR 값을 입력하세요.")
+                return False
+            if station.hs_value <= 0:
+                QtWidgets.QMessageBox.warning(self, "경고", f"{prefix}HS 값은 0보다 커야 합니다.")
+                return False
+            if station.hr_value <= 0:
+                QtWidgets.QMessageBox.warning(self, "경고", f"{prefix}HR 값은 0보다 커야 합니다.")
+                return False
+        return True
+
     def on_run(self):
         # Interval 값 검증 및 저장 코드 주석 처리
         # barometer_interval_text = self.barometer_interval_input.text()
@@ -305,24 +440,10 @@ class PortSettingsGUI(QtWidgets.QDialog):
         #     QtWidgets.QMessageBox.warning(self, "경고", "습도계의 Interval 값은 0보다 커야 합니다.")
         #     return
 
-        for sensor, widgets in self.widgets.items():
-            port = widgets['port'].currentText()
-            baudrate = int(widgets['baudrate'].currentText())
-            parity = widgets['parity'].currentText()
-            data_bits = int(widgets['data_bits'].currentText())
-            stop_bits = float(widgets['stop_bits'].currentText())
-
-            if not port:
-                QtWidgets.QMessageBox.warning(self, "경고", f"{sensor}의 포트를 선택해야 합니다.")
-                return
-
-            self.port_settings[sensor] = {
-                'port': port,
-                'baudrate': baudrate,
-                'parity': parity,
-                'data_bits': data_bits,
-                'stop_bits': stop_bits
-            }
+        # 화면에 표시 중인 관측소 값을 반영한 뒤 모든 관측소를 검증
+        self.store_station(self.current_station)
+        if not self.validate_stations():
+            return
 
         # Interval 값을 각 센서 설정에 추가 (주석 처리)
         # if '기압계' in self.port_settings:
@@ -330,43 +451,28 @@ class PortSettingsGUI(QtWidgets.QDialog):
         # if '습도계' in self.port_settings:
         #     self.port_settings['습도계']['interval'] = humidity_interval
 
-        # 현재 선택된 온도값 소스 업데이트
-        if self.radio_humidity_sensor.isChecked():
-            self.temperature_source = 'humidity_sensor'
-        elif self.radio_barometer_sensor.isChecked():
-            self.temperature_source = 'barometer_sensor'
-        elif self.radio_user_defined.isChecked():
-            if self.temperature_input.text():
-                try:
-                    self.temperature_source = float(self.temperature_input.text())
-                    logging.info(f"사용자 정의 온도값이 입력되었습니다: {self.temperature_source}")
-                except ValueError:
-                    QtWidgets.QMessageBox.warning(self, "경고", "유효한 숫자를 입력하세요.")
-                    return
-            else:
-                QtWidgets.QMessageBox.warning(self, "경고", "온도값을 입력하세요.")
-                return
-
-        # HS, HR 값 저장 및 검증
-        try:
-            self.hs_value = float(self.hs_input.text())
-            self.hr_value = float(self.hr_input.text())
-            if self.hs_value <= 0:
-                QtWidgets.QMessageBox.warning(self, "경고", "HS 값은 0보다 커야 합니다.")
-                return
-            if self.hr_value <= 0:
-                QtWidgets.QMessageBox.warning(self, "경고", "HR 값은 0보다 커야 합니다.")
-                return
-        except ValueError:
-            QtWidgets.QMessageBox.warning(self, "경고", "유효한 HS 및 HR 값을 입력하세요.")
-            return
+        # 첫 관측소 값은 이전처럼 속성으로도 제공
+        first = self.stations[0]
+        self.port_settings = first.port_settings
+        self.temperature_source = first.temperature_source
+        self.hs_value = first.hs_value
+        self.hr_value = first.hr_value
+        if isinstance(self.temperature_source, float):
+            logging.info(f"사용자 정의 온도값이 입력되었습니다: {self.temperature_source}")
 
         # 단위 선택 값 저장
         self.qnh_unit = self.qnh_unit_combo.currentText()
         self.qfe_unit = self.qfe_unit_combo.currentText()
         self.qff_unit = self.qff_unit_combo.currentText()
         
-        for sensor_name, settings in self.port_settings.items():
+        # 관측소가 여럿이면 메시지에 관측소 이름을 붙임
+        sensors_to_check = []
+        for station in self.stations:
+            for sensor_name, settings in station.port_settings.items():
+                sensor_label = f"[{station.name}] {sensor_name}" if len(self.stations) > 1 else sensor_name
+                sensors_to_check.append((sensor_label, sensor_name, settings))
+
+        for sensor_label, sensor_name, settings in sensors_to_check:
             try:
                 # 패리티 변환
                 parity_dict = {
@@ -395,20 +501,20 @@ class PortSettingsGUI(QtWidgets.QDialog):
                     stopbits=stop_bits_value,
                     timeout=1
                 )
-                logging.info(f"{sensor_name}의 시리얼 포트가 열렸습니다: {settings['port']}")
+                logging.info(f"{sensor_label}의 시리얼 포트가 열렸습니다: {settings['port']}")
 
                 # 기압계에만 'R' 명령어 전송
                 if sensor_name == '기압계':
                     ser.write(b'R\r\n')  # 아스키로 전송
-                    logging.info(f"{sensor_name}에 명령어 'R'을 전송하였습니다.")
+                    logging.info(f"{sensor_label}에 명령어 'R'을 전송하였습니다.")
 
                 # 시리얼 포트 닫기
                 ser.close()
-                logging.info(f"{sensor_name}의 시리얼 포트를 닫았습니다.")
+                logging.info(f"{sensor_label}의 시리얼 포트를 닫았습니다.")
 
             except Exception as e:
-                logging.error(f"{sensor_name}의 시리얼 포트를 열거나 명령어 전송 중 오류 발생: {e}")
-                QtWidgets.QMessageBox.warning(self, "오류", f"{sensor_name}에 명령어를 전송하는 중 오류 발생:\n{e}")
+                logging.error(f"{sensor_label}의 시리얼 포트를 열거나 명령어 전송 중 오류 발생: {e}")
+                QtWidgets.QMessageBox.warning(self, "오류", f"{sensor_label}에 명령어를 전송하는 중 오류 발생:\n{e}")
         
 
         # 설정 저장
@@ -428,15 +534,12 @@ class PortSettingsGUI(QtWidgets.QDialog):
             sys.exit()
 
     def save_settings(self):
-        settings = {
-            'port_settings': self.port_settings,
-            'temperature_source': self.temperature_source,
-            'hs_value': self.hs_value,
-            'hr_value': self.hr_value,
+        settings = station_settings(self.stations)  # 관측소 목록 (+ 첫 관측소 값은 최상위에도)
+        settings.update({
             'qnh_unit': self.qnh_unit,
             'qfe_unit': self.qfe_unit,
             'qff_unit': self.qff_unit
-        }
+        })
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(settings, f, ensure_ascii=False, indent=4)
@@ -456,7 +559,13 @@ class PortSettingsGUI(QtWidgets.QDialog):
                     self.qfe_unit = settings.get('qfe_unit', 'hPa')
                     self.qff_unit = settings.get('qff_unit', 'hPa')
 
-                    port_settings = settings.get('port_settings', {})
+                    # 관측소 목록 ('stations'가 없는 이전 설정은 최상위 값으로 관측소 하나)
+                    self.stations = load_stations(settings) or [Station(DEFAULT_STATION, {})]
+                    first = self.stations[0]
+                    self.temperature_source = first.temperature_source
+                    self.hs_value = first.hs_value
+                    self.hr_value = first.hr_value
+                    port_settings = first.port_settings
 
                     # Interval 값 로드 주석 처리
                     # if '기압계' in port_settings:
@@ -480,6 +589,7 @@ class PortSettingsGUI(QtWidgets.QDialog):
                 self.qff_unit = 'hPa'
                 # self.barometer_interval = 60
                 # self.humidity_interval = 60
+                self.stations = [Station(DEFAULT_STATION, {})]
                 return {}
         else:
             print("설정 파일이 존재하지 않습니다.")
@@ -491,6 +601,7 @@ class PortSettingsGUI(QtWidgets.QDialog):
             self.qff_unit = 'hPa'
             # self.barometer_interval = 60
             # self.humidity_interval = 60
+            self.stations = [Station(DEFAULT_STATION, {})]
             return {}
 
     def show(self):
@@ -0,0 +1,209 @@
+# recompute.py
+#
+# HS/HR(또는 온도값 선택)이 정정되었을 때, 이미 저장된 '계산값' 행의 QNH/QFE/QFF를
+# 기간 단위로 다시 계산하는 명령줄 도구. 날짜 파일 하나를 작업 하나로 하여
+# 프로세스 풀에 분산하고, 각 파일은 임시 파일에 쓴 뒤 교체(원자적 기록)합니다.
+#
+#   python recompute.py --start 2024-10-01 --end 2024-10-31 --hs 35.5 --hr 12.3
+#   python recompute.py --start 2024-10-01 --end 2024-10-31          (settings.json 값 사용)
+#   python recompute.py --start 2024-10-01 --end 2024-10-31 --station 2번
+#
+# --station을 주면 settings.json에서 그 관측소의 HS/HR/온도값과 저장 위치(base_dir\stations\<이름>)를
+# 사용합니다. 생략하면 기본 관측소입니다.
+#
+# 오늘 날짜 파일은 실행 중인 프로그램이 기록하고 있으므로 건너뜁니다.
+
+import os
+import csv
+import json
+import time
+import argparse
+import logging
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import columnar_archive
+import rollup
+import time_index
+from calculator import Calculator
+
+DEFAULT_BASE_DIR = r'C:\Sitech\data'
+DEFAULT_STATION = '기본'  # station.DEFAULT_STATION
+DEFAULT_SETTINGS_FILE = os.path.join(r'C:\Sitech', 'settings.json')
+
+
+def load_settings(settings_file, station_name=DEFAULT_STATION):
+    """
+    PortSettingsGUI가 저장한 settings.json에서 관측소의 HS, HR, 온도값 선택을 읽음
+    반환값: (hs, hr, temperature_source, Station). 설정에 없는 관측소면 ValueError
+    """
+    # station 모듈은 수신/GUI 모듈을 함께 불러오므로 작업 프로세스에서는 불러오지 않도록 여기서 import
+    from station import Station, load_stations
+
+    try:
+        with open(settings_file, 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning(f"설정 파일을 읽을 수 없습니다: {settings_file}, {e}")
+        settings = {}
+
+    stations = {station.name: station for station in load_stations(settings)}
+    station = stations.get(station_name)
+    if station is None:
+        if station_name != DEFAULT_STATION:
+            raise ValueError(f"설정에 없는 관측소입니다: {station_name} (설정된 관측소: {', '.join(stations) or '없음'})")
+        station = Station(DEFAULT_STATION, {})  # 설정이 없으면 기본값
+    return station.hs_value, station.hr_value, station.temperature_source, station
+
+
+def recompute_day(csv_path, hs, hr, temperature_source):
+    """
+    하루치 CSV의 '계산값' 행을 다시 계산합니다. (프로세스 풀 작업 단위)
+    반환값: (csv_path, 전체 행 수, 갱신한 행 수, 소요 시간)
+    """
+    start = time.perf_counter()
+    with open(csv_path, mode='r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+
+    column = {name: i for i, name in enumerate(header)}
+    if isinstance(temperature_source, (int, float)):
+        temperature_column = None
+    elif temperature_source == 'barometer_sensor':
+        temperature_column = column['temperature_barometer']
+    else:
+        temperature_column = column['temperature_humidity']
+
+    # 다시 계산할 행과 입력값 수집
+    indices = []
+    pressures = []
+    temperatures = []
+    for i, row in enumerate(rows):
+        if len(row) != len(header) or row[column['sensor']] != '계산값':
+            continue
+        try:
+            pressure = float(row[column['pressure']])
+            if temperature_column is None:
+                temperature = float(temperature_source)
+            else:
+                temperature = float(row[temperature_column])
+        except ValueError:
+            continue
+        indices.append(i)
+        pressures.append(pressure)
+        temperatures.append(temperature)
+
+    if indices:
+        calculator = Calculator(hs, hr)
+        qnh, qfe, qff = calculator.calculate_batch(np.array(pressures), np.array(temperatures))
+        for i, new_qnh, new_qfe, new_qff in zip(indices, qnh.tolist(), qfe.tolist(), qff.tolist()):
+            rows[i][column['QNH']] = new_qnh
+            rows[i][column['QFE']] = new_qfe
+            rows[i][column['QFF']] = new_qff
+
+        # 임시 파일에 쓴 뒤 교체
+        tmp_path = csv_path + '.tmp'
+        with open(tmp_path, mode='w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        os.replace(tmp_path, csv_path)
+
+        # CSV에서 파생된 파일(시간 색인, 집계, 열별 보관본)도 다시 생성
+        time_index.build_index(csv_path)
+        rollup.build_rollups(csv_path)
+        if columnar_archive.has_archive(csv_path):
+            columnar_archive.convert_csv(csv_path)
+
+    return csv_path, len(rows), len(indices), time.perf_counter() - start
+
+
+def day_files(base_dir, start_date, end_date):
+    """기간 안의 일별 CSV 경로 목록 (오늘 날짜 제외)"""
+    today = datetime.now().date()
+    paths = []
+    date = start_date
+    while date <= end_date:
+        if date >= today:
+            print(f"{date}: 기록 중인 날짜이므로 건너뜁니다.")
+        else:
+            csv_path = os.path.join(base_dir, date.strftime('%Y-%m'), f"{date.strftime('%Y-%m-%d')}.csv")
+            if os.path.exists(csv_path):
+                paths.append(csv_path)
+        date += timedelta(days=1)
+    return paths
+
+
+def parse_temperature_source(value):
+    if value in ('humidity_sensor', 'barometer_sensor'):
+        return value
+    return float(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장된 계산값(QNH/QFE/QFF) 재계산")
+    parser.add_argument('--start', required=True, help='시작 날짜 (YYYY-MM-DD)')
+    parser.add_argument('--end', required=True, help='종료 날짜 (YYYY-MM-DD)')
+    parser.add_argument('--hs', type=float, help='센서의 높이(QFE height), 생략 시 settings.json 값')
+    parser.add_argument('--hr', type=float, help='측정 지역의 높이(QNH height), 생략 시 settings.json 값')
+    parser.add_argument('--temperature-source', type=parse_temperature_source,
+                        help="'humidity_sensor', 'barometer_sensor' 또는 온도값, 생략 시 settings.json 값")
+    parser.add_argument('--station', default=DEFAULT_STATION, help='관측소 이름 (생략 시 기본 관측소)')
+    parser.add_argument('--base-dir', default=DEFAULT_BASE_DIR, help='데이터 저장 경로 (관측소 폴더의 상위)')
+    parser.add_argument('--settings', default=DEFAULT_SETTINGS_FILE, help='settings.json 경로')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='프로세스 수')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s [%(levelname)s] %(message)s')
+
+    try:
+        hs, hr, temperature_source, station = load_settings(args.settings, args.station)
+    except ValueError as e:
+        print(e)
+        return
+    if args.hs is not None:
+        hs = args.hs
+    if args.hr is not None:
+        hr = args.hr
+    if args.temperature_source is not None:
+        temperature_source = args.temperature_source
+
+    start_date = datetime.strptime(args.start, '%Y-%m-%d').date()
+    end_date = datetime.strptime(args.end, '%Y-%m-%d').date()
+    paths = day_files(station.data_dir(args.base_dir), start_date, end_date)
+    if not paths:
+        print("재계산할 파일이 없습니다.")
+        return
+
+    print(f"관측소={station.name}, HS={hs}, HR={hr}, 온도값={temperature_source}, "
+          f"파일 {len(paths)}개, 프로세스 {args.workers}개")
+    started = time.perf_counter()
+    total_rows = 0
+    total_updated = 0
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(recompute_day, path, hs, hr, temperature_source): path for path in paths}
+        for done, future in enumerate(as_completed(futures), start=1):
+            path = futures[future]
+            try:
+                _, rows, updated, elapsed = future.result()
+            except Exception as e:
+                failed += 1
+                logging.error(f"재계산 중 오류 발생: {path}, {e}")
+                continue
+            total_rows += rows
+            total_updated += updated
+            print(f"[{done}/{len(paths)}] {os.path.basename(path)}: {updated}/{rows}행 갱신 ({elapsed:.2f} s)")
+
+    elapsed = time.perf_counter() - started
+    print(f"완료: 파일 {len(paths) - failed}개, 계산값 {total_updated}행 갱신, "
+          f"{elapsed:.2f} s ({total_rows / elapsed:,.0f} 행/s)")
+    if failed:
+        print(f"실패: {failed}개 (로그 확인)")
+
+
+if __name__ == '__main__':
+    main()
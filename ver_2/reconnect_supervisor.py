@@ -0,0 +1,123 @@
+# reconnect_supervisor.py
+#
+# 끊긴 시리얼 포트의 재연결을 전담하는 스레드.
+#
+# 수신 스레드는 포트가 끊기면 request()로 재연결을 요청하고 바로 대기 상태로 돌아갑니다.
+# 재연결 시도는 이 스레드가 포트별로 따로 예약하며, 실패할 때마다 대기 시간을
+# base_delay * 2^(실패 횟수 - 1) (최대 max_delay)로 늘리고 jitter 비율만큼 무작위로 줄입니다.
+# 그래서 한 센서가 계속 죽어 있어도 다른 센서의 수신이나 재연결은 기다리지 않습니다.
+#
+# 지표 (metrics.py)
+#   reconnect_attempts[센서]  재연결 시도 횟수
+#   reconnects[센서]          재연결 성공 횟수
+#   reconnect_failures[센서]  재연결 실패 횟수
+#   recover_ms[센서]          끊긴 시점부터 재연결 성공까지 걸린 시간
+#   port_down_s[센서]         현재 끊겨 있는 시간 (연결되어 있으면 0)
+
+import time
+import random
+import logging
+import threading
+
+import metrics
+
+
+def backoff_delay(failures, base_delay=1.0, max_delay=60.0, jitter=0.5):
+    """연속 failures번 실패한 뒤의 대기 시간 (초): base_delay * 2^(failures - 1), 최대 max_delay, jitter 비율만큼 무작위 감소"""
+    delay = min(max_delay, base_delay * 2 ** (failures - 1))
+    return delay * (1.0 - jitter * random.random())
+
+
+class ReconnectSupervisor(threading.Thread):
+    def __init__(self, reopen, base_delay=1.0, max_delay=60.0, jitter=0.5, station=None):
+        """reopen(sensor_name): 포트를 다시 열고 성공하면 True (예외도 실패로 처리)"""
+        super().__init__(name='ReconnectSupervisor', daemon=True)
+        self.reopen = reopen
+        self.station = station  # 지표 라벨용
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._due = {}  # 센서 -> 다음 시도 시각 (monotonic)
+        self._failures = {}  # 센서 -> 연속 실패 횟수
+        self._down_since = {}  # 센서 -> 끊긴 시각 (monotonic)
+
+    def request(self, sensor_name):
+        """재연결을 예약 (바로 반환). 이미 예약되어 있으면 False."""
+        with self._cond:
+            if sensor_name in self._due:
+                return False
+            now = time.monotonic()
+            self._due[sensor_name] = now
+            self._failures[sensor_name] = 0
+            if sensor_name not in self._down_since:
+                self._down_since[sensor_name] = now
+                metrics.gauge('port_down_s', metrics.station_label(self.station, sensor_name),
+                              lambda: self.down_time(sensor_name))
+            self._cond.notify()
+        return True
+
+    def is_pending(self, sensor_name):
+        with self._cond:
+            return sensor_name in self._due
+
+    def down_time(self, sensor_name):
+        """끊긴 뒤 지난 시간 (초), 연결되어 있으면 0"""
+        since = self._down_since.get(sensor_name)
+        return time.monotonic() - since if since is not None else 0.0
+
+    def next_delay(self, failures):
+        """연속 failures번 실패한 뒤의 대기 시간 (초)"""
+        return backoff_delay(failures, self.base_delay, self.max_delay, self.jitter)
+
+    def run(self):
+        logging.info("ReconnectSupervisor 스레드가 시작되었습니다.")
+        while True:
+            with self._cond:
+                if self._stopped:
+                    break
+                if not self._due:
+                    self._cond.wait()
+                    continue
+                sensor_name, due = min(self._due.items(), key=lambda item: item[1])
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+
+            self._attempt(sensor_name)
+        logging.info("ReconnectSupervisor 스레드가 종료되었습니다.")
+
+    def _attempt(self, sensor_name):
+        label = metrics.station_label(self.station, sensor_name)
+        metrics.counter('reconnect_attempts', label).inc()
+        try:
+            ok = self.reopen(sensor_name)
+        except Exception as e:
+            logging.error(f"{sensor_name} 재연결 중 오류 발생: {e}")
+            ok = False
+
+        with self._cond:
+            if ok:
+                self._due.pop(sensor_name, None)
+                self._failures.pop(sensor_name, None)
+                since = self._down_since.pop(sensor_name, None)
+                metrics.counter('reconnects', label).inc()
+                if since is not None:
+                    recover_ms = (time.monotonic() - since) * 1000.0
+                    metrics.histogram('recover_ms', label).observe(recover_ms)
+                    logging.info(f"{sensor_name} 재연결 완료 ({recover_ms / 1000.0:.1f}초 만에 복구)")
+                return
+
+            failures = self._failures.get(sensor_name, 0) + 1
+            self._failures[sensor_name] = failures
+            delay = self.next_delay(failures)
+            self._due[sensor_name] = time.monotonic() + delay
+        metrics.counter('reconnect_failures', label).inc()
+        logging.warning(f"{sensor_name} 재연결 실패 {failures}회, {delay:.1f}초 후 다시 시도합니다.")
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
@@ -0,0 +1,58 @@
+# ring_buffer.py
+#
+# 고정 크기 시계열 링 버퍼 (실시간 추이 그래프용).
+#
+# 배열을 용량의 두 배 길이로 한 번만 잡아 두고, 값을 i와 i + capacity 두 곳에 씁니다.
+# 그러면 최근 n개(n <= capacity)는 항상 한 구간에 연속으로 놓이므로 복사나 재할당 없이
+# NumPy view로 꺼내 그래프(setData)에 바로 넘길 수 있습니다.
+# 메모리와 추가 비용은 실행 시간과 무관하게 일정합니다.
+
+import numpy as np
+
+
+class RingBuffer:
+    def __init__(self, capacity, fields, dtype=np.float32):
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self._columns = {name: i for i, name in enumerate(self.fields)}
+        self._time = np.full(2 * capacity, np.nan, dtype=np.float64)  # epoch 초
+        self._data = np.full((len(self.fields), 2 * capacity), np.nan, dtype=dtype)
+        self._next = 0  # 다음에 쓸 위치 (0 <= _next < capacity)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, timestamp, values):
+        """values: fields 순서의 값 (None은 NaN으로 저장되어 그래프에서 끊김으로 표시)"""
+        i = self._next
+        j = i + self.capacity
+        self._time[i] = self._time[j] = timestamp
+        for row, value in enumerate(values):
+            if value is None:
+                value = np.nan
+            self._data[row, i] = self._data[row, j] = value
+        self._next = i + 1 if i + 1 < self.capacity else 0
+        if self._count < self.capacity:
+            self._count += 1
+
+    def _window(self, last):
+        count = self._count if last is None else min(last, self._count)
+        end = self._next + self.capacity
+        return end - count, end
+
+    def times(self, last=None):
+        """최근 last개(기본: 전부)의 시각, 오래된 것부터 (view)"""
+        start, end = self._window(last)
+        return self._time[start:end]
+
+    def values(self, field, last=None):
+        """최근 last개의 field 값 (view)"""
+        start, end = self._window(last)
+        return self._data[self._columns[field], start:end]
+
+    def clear(self):
+        self._time.fill(np.nan)
+        self._data.fill(np.nan)
+        self._next = 0
+        self._count = 0
@@ -0,0 +1,234 @@
+# rollup.py
+#
+# 1분 / 10분 / 1시간 단위 min/mean/max 집계(rollup)
+#
+#   C:\Sitech\data\2024-10\2024-10-23.1m.csv
+#   C:\Sitech\data\2024-10\2024-10-23.10m.csv
+#   C:\Sitech\data\2024-10\2024-10-23.1h.csv
+#
+# DataStorage.save_data가 행을 받을 때마다 RollupSet을 갱신하고, 구간(bucket)이
+# 끝나면 한 줄씩 추가합니다. 구간 키는 타임스탬프 문자열의 앞부분이므로
+# ('2024-10-23 12:34' -> 1분) 날짜 파싱이 필요 없습니다.
+#
+# 계산값 행에도 기압/온도가 함께 기록되므로, 같은 측정값을 두 번 세지 않도록 각 필드는
+# FIELD_SOURCES의 센서 행에서만 집계합니다.
+# 지난 날짜의 집계 파일이 없거나 CSV의 첫 행보다 늦게 시작하면(집계 기능이 도중에 켜진 날 등)
+# 조회 시 CSV로 다시 만듭니다. (needs_rebuild)
+
+import os
+import csv
+import logging
+
+import pandas as pd
+
+from columnar_archive import VALUE_FIELDS
+
+# 단계 이름: (구간 키 길이, 구간 시작 시각을 만들 접미사, 구간 길이(초))
+TIERS = {
+    '1m': (16, ':00', 60),
+    '10m': (15, '0:00', 600),
+    '1h': (13, ':00:00', 3600),
+}
+
+STATS = ('min', 'mean', 'max', 'count')
+HEADER = ['timestamp'] + [f'{field}_{stat}' for field in VALUE_FIELDS for stat in STATS]
+
+# 그래프에 필요한 최소 점 개수 (이보다 적어지면 더 촘촘한 단계를 사용)
+MIN_PLOT_POINTS = 300
+
+# 필드별로 집계에 사용하는 센서
+FIELD_SOURCES = {
+    'pressure': '기압계',
+    'temperature_barometer': '기압계',
+    'temperature_humidity': '습도계',
+    'humidity': '습도계',
+    'QNH': '계산값',
+    'QFE': '계산값',
+    'QFF': '계산값',
+}
+# 센서 -> VALUE_FIELDS 순서의 집계 여부
+SENSOR_FIELDS = {
+    sensor: [FIELD_SOURCES[field] == sensor for field in VALUE_FIELDS]
+    for sensor in set(FIELD_SOURCES.values())
+}
+
+
+def rollup_path(csv_path, tier):
+    """일별 CSV에 대응하는 집계 파일 경로"""
+    return os.path.splitext(csv_path)[0] + f'.{tier}.csv'
+
+
+def choose_tier(span_seconds, min_points=MIN_PLOT_POINTS):
+    """조회 기간에 대해 점 개수가 충분한 가장 성긴 단계를 고릅니다. 없으면 None (원본 사용)"""
+    for tier in ('1h', '10m', '1m'):
+        if span_seconds / TIERS[tier][2] >= min_points:
+            return tier
+    return None
+
+
+class RollupSet:
+    """세 단계의 진행 중인 구간 누적값을 유지하고, 끝난 구간의 행을 돌려줍니다."""
+
+    def __init__(self):
+        self.keys = {tier: None for tier in TIERS}
+        # 단계별 필드 누적값: [count, sum, min, max]
+        self.accumulators = {tier: self._empty() for tier in TIERS}
+
+    @staticmethod
+    def _empty():
+        return [[0, 0.0, None, None] for _ in VALUE_FIELDS]
+
+    def add(self, timestamp, values, sensor=None):
+        """
+        timestamp: 'YYYY-MM-DD HH:MM:SS[.fff]' 문자열, values: VALUE_FIELDS 순서의 값 목록
+        sensor: 행의 센서 이름 (FIELD_SOURCES에서 이 센서가 맡은 필드만 집계, 알 수 없으면 모든 필드)
+        반환값: 이번 행으로 끝난 구간들의 [(단계, 집계 행), ...]
+        """
+        completed = []
+        if not timestamp or len(timestamp) < 16:
+            return completed
+
+        numbers = []
+        used = SENSOR_FIELDS.get(str(sensor)) if sensor is not None else None
+        for i, value in enumerate(values):
+            if value is None or value == '' or (used is not None and not used[i]):
+                numbers.append(None)
+                continue
+            try:
+                numbers.append(float(value))
+            except (TypeError, ValueError):
+                numbers.append(None)
+
+        for tier, (key_length, _, _) in TIERS.items():
+            key = timestamp[:key_length]
+            if key != self.keys[tier]:
+                if self.keys[tier] is not None:
+                    row = self._row(tier)
+                    if row is not None:
+                        completed.append((tier, row))
+                self.keys[tier] = key
+                self.accumulators[tier] = self._empty()
+
+            for acc, number in zip(self.accumulators[tier], numbers):
+                if number is None:
+                    continue
+                acc[0] += 1
+                acc[1] += number
+                if acc[2] is None or number < acc[2]:
+                    acc[2] = number
+                if acc[3] is None or number > acc[3]:
+                    acc[3] = number
+        return completed
+
+    def _row(self, tier):
+        """단계의 현재 구간을 집계 행으로 변환 (값이 하나도 없으면 None)"""
+        accumulators = self.accumulators[tier]
+        if not any(acc[0] for acc in accumulators):
+            return None
+        row = [self.keys[tier] + TIERS[tier][1]]
+        for count, total, minimum, maximum in accumulators:
+            if count:
+                row += [minimum, round(total / count, 3), maximum, count]
+            else:
+                row += ['', '', '', 0]
+        return row
+
+    def partial_rows(self):
+        """진행 중인 구간들의 [(단계, 집계 행), ...] (종료 시 기록 및 조회용)"""
+        rows = []
+        for tier in TIERS:
+            if self.keys[tier] is None:
+                continue
+            row = self._row(tier)
+            if row is not None:
+                rows.append((tier, row))
+        return rows
+
+
+def append_rows(csv_path, tier, rows):
+    """집계 행을 해당 날짜의 집계 파일에 추가 (구간이 끝날 때만 호출되므로 빈도가 낮음)"""
+    path = rollup_path(csv_path, tier)
+    new_file = not os.path.exists(path)
+    with open(path, mode='a', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(HEADER)
+        writer.writerows(rows)
+
+
+def _first_timestamp(path):
+    """CSV(헤더 다음 첫 행)의 timestamp 문자열. 파일이 없거나 비었으면 None"""
+    try:
+        with open(path, mode='r', newline='', encoding='utf-8') as f:
+            f.readline()
+            line = f.readline()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return line.partition(',')[0] or None
+
+
+def needs_rebuild(csv_path, tier):
+    """집계 파일이 없거나 일별 CSV의 첫 행이 속한 구간보다 늦게 시작하면 True"""
+    first_row = _first_timestamp(csv_path)
+    if first_row is None or len(first_row) < 16:
+        return False
+    path = rollup_path(csv_path, tier)
+    if not os.path.exists(path):
+        return True
+    first_bucket = _first_timestamp(path)
+    if first_bucket is None:
+        return False  # 값이 있는 행이 없는 날
+    key_length, suffix, _ = TIERS[tier]
+    return first_bucket > first_row[:key_length] + suffix
+
+
+def build_rollups(csv_path):
+    """기존 일별 CSV로 세 단계의 집계 파일을 다시 만듭니다. (집계 파일이 없는 지난 날짜용)"""
+    rollups = RollupSet()
+    rows = {tier: [] for tier in TIERS}
+    with open(csv_path, mode='r', newline='', encoding='utf-8') as csvfile:
+        reader = csv.DictReader(csvfile)
+        for row in reader:
+            values = [row.get(field) for field in VALUE_FIELDS]
+            for tier, rollup_row in rollups.add(row.get('timestamp'), values, row.get('sensor')):
+                rows[tier].append(rollup_row)
+    for tier, rollup_row in rollups.partial_rows():
+        rows[tier].append(rollup_row)
+
+    for tier, tier_rows in rows.items():
+        path = rollup_path(csv_path, tier)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, mode='w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(HEADER)
+            writer.writerows(tier_rows)
+        os.replace(tmp_path, path)
+    logging.info(f"집계 파일을 생성했습니다: {csv_path}")
+
+
+def merge_duplicates(df):
+    """
+    같은 구간이 여러 번 기록된 경우(프로그램 재시작 등) count 가중으로 합칩니다.
+    """
+    if not df['timestamp'].duplicated().any():
+        return df
+
+    fields = [column[:-len('_mean')] for column in df.columns if column.endswith('_mean')]
+    work = df.copy()
+    aggregations = {}
+    for field in fields:
+        counts = work[f'{field}_count'].fillna(0)
+        work[f'{field}_count'] = counts
+        work[f'{field}_mean'] = work[f'{field}_mean'] * counts  # 가중 합
+        aggregations.update({
+            f'{field}_min': 'min',
+            f'{field}_mean': 'sum',
+            f'{field}_max': 'max',
+            f'{field}_count': 'sum',
+        })
+
+    merged = work.groupby('timestamp', sort=True).agg(aggregations).reset_index()
+    for field in fields:
+        counts = merged[f'{field}_count']
+        merged[f'{field}_mean'] = merged[f'{field}_mean'] / counts.where(counts > 0)
+    return merged[df.columns]
@@ -0,0 +1,101 @@
+# sample.py
+#
+# 센서 측정값 한 건을 나타내는 고정 스키마 레코드.
+# 수신 스레드 -> 큐 -> GUI / 저장 스레드까지 같은 객체를 그대로 전달합니다.
+# (포트 상태 메시지는 기존처럼 {'sensor': ..., 'status': ...} dict)
+
+from enum import Enum
+
+
+class Sensor(str, Enum):
+    """센서 종류. 값이 기존 한글 이름 문자열이므로 dict 키, CSV 기록, 비교에 그대로 사용할 수 있습니다."""
+    BAROMETER = '기압계'
+    HYGROMETER = '습도계'
+    CALCULATED = '계산값'
+
+    def __str__(self):
+        return self.value
+
+
+class Sample:
+    """
+    측정값 레코드 (__slots__로 인스턴스별 __dict__ 없이 저장)
+      timestamp: epoch 초 (float), monotonic: time.monotonic() 값 (순서 비교용)
+      값이 없는 필드는 None
+    """
+
+    __slots__ = (
+        'sensor',
+        'timestamp',
+        'monotonic',
+        'pressure',
+        'temperature_barometer',
+        'temperature_humidity',
+        'humidity',
+        'temperature',  # 계산에 사용된 온도값 (계산값만)
+        'QNH',
+        'QFE',
+        'QFF',
+    )
+
+    def __init__(self, sensor, timestamp, monotonic=None, pressure=None,
+                 temperature_barometer=None, temperature_humidity=None, humidity=None,
+                 temperature=None, QNH=None, QFE=None, QFF=None):
+        self.sensor = sensor
+        self.timestamp = timestamp
+        self.monotonic = monotonic
+        self.pressure = pressure
+        self.temperature_barometer = temperature_barometer
+        self.temperature_humidity = temperature_humidity
+        self.humidity = humidity
+        self.temperature = temperature
+        self.QNH = QNH
+        self.QFE = QFE
+        self.QFF = QFF
+
+    def to_row(self):
+        """data_storage.FIELDS 순서의 값 목록 (None은 csv.writer가 빈 칸으로 기록)"""
+        return [
+            self.timestamp,
+            self.sensor,
+            self.pressure,
+            self.temperature_barometer,
+            self.temperature_humidity,
+            self.humidity,
+            self.QNH,
+            self.QFE,
+            self.QFF,
+        ]
+
+    def to_dict(self):
+        """None이 아닌 필드만 담은 dict (spill 파일 등 JSON 기록용)"""
+        data = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        if 'sensor' in data:
+            data['sensor'] = str(self.sensor)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict() 결과 또는 이전 형식의 dict로부터 생성 (알 수 없는 키는 무시)"""
+        values = {name: data[name] for name in cls.__slots__ if name in data}
+        sensor = values.pop('sensor', None)
+        try:
+            sensor = Sensor(sensor)
+        except ValueError:
+            pass
+        timestamp = values.pop('timestamp', None)
+        return cls(sensor, timestamp, **values)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sample):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__
+                           if getattr(self, name) is not None)
+        return f'Sample({fields})'
@@ -1,10 +1,28 @@
 
 # serial_port_manager.py
 
+import os
 import logging
 import serial
 import serial.tools.list_ports
 
+# 이 환경 변수가 '1'이면 simulator.py(가상 센서)의 포트도 목록에 추가 (부하 시험용)
+SIMULATOR_ENV = 'SITECH_SIMULATOR'
+
+
+def simulator_ports():
+    """가상 센서 포트 목록. SITECH_SIMULATOR=1로 켠 경우에만 simulator를 불러옴"""
+    if os.environ.get(SIMULATOR_ENV) != '1':
+        return []
+    import simulator
+    return simulator.list_links()
+
+
+def available_ports():
+    """COM 포트 목록 (+ 켜져 있으면 가상 센서 포트)"""
+    return [port.device for port in serial.tools.list_ports.comports()] + simulator_ports()
+
+
 class SerialPortManager:
     def __init__(self):
         self.available_ports = []
@@ -13,8 +31,7 @@ class SerialPortManager:
 
 
     def scan_ports(self):
-        ports = serial.tools.list_ports.comports()
-        self.available_ports = [port.device for port in ports]
+        self.available_ports = available_ports()
         logging.debug(f"사용 가능한 포트: {self.available_ports}")
 
     def open_ports(self, port_settings):
@@ -0,0 +1,314 @@
+# simulator.py
+#
+# 가상 시리얼 센서 (Linux/POSIX 전용, 부하 시험용)
+#
+# 센서마다 의사 터미널(pty) 쌍을 만들고, 슬레이브 쪽 장치를 고정된 이름의 심볼릭 링크로
+# 노출합니다. 프로그램(DataReceiver)은 실제 COM 포트 대신 이 링크를 열면 됩니다.
+#
+#   python simulator.py --barometers 1 --hygrometers 1 --rate 10
+#   python simulator.py --barometers 4 --hygrometers 4 --rate 100 --garbage 0.01 \
+#                       --burst-every 30 --burst-size 200 --disconnect-every 60
+#
+#   /tmp/sitech-sim/barometer0  -> /dev/pts/3   ("1013.25 21.3\r\n")
+#   /tmp/sitech-sim/hygrometer0 -> /dev/pts/4   ("RH= 45.2 %RH T= 21.1 'C\r\n")
+#
+# 설정 창의 포트 목록에는 SITECH_SIMULATOR=1로 프로그램을 실행한 경우에만 이 링크가 나타납니다.
+#
+# 장애 주입
+#   --garbage P          : 줄마다 확률 P로 형식이 깨진 줄을 보냄
+#   --burst-every S      : S초마다 --burst-size 줄을 한꺼번에 보냄
+#   --disconnect-every S : S초마다 pty를 닫았다가 --disconnect-for 초 뒤 새 pty로 다시 연결
+#                          (링크는 새 장치를 가리키도록 갱신되므로 같은 경로로 재연결 가능)
+
+import os
+import json
+import time
+import random
+import logging
+import argparse
+import threading
+
+DEFAULT_LINK_DIR = '/tmp/sitech-sim'
+
+KINDS = ('barometer', 'hygrometer')
+
+
+def list_links(link_dir=DEFAULT_LINK_DIR):
+    """실행 중인 시뮬레이터가 만든 포트 링크 목록 (포트 선택 목록에 추가용)"""
+    try:
+        names = sorted(os.listdir(link_dir))
+    except OSError:
+        return []
+    links = []
+    for name in names:
+        path = os.path.join(link_dir, name)
+        if os.path.islink(path) and os.path.exists(path):
+            links.append(path)
+    return links
+
+
+class VirtualSensor(threading.Thread):
+    """pty 하나에 현장 형식의 측정값 줄을 rate Hz로 기록하는 가상 센서"""
+
+    # 읽는 쪽이 느릴 때 보관할 최대 바이트 (넘으면 새 줄을 버림)
+    MAX_PENDING = 64 * 1024
+
+    def __init__(self, kind, index=0, rate=1.0, link_dir=DEFAULT_LINK_DIR, garbage=0.0,
+                 burst_every=0.0, burst_size=0, disconnect_every=0.0, disconnect_for=2.0, seed=None):
+        super().__init__(name=f'VirtualSensor-{kind}{index}', daemon=True)
+        if kind not in KINDS:
+            raise ValueError(f"알 수 없는 센서 종류: {kind}")
+        self.kind = kind
+        self.rate = rate
+        self.link_path = os.path.join(link_dir, f'{kind}{index}')
+        self.garbage = garbage
+        self.burst_every = burst_every
+        self.burst_size = burst_size
+        self.disconnect_every = disconnect_every
+        self.disconnect_for = disconnect_for
+        self._random = random.Random(None if seed is None else f'{seed}-{kind}{index}')
+        self._stop_event = threading.Event()
+        self._master = None
+        self._slave = None
+        self._pending = b''  # pty 버퍼가 가득 차 아직 못 보낸 바이트
+
+        # 측정값은 현실적인 범위에서 천천히 변하도록 random walk
+        self.pressure = self._random.uniform(1000.0, 1025.0)
+        self.temperature = self._random.uniform(15.0, 25.0)
+        self.humidity = self._random.uniform(30.0, 70.0)
+
+        # 카운터
+        self.lines_sent = 0
+        self.garbage_sent = 0
+        self.bursts = 0
+        self.disconnects = 0
+        self.lines_dropped = 0
+
+        os.makedirs(link_dir, exist_ok=True)
+        self._open_pty()
+
+    # ------------------------------------------------------------------
+    # pty 관리
+    # ------------------------------------------------------------------
+    def _open_pty(self):
+        import tty  # POSIX 전용
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)  # 에코 및 줄바꿈 변환 없이 그대로 전달
+        os.set_blocking(self._master, False)
+        tmp_link = self.link_path + '.tmp'
+        if os.path.lexists(tmp_link):
+            os.remove(tmp_link)
+        os.symlink(os.ttyname(self._slave), tmp_link)
+        os.replace(tmp_link, self.link_path)
+
+    def _close_pty(self):
+        for fd in (self._master, self._slave):
+            if fd is None:
+                continue
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._master = None
+        self._slave = None
+
+    @property
+    def port(self):
+        return self.link_path
+
+    # ------------------------------------------------------------------
+    # 측정값 줄
+    # ------------------------------------------------------------------
+    def _next_line(self):
+        rng = self._random
+        if self.garbage and rng.random() < self.garbage:
+            self.garbage_sent += 1
+            return rng.choice((
+                b'\x00\xff\xfe garbage\r\n',
+                b'ERR\r\n',
+                b'1013.2\r\n',
+                b'RH= --- %RH T= --- \'C\r\n',
+                bytes(rng.randrange(32, 127) for _ in range(rng.randrange(1, 40))) + b'\r\n',
+            ))
+
+        self.temperature = min(40.0, max(-20.0, self.temperature + rng.gauss(0, 0.02)))
+        if self.kind == 'barometer':
+            self.pressure = min(1060.0, max(950.0, self.pressure + rng.gauss(0, 0.01)))
+            return f"{self.pressure:.2f} {self.temperature:.1f}\r\n".encode('ascii')
+        self.humidity = min(100.0, max(0.0, self.humidity + rng.gauss(0, 0.05)))
+        return f"RH= {self.humidity:.1f} %RH T= {self.temperature:.1f} 'C\r\n".encode('ascii')
+
+    def _write(self, data):
+        """보낼 바이트를 쌓고 가능한 만큼 기록. 보관 한도를 넘으면 버리고 False."""
+        if len(self._pending) >= self.MAX_PENDING:
+            return False
+        self._pending += data
+        self._flush()
+        return True
+
+    def _flush(self):
+        if self._pending:
+            try:
+                written = os.write(self._master, self._pending)
+            except BlockingIOError:
+                written = 0
+            except OSError:
+                # 읽는 쪽이 없는 상태 등
+                written = 0
+            self._pending = self._pending[written:]
+        # 프로그램이 보낸 명령어(기압계 'R' 등)는 읽어서 버림
+        try:
+            os.read(self._master, 1024)
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # 스레드 본체
+    # ------------------------------------------------------------------
+    def run(self):
+        interval = 1.0 / self.rate if self.rate > 0 else 1.0
+        start = time.monotonic()
+        next_line = start
+        next_burst = start + self.burst_every if self.burst_every > 0 else None
+        next_disconnect = start + self.disconnect_every if self.disconnect_every > 0 else None
+
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+
+            if next_disconnect is not None and now >= next_disconnect:
+                self.disconnects += 1
+                logging.info(f"{self.link_path}: 연결 해제 ({self.disconnect_for} s)")
+                self._close_pty()
+                self._pending = b''
+                if self._stop_event.wait(self.disconnect_for):
+                    break
+                self._open_pty()
+                next_disconnect = time.monotonic() + self.disconnect_every
+                next_line = time.monotonic()
+                continue
+
+            if next_burst is not None and now >= next_burst:
+                self.bursts += 1
+                for _ in range(self.burst_size):
+                    if self._write(self._next_line()):
+                        self.lines_sent += 1
+                    else:
+                        self.lines_dropped += 1
+                next_burst += self.burst_every
+
+            if now >= next_line:
+                if self._write(self._next_line()):
+                    self.lines_sent += 1
+                else:
+                    self.lines_dropped += 1
+                next_line += interval
+                # 많이 밀렸으면 (중단 후 등) 따라잡지 않고 현재 시각 기준으로
+                if now - next_line > 1.0:
+                    next_line = now + interval
+                continue
+
+            if self._pending:
+                self._flush()
+                self._stop_event.wait(min(next_line - now, 0.005))
+            else:
+                self._stop_event.wait(min(next_line - now, 0.1))
+
+        self._wait_drained()
+        self._close_pty()
+
+    def _wait_drained(self, timeout=1.0):
+        """종료 전에 읽는 쪽이 pty에 남은 줄을 가져갈 시간을 줌 (최대 timeout초)"""
+        import fcntl
+        import struct
+        import termios
+        deadline = time.monotonic() + timeout
+        while self._slave is not None and time.monotonic() < deadline:
+            self._flush()
+            try:
+                waiting = struct.unpack('i', fcntl.ioctl(self._slave, termios.FIONREAD, b'\0\0\0\0'))[0]
+            except OSError:
+                return
+            if not waiting and not self._pending:
+                return
+            time.sleep(0.01)
+
+    def stop(self):
+        self._stop_event.set()
+        try:
+            os.remove(self.link_path)
+        except OSError:
+            pass
+
+    def get_stats(self):
+        return {
+            'port': self.link_path,
+            'lines_sent': self.lines_sent,
+            'lines_dropped': self.lines_dropped,
+            'garbage_sent': self.garbage_sent,
+            'bursts': self.bursts,
+            'disconnects': self.disconnects,
+        }
+
+
+def start_sensors(barometers=1, hygrometers=1, start=True, **options):
+    """
+    가상 센서들을 만들고 [VirtualSensor, ...]를 반환
+    start=False이면 포트(링크)만 만들어 두고, 호출한 쪽에서 나중에 start() 합니다.
+    """
+    sensors = []
+    for kind, count in (('barometer', barometers), ('hygrometer', hygrometers)):
+        for index in range(count):
+            sensor = VirtualSensor(kind, index, **options)
+            if start:
+                sensor.start()
+            sensors.append(sensor)
+    return sensors
+
+
+def port_settings(port, baudrate=9600):
+    """DataReceiver / PortSettingsGUI 형식의 포트 설정"""
+    return {'port': port, 'baudrate': baudrate, 'parity': 'None', 'data_bits': 8, 'stop_bits': 1}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가상 시리얼 센서 (pty)')
+    parser.add_argument('--barometers', type=int, default=1)
+    parser.add_argument('--hygrometers', type=int, default=1)
+    parser.add_argument('--rate', type=float, default=1.0, help='센서당 초당 줄 수 (Hz)')
+    parser.add_argument('--link-dir', default=DEFAULT_LINK_DIR)
+    parser.add_argument('--garbage', type=float, default=0.0, help='깨진 줄을 보낼 확률')
+    parser.add_argument('--burst-every', type=float, default=0.0, help='버스트 간격 (초)')
+    parser.add_argument('--burst-size', type=int, default=100, help='버스트 한 번의 줄 수')
+    parser.add_argument('--disconnect-every', type=float, default=0.0, help='연결 해제 간격 (초)')
+    parser.add_argument('--disconnect-for', type=float, default=2.0, help='연결 해제 유지 시간 (초)')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+    sensors = start_sensors(
+        args.barometers, args.hygrometers,
+        rate=args.rate, link_dir=args.link_dir, garbage=args.garbage,
+        burst_every=args.burst_every, burst_size=args.burst_size,
+        disconnect_every=args.disconnect_every, disconnect_for=args.disconnect_for,
+        seed=args.seed
+    )
+    for sensor in sensors:
+        print(f"{sensor.kind:<10} {sensor.port}")
+    print(json.dumps({sensor.port: port_settings(sensor.port) for sensor in sensors}, indent=2))
+
+    try:
+        while True:
+            time.sleep(10)
+            for sensor in sensors:
+                print(sensor.get_stats())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for sensor in sensors:
+            sensor.stop()
+        for sensor in sensors:
+            sensor.join(timeout=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+# station.py
+#
+# 관측소(기압계 + 습도계 한 쌍) 설정과 실행 단위.
+#
+# settings.json
+#   {
+#     "stations": [
+#       {"name": "기본", "port_settings": {"기압계": {...}, "습도계": {...}},
+#        "hs_value": 35.5, "hr_value": 12.3, "temperature_source": "humidity_sensor"},
+#       {"name": "2번", ...}
+#     ],
+#     "port_settings": ..., "hs_value": ..., ...   <- 첫 관측소 값 (이전 버전 호환)
+#   }
+#
+# 'stations'가 없는 이전 설정 파일은 최상위 값으로 관측소 하나(DEFAULT_STATION)를 만듭니다.
+#
+# 저장 위치
+#   기본 관측소: base_dir (이전 버전과 같은 위치)
+#   그 외     : base_dir\stations\<이름>
+# 관측소마다 DataStorage / AsyncDataWriter / DataReceiver / 데이터 큐를 따로 두므로
+# 한 관측소의 저장 지연이나 포트 문제가 다른 관측소에 영향을 주지 않습니다.
+
+import os
+import logging
+from queue import Queue
+
+from async_data_writer import AsyncDataWriter
+from async_receiver import ENGINES
+from data_storage import DataStorage
+
+DEFAULT_STATION = '기본'
+STATIONS_DIR = 'stations'
+INVALID_NAME_CHARS = '\\/:*?"<>|'
+
+
+def is_valid_name(name):
+    """폴더 이름으로 쓸 수 있는 관측소 이름인지"""
+    name = name.strip()
+    return bool(name) and name not in ('.', '..') and not any(c in INVALID_NAME_CHARS for c in name)
+
+
+class Station:
+    """관측소 하나의 설정 (포트, 높이, 온도값 선택)과 실행 중인 수신/저장 객체"""
+
+    def __init__(self, name, port_settings, hs_value=1.0, hr_value=1.0, temperature_source='humidity_sensor'):
+        self.name = name
+        self.port_settings = port_settings
+        self.hs_value = hs_value
+        self.hr_value = hr_value
+        self.temperature_source = temperature_source
+
+        # start() 이후 사용
+        self.data_queue = None
+        self.storage = None
+        self.writer = None
+        self.receiver = None
+
+    @property
+    def is_default(self):
+        return self.name == DEFAULT_STATION
+
+    def data_dir(self, base_dir):
+        if self.is_default:
+            return base_dir
+        return os.path.join(base_dir, STATIONS_DIR, self.name)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'port_settings': self.port_settings,
+            'hs_value': self.hs_value,
+            'hr_value': self.hr_value,
+            'temperature_source': self.temperature_source,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data.get('name', DEFAULT_STATION),
+            data.get('port_settings', {}),
+            data.get('hs_value', 1.0),
+            data.get('hr_value', 1.0),
+            data.get('temperature_source', 'humidity_sensor'),
+        )
+
+    def start(self, base_dir, capture_path=None, maxsize=10000, policy='drop_oldest', engine='thread',
+              on_data=None):
+        """
+        저장소, 기록 스레드, 수신 스레드를 만들고 시작.
+        engine: 'thread' (포트마다 수신 스레드) 또는 'asyncio' (이벤트 루프 하나, on_data로 새 데이터 알림)
+        """
+        station = None if self.is_default else self.name  # 지표 라벨용
+        self.data_queue = Queue()
+        self.storage = DataStorage(base_dir=self.data_dir(base_dir), station=station)
+        self.writer = AsyncDataWriter(self.storage, maxsize=maxsize, policy=policy, station=station)
+        self.writer.start()
+        options = {'on_data': on_data} if engine == 'asyncio' else {}
+        self.receiver = ENGINES[engine](self.data_queue, self.port_settings, self.writer, self.hs_value,
+                                        self.hr_value, self.temperature_source, capture_path=capture_path,
+                                        station=station, **options)
+        self.receiver.start()
+        logging.info(f"관측소 '{self.name}' 수신을 시작했습니다 ({engine}): {self.storage.base_dir}")
+
+    def stop(self):
+        """수신 → 기록 → 저장소 순서로 종료"""
+        if self.receiver is not None:
+            self.receiver.stop()
+            self.receiver.join()
+        if self.writer is not None:
+            self.writer.stop()
+            self.writer.join()
+        if self.storage is not None:
+            self.storage.close()
+
+
+def load_stations(settings):
+    """settings.json 내용(dict) -> Station 목록"""
+    stations = [Station.from_dict(item) for item in settings.get('stations', [])]
+    if not stations and settings.get('port_settings'):
+        stations.append(Station(
+            DEFAULT_STATION,
+            settings['port_settings'],
+            settings.get('hs_value', 1.0),
+            settings.get('hr_value', 1.0),
+            settings.get('temperature_source', 'humidity_sensor'),
+        ))
+    return stations
+
+
+def station_settings(stations):
+    """Station 목록 -> settings.json에 넣을 값 (첫 관측소 값은 최상위에도 기록)"""
+    settings = {'stations': [station.to_dict() for station in stations]}
+    if stations:
+        first = stations[0].to_dict()
+        del first['name']
+        settings.update(first)
+    return settings
@@ -0,0 +1,38 @@
+# conftest.py
+#
+# ver_2의 모듈은 패키지가 아닌 평평한 모듈이므로 (import data_storage 등) ver_2를 경로에 추가합니다.
+
+import os
+import sys
+from datetime import date, datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_storage import DataStorage  # noqa: E402
+from sample import Sample, Sensor  # noqa: E402
+
+
+def epoch(*args):
+    """로컬 시각 -> epoch 초"""
+    return datetime(*args).timestamp()
+
+
+def barometer(timestamp, pressure=1013.0, temperature=20.0):
+    return Sample(Sensor.BAROMETER, timestamp, 0.0, pressure=pressure, temperature_barometer=temperature)
+
+
+def calculated(timestamp, pressure=1013.0, qnh=1020.0):
+    return Sample(Sensor.CALCULATED, timestamp, 0.0, pressure=pressure, temperature_barometer=20.0,
+                  temperature=20.0, QNH=qnh, QFE=1012.0, QFF=1019.0)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """빈 폴더의 DataStorage. 시험 데이터(과거 날짜)가 늦게 온 행으로 처리되지 않도록 기준 날짜를 과거로 둠"""
+    ds = DataStorage(str(tmp_path), flush_rows=50, flush_interval=3600.0)
+    ds.current_date = date(2000, 1, 1)
+    ds._start_convert = lambda day: None  # 마감된 날짜 변환(백그라운드 스레드)은 각 시험에서 직접 호출
+    yield ds
+    ds.close()
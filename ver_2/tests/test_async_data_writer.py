@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from async_data_writer import AsyncDataWriter
+from conftest import barometer
+
+
+class RecordingStorage:
+    """save_data로 받은 timestamp를 순서대로 기록. gate가 닫혀 있으면 기록 중 대기 (느린 디스크 흉내)"""
+
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self.flush_interval = 0.05
+        self.saved = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+
+    def save_data(self, data):
+        self.entered.set()
+        self.gate.wait(5)
+        self.saved.append(data.timestamp)
+
+    def flush(self):
+        pass
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return RecordingStorage(str(tmp_path))
+
+
+def run_to_end(writer):
+    writer.stop()
+    writer.join(10)
+    assert not writer.is_alive()
+
+
+def test_unknown_policy_is_rejected(storage):
+    with pytest.raises(ValueError):
+        AsyncDataWriter(storage, policy='wait')
+
+
+def test_drop_oldest_keeps_newest(storage):
+    writer = AsyncDataWriter(storage, maxsize=3, policy='drop_oldest')
+    for i in range(5):
+        writer.save_data(barometer(float(i)))
+    assert [writer.queue.get_nowait().timestamp for _ in range(3)] == [2.0, 3.0, 4.0]
+    assert writer.get_stats()['dropped'] == 2
+
+
+def test_block_writes_everything_in_order(storage):
+    writer = AsyncDataWriter(storage, maxsize=2, policy='block')
+    writer.start()
+    for i in range(200):
+        writer.save_data(barometer(float(i)))
+    run_to_end(writer)
+    assert storage.saved == [float(i) for i in range(200)]
+
+
+def test_spill_never_touches_disk_on_the_producer(storage):
+    writer = AsyncDataWriter(storage, maxsize=2, policy='spill')
+    storage.gate.clear()  # 기록 스레드가 첫 항목에서 멈춘 상태
+    writer.start()
+    writer.save_data(barometer(0.0))
+    assert storage.entered.wait(5)
+
+    start = time.perf_counter()
+    for i in range(1, 500):
+        writer.save_data(barometer(float(i)))
+    elapsed = time.perf_counter() - start
+    # 기록 스레드가 멈춰 있는 동안 spill 파일은 만들어지지 않고 수신 쪽은 기다리지 않음
+    assert not os.path.exists(writer.spill_path)
+    assert elapsed < 1.0
+
+    storage.gate.set()
+    run_to_end(writer)
+    assert storage.saved == [float(i) for i in range(500)]
+    assert writer.get_stats()['spilled'] == 497
+    assert not os.path.exists(writer.spill_path)
+
+
+def test_spill_drains_in_chunks_under_sustained_load(storage, monkeypatch):
+    monkeypatch.setattr(AsyncDataWriter, 'SPILL_CHUNK', 7)
+    writer = AsyncDataWriter(storage, maxsize=4, policy='spill')
+    writer.start()
+    for i in range(3000):
+        writer.save_data(barometer(float(i)))
+        if i % 100 == 0:
+            time.sleep(0.001)
+    run_to_end(writer)
+    assert storage.saved == [float(i) for i in range(3000)]
+    assert not os.path.exists(writer.spill_path)
+
+
+def test_leftover_spill_file_is_saved_first(storage):
+    spill_path = os.path.join(storage.base_dir, 'spill.jsonl')
+    with open(spill_path, mode='w', encoding='utf-8') as f:
+        for i in range(3):
+            f.write(json.dumps(barometer(float(i)).to_dict(), ensure_ascii=False) + '\n')
+    writer = AsyncDataWriter(storage, maxsize=10, policy='spill', spill_path=spill_path)
+    writer.save_data(barometer(3.0))
+    writer.start()
+    run_to_end(writer)
+    assert storage.saved == [0.0, 1.0, 2.0, 3.0]
+    assert not os.path.exists(writer.spill_path)
@@ -0,0 +1,135 @@
+import os
+from datetime import date, datetime
+from unittest import mock
+
+import columnar_archive
+import time_index
+from conftest import barometer, calculated, epoch
+
+
+def day_files(storage, day):
+    return sorted(os.listdir(os.path.join(storage.base_dir, day.strftime('%Y-%m'))))
+
+
+def test_rows_are_filed_by_their_own_date(storage):
+    for second in range(60):
+        storage.save_data(barometer(epoch(2026, 1, 1, 23, 59, second)))
+    storage.save_data(barometer(epoch(2026, 1, 2, 0, 0, 1)))
+    # 파일 교체 뒤에 도착한 자정 직전 행 (다른 수신 스레드, 밀린 큐, 재생)
+    storage.save_data(barometer(epoch(2026, 1, 1, 23, 59, 59) + 0.9))
+    storage.flush()
+
+    assert storage.current_date == date(2026, 1, 2)
+    assert '2026-01-01.csv' in day_files(storage, date(2026, 1, 1))
+    rows = storage.load_data(datetime(2026, 1, 1, 23, 0), datetime(2026, 1, 1, 23, 59, 59, 999000))
+    assert len(rows) == 61
+    rows = storage.load_data(datetime(2026, 1, 2, 0, 0), datetime(2026, 1, 2, 0, 59))
+    assert [row['timestamp'] for row in rows] == ['2026-01-02 00:00:01.000']
+
+
+def test_backlog_written_after_midnight_keeps_yesterday(storage):
+    storage.save_data(barometer(epoch(2026, 1, 2, 0, 0, 0)))
+    # 자정 전 값이 저장 큐에 밀려 있다가 교체 뒤에 한꺼번에 기록되는 경우
+    for second in range(0, 600, 2):
+        storage.save_data(barometer(epoch(2026, 1, 1, 23, 50) + second))
+    storage.flush()
+
+    rows = storage.load_data(datetime(2026, 1, 1, 23, 0), datetime(2026, 1, 1, 23, 59, 59, 999000))
+    assert len(rows) == 300
+    assert all(row['timestamp'].startswith('2026-01-01') for row in rows)
+    assert len(storage.load_data(datetime(2026, 1, 2, 0, 0), datetime(2026, 1, 2, 1, 0))) == 1
+
+
+def test_range_load_spans_days_in_order(storage):
+    start = epoch(2026, 1, 1, 22, 0)
+    for i in range(0, 4 * 3600, 10):
+        storage.save_data(barometer(start + i, pressure=1000.0 + i / 3600))
+
+    rows = storage.load_data(datetime(2026, 1, 1, 23, 30), datetime(2026, 1, 2, 0, 30))
+    timestamps = [row['timestamp'] for row in rows]
+    assert len(rows) == 361
+    assert timestamps == sorted(timestamps)
+    assert timestamps[0] == '2026-01-01 23:30:00.000'
+    assert timestamps[-1] == '2026-01-02 00:30:00.000'
+
+    rows = storage.search_data('기압계', datetime(2026, 1, 2, 1, 0), datetime(2026, 1, 2, 1, 0, 59))
+    assert len(rows) == 6
+
+
+def fill_day(storage, day, step=7):
+    start = epoch(day.year, day.month, day.day)
+    for i in range(0, 86400, step):
+        storage.save_data(barometer(start + i + 0.25, pressure=1000.0 + (i % 1000) / 100))
+        storage.save_data(calculated(start + i + 0.5, qnh=1010.0 + (i % 997) / 10))
+    storage.flush()
+
+
+def test_closed_days_are_read_from_the_archive(storage):
+    fill_day(storage, date(2026, 1, 1))
+    storage.save_data(barometer(epoch(2026, 1, 2, 0, 0, 1)))  # 2026-01-01 마감
+    start, end = datetime(2026, 1, 1, 6, 0), datetime(2026, 1, 1, 7, 30)
+    from_csv = storage.search_data('계산값', start, end)
+
+    storage.convert_day(date(2026, 1, 1))
+    csv_path = storage._day_csv_path(date(2026, 1, 1))
+    assert columnar_archive.is_current(csv_path)
+    with mock.patch.object(time_index, 'read_range', side_effect=AssertionError('CSV를 읽음')):
+        from_archive = storage.search_data('계산값', start, end)
+        assert len(storage.load_data(start, end)) == 2 * len(from_csv)
+    assert from_archive == from_csv
+
+
+def test_stale_archive_falls_back_to_csv(storage):
+    fill_day(storage, date(2026, 1, 1), step=60)
+    storage.save_data(barometer(epoch(2026, 1, 2, 0, 0, 1)))
+    storage.convert_day(date(2026, 1, 1))
+    csv_path = storage._day_csv_path(date(2026, 1, 1))
+
+    # 보관본을 만든 뒤 늦게 도착한 행: 다시 변환할 때까지 CSV를 읽어야 함
+    archived = os.path.getmtime(columnar_archive.archive_dir(csv_path))
+    storage.save_data(barometer(epoch(2026, 1, 1, 23, 59, 59) + 0.5, pressure=999.0))
+    storage.flush()
+    os.utime(csv_path, (archived + 1, archived + 1))
+    assert not columnar_archive.is_current(csv_path)
+    rows = storage.load_data(datetime(2026, 1, 1, 23, 59), datetime(2026, 1, 1, 23, 59, 59, 999000))
+    assert rows[-1]['pressure'] == '999.0'
+    assert storage.load_columns(date(2026, 1, 1), ['pressure']) is None
+
+
+def test_midnight_race_keeps_the_new_day_searchable(storage):
+    # 자정 교체 직후 다른 수신 스레드의 23:59:59.9 값이 도착한 뒤에도 새 날짜를 구간 조회할 수 있어야 함
+    start = epoch(2026, 1, 2, 0, 0, 0)
+    storage.save_data(barometer(start + 0.1))
+    storage.save_data(barometer(epoch(2026, 1, 1, 23, 59, 59) + 0.9))
+    for second in range(1, 70 * 60):
+        storage.save_data(barometer(start + second))
+    storage.flush()
+
+    rows = storage.load_data(datetime(2026, 1, 2, 1, 2), datetime(2026, 1, 2, 1, 5))
+    assert len(rows) == 181
+    csv_path = storage._day_csv_path(date(2026, 1, 2))
+    assert [minute for minute, _ in time_index.load_index(csv_path)] == list(range(70))
+
+
+def test_backward_clock_step_in_storage(storage):
+    start = epoch(2026, 1, 2, 1, 0)
+    for second in range(0, 3000, 5):
+        storage.save_data(barometer(start + second))
+    for second in range(600, 900, 5):  # 시계가 01:50 -> 01:10으로 돌아감
+        storage.save_data(barometer(start + second + 0.5))
+    storage.flush()
+
+    rows = storage.load_data(datetime(2026, 1, 2, 1, 12), datetime(2026, 1, 2, 1, 13, 59, 999000))
+    assert len(rows) == 48
+
+
+def test_range_read_of_the_open_day_includes_buffered_rows(storage):
+    # GUI의 당일 조회는 버퍼에 남은 행까지 잠금 안에서 기록한 뒤 읽어야 함 (잘린 마지막 행 없음)
+    start = epoch(2026, 1, 2, 3, 0)
+    for second in range(10):  # flush_rows(50)보다 적어 버퍼에만 남음
+        storage.save_data(barometer(start + second))
+
+    content = storage.read_csv_range(date(2026, 1, 2), datetime(2026, 1, 2, 3, 0), datetime(2026, 1, 2, 3, 1))
+    lines = content.decode('utf-8').splitlines()
+    assert len(lines) == 11
+    assert lines[-1].startswith('2026-01-02 03:00:09')
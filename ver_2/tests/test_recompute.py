@@ -0,0 +1,55 @@
+import json
+import os
+import sys
+from datetime import date
+
+import pytest
+
+import recompute
+from conftest import calculated, epoch
+from data_storage import DataStorage
+from station import Station, station_settings
+
+
+@pytest.fixture
+def settings_file(tmp_path):
+    stations = [
+        Station('기본', {}, hs_value=10.0, hr_value=20.0, temperature_source='barometer_sensor'),
+        Station('2번', {}, hs_value=30.0, hr_value=40.0, temperature_source=15.0),
+    ]
+    path = tmp_path / 'settings.json'
+    path.write_text(json.dumps(station_settings(stations), ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+def test_load_settings_per_station(settings_file):
+    hs, hr, source, station = recompute.load_settings(settings_file)
+    assert (hs, hr, source, station.name) == (10.0, 20.0, 'barometer_sensor', '기본')
+    hs, hr, source, station = recompute.load_settings(settings_file, '2번')
+    assert (hs, hr, source) == (30.0, 40.0, 15.0)
+    assert station.data_dir('D') == os.path.join('D', 'stations', '2번')
+    with pytest.raises(ValueError):
+        recompute.load_settings(settings_file, '3번')
+
+
+def test_main_recomputes_only_the_chosen_station(settings_file, tmp_path, monkeypatch, capsys):
+    base_dir = tmp_path / 'data'
+    for data_dir in (base_dir, base_dir / 'stations' / '2번'):
+        storage = DataStorage(str(data_dir))
+        storage.current_date = date(2000, 1, 1)
+        storage.save_data(calculated(epoch(2026, 1, 1, 12, 0), pressure=1000.0, qnh=0.0))
+        storage.close()
+
+    monkeypatch.setattr(sys, 'argv', ['recompute.py', '--start', '2026-01-01', '--end', '2026-01-01',
+                                      '--station', '2번', '--base-dir', str(base_dir),
+                                      '--settings', settings_file, '--workers', '1'])
+    recompute.main()
+    assert '관측소=2번, HS=30.0, HR=40.0' in capsys.readouterr().out
+
+    def qnh(data_dir):
+        path = os.path.join(str(data_dir), '2026-01', '2026-01-01.csv')
+        with open(path, encoding='utf-8') as f:
+            return f.read().splitlines()[1].split(',')[6]
+
+    assert qnh(base_dir) == '0.0'
+    assert qnh(base_dir / 'stations' / '2번') != '0.0'
@@ -0,0 +1,115 @@
+import csv
+import os
+from datetime import date, datetime
+
+import pandas as pd
+
+import rollup
+from conftest import barometer, calculated, epoch
+from data_storage import FIELDS
+from sample import Sensor
+
+
+def values(**kwargs):
+    return [kwargs.get(field) for field in rollup.VALUE_FIELDS]
+
+
+def test_each_field_comes_from_one_sensor():
+    rollups = rollup.RollupSet()
+    rollups.add('2026-01-01 00:00:01.000', values(pressure=1000.0, temperature_barometer=20.0), '기압계')
+    rollups.add('2026-01-01 00:00:02.000', values(temperature_humidity=19.0, humidity=50.0), '습도계')
+    # 계산값 행에 함께 기록된 기압/온도는 집계하지 않음
+    rollups.add('2026-01-01 00:00:02.500', values(pressure=1000.0, temperature_barometer=20.0,
+                                                  temperature_humidity=19.0, QNH=1010.0), Sensor.CALCULATED)
+    completed = rollups.add('2026-01-01 00:01:00.000', values(pressure=1002.0), '기압계')
+
+    row = dict(zip(rollup.HEADER, dict(completed)['1m']))
+    assert row['timestamp'] == '2026-01-01 00:00:00'
+    assert row['pressure_count'] == 1
+    assert row['temperature_barometer_count'] == 1
+    assert row['temperature_humidity_count'] == 1
+    assert row['QNH_count'] == 1
+    assert (row['QNH_min'], row['QNH_mean'], row['QNH_max']) == (1010.0, 1010.0, 1010.0)
+
+
+def test_min_mean_max_per_bucket():
+    rollups = rollup.RollupSet()
+    for second, pressure in enumerate([1000.0, 1004.0, 1002.0]):
+        rollups.add(f'2026-01-01 10:00:{second:02d}.000', values(pressure=pressure), '기압계')
+    (tier, row), = [item for item in rollups.partial_rows() if item[0] == '1h']
+    row = dict(zip(rollup.HEADER, row))
+    assert row['timestamp'] == '2026-01-01 10:00:00'
+    assert (row['pressure_min'], row['pressure_mean'], row['pressure_max'], row['pressure_count']) == \
+        (1000.0, 1002.0, 1004.0, 3)
+
+
+def test_choose_tier():
+    assert rollup.choose_tier(3600) is None
+    assert rollup.choose_tier(86400) == '1m'
+    assert rollup.choose_tier(7 * 86400) == '10m'
+    assert rollup.choose_tier(30 * 86400) == '1h'
+
+
+def test_merge_duplicates_weights_by_count():
+    df = pd.DataFrame({
+        'timestamp': ['2026-01-01 00:00:00', '2026-01-01 00:00:00'],
+        'pressure_min': [1000.0, 998.0],
+        'pressure_mean': [1001.0, 1004.0],
+        'pressure_max': [1002.0, 1006.0],
+        'pressure_count': [3, 1],
+    })
+    merged = rollup.merge_duplicates(df)
+    assert len(merged) == 1
+    assert merged.iloc[0]['pressure_mean'] == (1001.0 * 3 + 1004.0) / 4
+    assert (merged.iloc[0]['pressure_min'], merged.iloc[0]['pressure_max']) == (998.0, 1006.0)
+
+
+def write_raw_csv(storage, day, rows):
+    """집계 없이 CSV만 있는 상태 (집계 기능이 켜지기 전에 기록된 행)"""
+    path = storage._day_csv_path(day)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, mode='w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        writer.writerows(rows)
+    return path
+
+
+def test_needs_rebuild_when_rollup_starts_late(storage, tmp_path):
+    path = write_raw_csv(storage, date(2026, 1, 1), [
+        ['2026-01-01 00:00:05.000', '기압계', 1000.0, 20.0, '', '', '', '', ''],
+        ['2026-01-01 12:00:05.000', '기압계', 1001.0, 20.0, '', '', '', '', ''],
+    ])
+    assert rollup.needs_rebuild(path, '1h')
+    rollup.append_rows(path, '1h', [['2026-01-01 12:00:00'] + [''] * (len(rollup.HEADER) - 1)])
+    assert rollup.needs_rebuild(path, '1h')
+    rollup.build_rollups(path)
+    assert not rollup.needs_rebuild(path, '1h')
+
+
+def test_upgrade_day_is_rolled_up_from_the_start(storage):
+    # 오전은 집계 없이 기록되고, 오후부터 새 버전이 집계를 함께 기록한 날
+    morning = [[f'2026-01-01 {hour:02d}:30:00.000', '기압계', 1000.0 + hour, 20.0, '', '', '', '', '']
+               for hour in range(12)]
+    write_raw_csv(storage, date(2026, 1, 1), morning)
+    for hour in range(12, 24):
+        storage.save_data(barometer(epoch(2026, 1, 1, hour, 30), pressure=1000.0 + hour))
+        storage.save_data(calculated(epoch(2026, 1, 1, hour, 30, 1), pressure=1000.0 + hour))
+    storage.save_data(barometer(epoch(2026, 1, 2, 0, 0, 1)))
+
+    df = storage.load_rollup('1h', ['pressure'], datetime(2026, 1, 1), datetime(2026, 1, 1, 23, 59))
+    assert len(df) == 24
+    assert df['pressure_mean'].tolist() == [1000.0 + hour for hour in range(24)]
+    assert df['pressure_count'].tolist() == [1] * 24
+
+
+def test_rollup_of_the_current_day_is_not_double_counted(storage):
+    for minute in range(90):
+        storage.save_data(barometer(epoch(2026, 1, 2) + minute * 60 + 10, pressure=1000.0))
+    # 첫 시간 집계 파일이 아직 없어 조회 시 다시 만들어진 뒤에도 같은 행을 두 번 세지 않아야 함
+    first = storage.load_rollup('1h', ['pressure'], datetime(2026, 1, 2), datetime(2026, 1, 2, 2, 0))
+    for minute in range(90, 120):
+        storage.save_data(barometer(epoch(2026, 1, 2) + minute * 60 + 10, pressure=1000.0))
+    second = storage.load_rollup('1h', ['pressure'], datetime(2026, 1, 2), datetime(2026, 1, 2, 2, 0))
+    assert first['pressure_count'].tolist() == [60, 30]
+    assert second['pressure_count'].tolist() == [60, 60]
@@ -0,0 +1,84 @@
+import csv
+import io
+import os
+
+import time_index
+from data_storage import FIELDS
+
+
+def write_csv(tmp_path, day, timestamps):
+    """timestamps 순서대로 행을 기록한 일별 CSV (행 값은 초 단위 위치)"""
+    path = os.path.join(str(tmp_path), f'{day}.csv')
+    with open(path, mode='w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for i, timestamp in enumerate(timestamps):
+            writer.writerow([timestamp, '기압계', 1000 + i, 20.0, '', '', '', '', ''])
+    return path
+
+
+def minute_rows(day, hour, minute, count=6):
+    return [f'{day} {hour:02d}:{minute:02d}:{second:02d}.000' for second in range(0, 60, 60 // count)]
+
+
+def timestamps_in(content):
+    return [row['timestamp'] for row in csv.DictReader(io.StringIO(content.decode('utf-8')))]
+
+
+def test_read_range_returns_only_nearby_rows(tmp_path):
+    day = '2026-01-02'
+    rows = [ts for minute in range(120) for ts in minute_rows(day, minute // 60, minute % 60)]
+    path = write_csv(tmp_path, day, rows)
+
+    found = timestamps_in(time_index.read_range(path, 62, 65))
+    assert found == [ts for ts in rows if '01:02' <= ts[11:16] <= '01:05']
+    assert timestamps_in(time_index.read_range(path, 200, 300)) == []
+    assert len(timestamps_in(time_index.read_range(path))) == len(rows)
+
+
+def test_late_row_from_previous_day_does_not_stop_the_index(tmp_path):
+    # 자정 교체 직후 다른 수신 스레드의 23:59:59.9 행이 새 날짜 파일에 섞인 경우
+    day = '2026-01-02'
+    rows = minute_rows(day, 0, 0) + ['2026-01-01 23:59:59.900']
+    rows += [ts for minute in range(1, 70) for ts in minute_rows(day, minute // 60, minute % 60, count=60)]
+    path = write_csv(tmp_path, day, rows)
+
+    entries = time_index.build_index(path)
+    assert [minute for minute, _ in entries] == list(range(70))
+    found = timestamps_in(time_index.read_range(path, 62, 65))
+    assert [ts for ts in found if '01:02' <= ts[11:16] <= '01:05'] == \
+        [ts for ts in rows if ts.startswith(day) and '01:02' <= ts[11:16] <= '01:05']
+    assert len([ts for ts in found if '01:02' <= ts[11:16] <= '01:05']) == 240
+
+
+def test_backward_clock_step_keeps_every_run(tmp_path):
+    day = '2026-01-02'
+    first = [ts for minute in range(60, 120) for ts in minute_rows(day, 1, minute - 60)]
+    # 시계가 1시 50분에서 1시 10분으로 조정되어 같은 분이 다시 기록됨
+    second = [ts.replace('.000', '.500') for minute in range(70, 80) for ts in minute_rows(day, 1, minute - 60)]
+    path = write_csv(tmp_path, day, first + second)
+
+    found = timestamps_in(time_index.read_range(path, 72, 74))
+    wanted = [ts for ts in first + second if '01:12' <= ts[11:16] <= '01:14']
+    assert sorted(ts for ts in found if '01:12' <= ts[11:16] <= '01:14') == sorted(wanted)
+
+
+def test_index_of_previous_format_is_rebuilt(tmp_path):
+    day = '2026-01-02'
+    rows = minute_rows(day, 0, 0) + minute_rows(day, 0, 5) + minute_rows(day, 0, 1)
+    path = write_csv(tmp_path, day, rows)
+    with open(time_index.index_path(path), mode='w', encoding='ascii') as f:
+        f.write('0,91\n5,400\n')  # 헤더 없는 이전 형식 (분이 늘어날 때만 기록)
+
+    assert time_index.load_index(path) is None
+    found = timestamps_in(time_index.read_range(path, 1, 1))
+    assert [ts for ts in found if ts[11:16] == '00:01'] == minute_rows(day, 0, 1)
+    assert time_index.load_index(path) is not None
+
+
+def test_byte_span_covers_widest_runs():
+    entries = [(0, 10), (1, 20), (0, 30), (2, 40), (1, 50)]
+    assert time_index.byte_span(entries, 1, 1) == (20, None)
+    assert time_index.byte_span(entries, 0, 0) == (10, 40)
+    assert time_index.byte_span(entries, 2, 2) == (40, 50)
+    assert time_index.byte_span(entries, 3, 9) is None
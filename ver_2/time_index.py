@@ -0,0 +1,176 @@
+# time_index.py
+#
+# 일별 CSV 옆에 두는 시간 색인 파일 (YYYY-MM-DD.idx)
+#
+#   첫 줄: INDEX_HEADER (형식 버전, 없거나 다르면 CSV로 다시 만듦)
+#   각 줄: "<자정 이후 분>,<그 분의 행이 이어지기 시작하는 바이트 위치>\n"
+#
+# 바로 앞 행과 분(minute)이 달라질 때마다 한 줄을 추가하므로, 줄은 파일 위치 순서이고
+# 각 줄은 다음 줄의 위치까지 같은 분의 행이 이어지는 구간(run)을 나타냅니다.
+# 두 수신 스레드가 번갈아 기록하거나 시스템 시계가 뒤로 조정되면 같은 분의 구간이 여러 번 나올 수
+# 있으므로, 조회 시 조회 구간에 속하는 모든 구간을 덮는 가장 넓은 바이트 범위를 읽고,
+# 호출한 쪽에서 행마다 정확한 시각으로 한 번 더 거릅니다.
+# 파일 날짜와 다른 날짜의 행(이전 형식의 파일 등)은 분이 바뀐 것으로 보지 않습니다.
+
+import os
+import logging
+
+INDEX_HEADER = 'v2\n'
+
+
+def index_path(csv_path):
+    """CSV 파일에 대응하는 색인 파일 경로"""
+    return os.path.splitext(csv_path)[0] + '.idx'
+
+
+def minute_of_day(timestamp):
+    """'YYYY-MM-DD HH:MM:SS...' 문자열에서 자정 이후 분을 구합니다. (strptime 없이)"""
+    return int(timestamp[11:13]) * 60 + int(timestamp[14:16])
+
+
+def row_minute(timestamp, day):
+    """day('YYYY-MM-DD') 날짜 행의 자정 이후 분. 다른 날짜이거나 형식이 다르면 None"""
+    if not isinstance(timestamp, str) or not timestamp.startswith(day):
+        return None
+    try:
+        return minute_of_day(timestamp)
+    except ValueError:
+        return None
+
+
+def file_day(csv_path):
+    """일별 CSV 경로의 날짜 부분 ('YYYY-MM-DD')"""
+    return os.path.basename(csv_path)[:10]
+
+
+def index_lines(timestamps, offsets, day, last_minute):
+    """
+    행들의 (timestamp, 시작 위치)에서 분이 바뀌는 곳마다 색인 줄을 만듦
+    last_minute: 바로 앞 행의 분 (파일의 첫 행이거나 알 수 없으면 -1)
+    반환값: (색인 줄 목록, 마지막 행의 분)
+    """
+    lines = []
+    for timestamp, offset in zip(timestamps, offsets):
+        minute = row_minute(timestamp, day)
+        if minute is not None and minute != last_minute:
+            lines.append(f"{minute},{offset}\n")
+            last_minute = minute
+    return lines, last_minute
+
+
+def open_for_append(csv_path):
+    """색인 파일을 추가 모드로 열기 (새 파일이면 형식 헤더부터 기록)"""
+    f = open(index_path(csv_path), mode='a', encoding='ascii')
+    if f.tell() == 0:
+        f.write(INDEX_HEADER)
+    return f
+
+
+def load_index(csv_path):
+    """색인 파일을 읽어 (분, 바이트 위치) 목록(파일 위치 순)을 반환. 파일이 없거나 이전 형식이면 None."""
+    path = index_path(csv_path)
+    try:
+        with open(path, mode='r', encoding='ascii') as f:
+            lines = f.readlines()
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+    if not lines or lines[0] != INDEX_HEADER:
+        return None
+
+    entries = []
+    for line in lines[1:]:
+        minute, _, offset = line.partition(',')
+        try:
+            entries.append((int(minute), int(offset)))
+        except ValueError:
+            # 기록 도중 잘린 마지막 줄 등은 무시
+            continue
+    return entries
+
+
+def scan_csv(csv_path):
+    """CSV 전체를 한 번 훑어 색인 항목과 헤더 끝 위치를 구합니다. (색인이 없는 기존 파일용)"""
+    day = file_day(csv_path)
+    entries = []
+    last_minute = -1
+    with open(csv_path, mode='rb') as f:
+        header_end = len(f.readline())
+        offset = header_end
+        for line in f:
+            minute = row_minute(line[:16].decode('utf-8', 'replace'), day)
+            if minute is not None and minute != last_minute:
+                entries.append((minute, offset))
+                last_minute = minute
+            offset += len(line)
+    return entries, header_end
+
+
+def build_index(csv_path):
+    """기존 CSV로 색인 파일을 만들어 저장하고 항목 목록을 반환"""
+    entries, _ = scan_csv(csv_path)
+    path = index_path(csv_path)
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, mode='w', encoding='ascii') as f:
+            f.write(INDEX_HEADER)
+            f.writelines(f"{minute},{offset}\n" for minute, offset in entries)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.error(f"색인 파일을 저장하는 중 오류 발생: {path}, {e}")
+    return entries
+
+
+def byte_span(entries, start_minute, end_minute):
+    """
+    [start_minute, end_minute]에 속하는 모든 구간(run)을 덮는 (시작, 끝) 바이트 위치
+    끝이 None이면 파일 끝까지, 해당 구간이 없으면 None. 경계가 None이면 그쪽은 제한 없음
+    """
+    start = end = None
+    found = False
+    for i, (minute, offset) in enumerate(entries):
+        if start_minute is not None and minute < start_minute:
+            continue
+        if end_minute is not None and minute > end_minute:
+            continue
+        run_end = entries[i + 1][1] if i + 1 < len(entries) else None
+        if not found:
+            start, end, found = offset, run_end, True
+            continue
+        start = min(start, offset)
+        if end is not None:
+            end = None if run_end is None else max(end, run_end)
+    return (start, end) if found else None
+
+
+def read_range(csv_path, start_minute=None, end_minute=None):
+    """
+    색인을 이용해 [start_minute, end_minute] 구간에 해당하는 행만 읽습니다.
+    반환값: 헤더 줄 + 해당 구간 행들의 bytes (파일이 없으면 None)
+    구간 사이의 다른 분 행이 포함될 수 있으므로 호출한 쪽에서 행의 시각으로 다시 걸러야 합니다.
+    """
+    if not os.path.exists(csv_path):
+        return None
+
+    entries = load_index(csv_path)
+    if entries is None:
+        entries = build_index(csv_path)
+
+    with open(csv_path, mode='rb') as f:
+        header = f.readline()
+        start, end = len(header), None
+        if start_minute is not None or end_minute is not None:
+            span = byte_span(entries, start_minute, end_minute)
+            if span is None:
+                return header  # 구간에 해당하는 행 없음
+            if start_minute is not None:
+                start = span[0]
+            if end_minute is not None:
+                end = span[1]
+
+        f.seek(start)
+        body = f.read() if end is None else f.read(max(0, end - start))
+
+    # 기록 중인 파일이면 마지막 줄이 잘려 있을 수 있음
+    if not body.endswith(b'\n'):
+        body = body[:body.rfind(b'\n') + 1]
+    return header + body